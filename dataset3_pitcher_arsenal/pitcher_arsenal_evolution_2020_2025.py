@@ -27,6 +27,10 @@
 # Install required packages
 # !pip install -q pybaseball duckdb  # uncomment in Colab/notebook
 
+import functools
+import pathlib
+import sys
+
 import pandas as pd
 import numpy as np
 from datetime import date
@@ -35,32 +39,62 @@ import duckdb
 import warnings
 warnings.filterwarnings('ignore')
 
+# Shared helpers live in statcast_tools/ at the repository root
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1] if '__file__' in globals() else pathlib.Path.cwd().parent
+sys.path.insert(0, str(REPO_ROOT))
+from statcast_tools.fetch import season_windows, fetch_windows, iter_partitions
+from statcast_tools.scheduler import TokenBucket
+from statcast_tools.schema import apply_schema, concat_compact, memory_mb
+
 print(f"Data collection date: {date.today()}")
 
 # ============================================================
 # ## Step 1: Data Collection (2020-2025)
 # 
-# **Note**: This process may take 30-60 minutes
+# **Note**: This process may take 30-60 minutes sequentially; with FETCH_WORKERS
+# parallel windows it scales down roughly with the worker count (up to the rate limit)
 # ============================================================
 
-# Fetch data for each season
+# Fetch data for each season in week windows on a thread pool sharing one
+# rate limiter; finished windows are saved under PARTITION_DIR/<season>/ so a
+# rerun resumes where it stopped
 seasons = [2020, 2021, 2022, 2023, 2024, 2025]
+PARTITION_DIR = pathlib.Path('partitions')
+FETCH_WORKERS = 4
+REQUESTS_PER_SEC = 1.0
+limiter = TokenBucket(rate=REQUESTS_PER_SEC, capacity=FETCH_WORKERS)
+fetch_fn = functools.partial(statcast, verbose=False, parallel=False)
 all_data = []
 
 for season in seasons:
     print(f"\nFetching {season} season data...")
     start_date = f"{season}-03-01"
-    end_date = f"{season}-11-30" if season < 2025 else date.today().strftime("%Y-%m-%d")
-    
-    df = statcast(start_dt=start_date, end_dt=end_date)
+    # Fixed season end, capped at today; while the season is running the last
+    # window is provisional and is replaced by the longer one on the next run
+    end_date = min(date.fromisoformat(f"{season}-11-30"), date.today()).isoformat()
+
+    fetched_mb = {'raw': 0.0, 'compact': 0.0}
+
+    def compact(df):
+        fetched_mb['raw'] += memory_mb(df)
+        df = apply_schema(df)
+        fetched_mb['compact'] += memory_mb(df)
+        return df
+
+    fetch_windows(season_windows(start_date, end_date, freq='week'), PARTITION_DIR / str(season),
+                  fetch_fn=fetch_fn, transform=compact, workers=FETCH_WORKERS,
+                  limiter=limiter, verbose=False)
+    df = concat_compact(list(iter_partitions(PARTITION_DIR / str(season))))
     df['season'] = season
     all_data.append(df)
-    print(f"  {season}: {len(df):,} pitches")
+    print(f"  {season}: {len(df):,} pitches ({memory_mb(df):,.0f} MB compact; "
+          f"{fetched_mb['raw']:,.0f} MB raw fetched this run)")
 
-# Concatenate all seasons
-df_all = pd.concat(all_data, ignore_index=True)
+# Concatenate all seasons (keeps the compact dtypes)
+df_all = concat_compact(all_data)
 print(f"\nTotal pitches: {len(df_all):,}")
 print(f"Columns: {len(df_all.columns)}")
+print(f"Memory usage: {memory_mb(df_all):,.0f} MB")
 
 # ============================================================
 # ## Step 2: Aggregate with DuckDB
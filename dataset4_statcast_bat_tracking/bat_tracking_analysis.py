@@ -1,43 +1,82 @@
 # Auto-extracted from bat_tracking_analysis.ipynb
 
 # %% Cell 1
+import os
+import pathlib
+import subprocess
+import sys
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+# Setup: the loading / aggregation helpers live in statcast_tools/ in the
+# kaggle-datasets repository, which the Kaggle dataset does not include.
+# - STATCAST_TOOLS_ROOT set: use that checkout
+# - run as a script from a checkout: use the repository this file is in
+# - otherwise (Kaggle notebook, internet enabled): shallow-clone the
+#   repository into /kaggle/working once and use it
+TOOLS_REPO = 'https://github.com/yasumorishima/kaggle-datasets.git'
+if os.environ.get('STATCAST_TOOLS_ROOT'):
+    TOOLS_ROOT = pathlib.Path(os.environ['STATCAST_TOOLS_ROOT']).expanduser()
+elif '__file__' in globals():
+    TOOLS_ROOT = pathlib.Path(__file__).resolve().parents[1]
+else:
+    TOOLS_ROOT = pathlib.Path('/kaggle/working/kaggle-datasets')
+    if not (TOOLS_ROOT / 'statcast_tools').is_dir():
+        subprocess.run(['git', 'clone', '--depth', '1', TOOLS_REPO, str(TOOLS_ROOT)], check=True)
+if not (TOOLS_ROOT / 'statcast_tools').is_dir():
+    raise ModuleNotFoundError(f'statcast_tools/ not found under {TOOLS_ROOT}; '
+                              f'set STATCAST_TOOLS_ROOT to a checkout of {TOOLS_REPO}')
+sys.path.insert(0, str(TOOLS_ROOT))
+from statcast_tools.binning import Binned2D, edges_for
+from statcast_tools.cube import build_cube, load_cube, rollup
+from statcast_tools.loader import column_coverage, load_statcast
+from statcast_tools.moments import CoMoments
+from statcast_tools.schema import memory_mb
+
 # Set style
 sns.set_style('whitegrid')
 plt.rcParams['figure.figsize'] = (12, 6)
 
 # %% Cell 2
-# Load dataset from Kaggle
-df = pd.read_csv('/kaggle/input/mlb-statcast-bat-tracking-2024-2025/statcast_bat_tracking_2024_2025.csv')
+# Load dataset from Kaggle (partitioned Parquet copy when available, otherwise the CSV)
+DATA_DIR = '/kaggle/input/mlb-statcast-bat-tracking-2024-2025'
+parquet_dir = f'{DATA_DIR}/statcast_bat_tracking_2024_2025_parquet'
+DATA_PATH = parquet_dir if os.path.isdir(parquet_dir) else f'{DATA_DIR}/statcast_bat_tracking_2024_2025.csv'
+
+bat_tracking_cols = ['bat_speed', 'swing_length', 'swing_path_tilt', 'attack_angle', 'attack_direction']
+SWING_COLS = ['game_date', 'game_year', 'player_name', 'batter', 'pitch_type',
+              'launch_speed', 'launch_angle'] + bat_tracking_cols
 
-print(f'Total rows: {len(df):,}')
-print(f'Total columns: {len(df.columns)}')
+# Only the swing subset (bat_speed recorded) and the columns used below are loaded
+df_bat = load_statcast(DATA_PATH, columns=SWING_COLS, predicate=[('bat_speed', 'notna', None)])
+
+print(f'Swings loaded: {len(df_bat):,}')
+print(f'Columns loaded: {len(df_bat.columns)}')
+print(f'Memory usage: {memory_mb(df_bat):,.1f} MB')
 print(f'\nFirst few rows:')
-df.head()
+df_bat.head()
 
 # %% Cell 3
-# Check bat tracking data availability
-bat_tracking_cols = ['bat_speed', 'swing_length', 'swing_path_tilt', 'attack_angle', 'attack_direction']
+# Check bat tracking data availability (streams only the bat tracking columns)
+coverage = column_coverage(DATA_PATH, bat_tracking_cols)
+total_rows = coverage['rows']
+print(f'Total rows: {total_rows:,}')
 
 print('Bat Tracking Data Coverage:')
 print('='*50)
 for col in bat_tracking_cols:
-    count = df[col].notna().sum()
-    pct = count / len(df) * 100
+    count = coverage['notna'][col]
+    pct = count / total_rows * 100
     print(f'{col:25s}: {count:7,} ({pct:5.2f}%)')
 
 # Overall bat tracking coverage (any metric available)
-bat_tracking_available = df[bat_tracking_cols].notna().any(axis=1).sum()
-print(f'\nTotal pitches with bat tracking: {bat_tracking_available:,} ({bat_tracking_available/len(df)*100:.2f}%)')
+bat_tracking_available = coverage['any_notna']
+print(f'\nTotal pitches with bat tracking: {bat_tracking_available:,} ({bat_tracking_available/total_rows*100:.2f}%)')
 
 # %% Cell 4
-# Filter data with bat_speed available
-df_bat = df[df['bat_speed'].notna()].copy()
-
+# df_bat already holds only the pitches with bat_speed available
 print('Bat Speed Statistics (mph):')
 print('='*50)
 print(df_bat['bat_speed'].describe())
@@ -98,57 +137,67 @@ plt.legend()
 plt.show()
 
 # %% Cell 7
-# Filter data with both bat_speed and launch_speed
-df_corr = df_bat[df_bat['launch_speed'].notna()].copy()
-
-print(f'Data points with both bat_speed and launch_speed: {len(df_corr):,}')
-print(f'\nCorrelation coefficient: {df_corr[["bat_speed", "launch_speed"]].corr().iloc[0, 1]:.3f}')
-
-# Scatter plot
+# Pairwise counts, means, variances and co-moments for all swing metrics in one pass
+# (each pair uses the rows where both values are present)
+swing_stats = CoMoments(['bat_speed', 'launch_speed', 'launch_angle', 'swing_length',
+                         'swing_path_tilt', 'attack_angle', 'attack_direction'])
+swing_stats.update(df_bat)
+
+print(f'Data points with both bat_speed and launch_speed: {swing_stats.count("bat_speed", "launch_speed"):,}')
+print(f'\nCorrelation coefficient: {swing_stats.corr().loc["bat_speed", "launch_speed"]:.3f}')
+print('\nCorrelation matrix:')
+print(swing_stats.corr().round(3).to_string())
+
+# Density plot: 50x50 count grid (empty bins left blank)
+grid = Binned2D(edges_for(df_bat['bat_speed'], 50), edges_for(df_bat['launch_speed'], 50))
+grid.update(df_bat['bat_speed'], df_bat['launch_speed'])
 plt.figure(figsize=(12, 8))
-plt.hexbin(df_corr['bat_speed'], df_corr['launch_speed'], gridsize=50, cmap='YlOrRd', mincnt=1)
+plt.pcolormesh(grid.x_edges, grid.y_edges, np.ma.masked_equal(grid.count, 0).T, cmap='YlOrRd')
 plt.colorbar(label='Count')
 plt.xlabel('Bat Speed (mph)')
 plt.ylabel('Launch Speed (Exit Velocity, mph)')
 plt.title('Bat Speed vs Launch Speed')
 
 # Add regression line
-z = np.polyfit(df_corr['bat_speed'], df_corr['launch_speed'], 1)
+z = swing_stats.ols('bat_speed', 'launch_speed')
 p = np.poly1d(z)
-x_line = np.linspace(df_corr['bat_speed'].min(), df_corr['bat_speed'].max(), 100)
+x_line = np.linspace(grid.x_edges[0], grid.x_edges[-1], 100)
 plt.plot(x_line, p(x_line), 'b--', linewidth=2, label=f'y = {z[0]:.2f}x + {z[1]:.2f}')
 plt.legend()
 plt.show()
 
 # %% Cell 8
-# Filter data with both bat_speed and swing_length
-df_corr2 = df_bat[df_bat['swing_length'].notna()].copy()
+# Swing length vs bat speed, from the same accumulated statistics
+print(f'Correlation coefficient: {swing_stats.corr().loc["bat_speed", "swing_length"]:.3f}')
 
-print(f'Correlation coefficient: {df_corr2[["bat_speed", "swing_length"]].corr().iloc[0, 1]:.3f}')
-
-# Scatter plot
+# Density plot: 50x50 count grid (empty bins left blank)
+grid = Binned2D(edges_for(df_bat['swing_length'], 50), edges_for(df_bat['bat_speed'], 50))
+grid.update(df_bat['swing_length'], df_bat['bat_speed'])
 plt.figure(figsize=(12, 8))
-plt.hexbin(df_corr2['swing_length'], df_corr2['bat_speed'], gridsize=50, cmap='viridis', mincnt=1)
+plt.pcolormesh(grid.x_edges, grid.y_edges, np.ma.masked_equal(grid.count, 0).T, cmap='viridis')
 plt.colorbar(label='Count')
 plt.xlabel('Swing Length (feet)')
 plt.ylabel('Bat Speed (mph)')
 plt.title('Swing Length vs Bat Speed')
 
 # Add regression line
-z = np.polyfit(df_corr2['swing_length'], df_corr2['bat_speed'], 1)
+z = swing_stats.ols('swing_length', 'bat_speed')
 p = np.poly1d(z)
-x_line = np.linspace(df_corr2['swing_length'].min(), df_corr2['swing_length'].max(), 100)
+x_line = np.linspace(grid.x_edges[0], grid.x_edges[-1], 100)
 plt.plot(x_line, p(x_line), 'r--', linewidth=2, label=f'y = {z[0]:.2f}x + {z[1]:.2f}')
 plt.legend()
 plt.show()
 
 # %% Cell 9
+# Leaderboards come from the precomputed aggregate cube (batter x pitch_type x season x month);
+# build it from df_bat when the dataset does not ship one
+cube_file = f'{DATA_DIR}/statcast_bat_tracking_2024_2025_cube.parquet'
+cube = load_cube(cube_file) if os.path.exists(cube_file) else build_cube([df_bat])
+
 # Calculate average bat speed by player (minimum 100 swings)
-player_bat_speed = df_bat.groupby('player_name').agg({
-    'bat_speed': ['mean', 'count']
-}).reset_index()
+player_bat_speed = rollup(cube, ['player_name'], min_count=100)[['player_name', 'mean', 'count']]
 player_bat_speed.columns = ['player_name', 'avg_bat_speed', 'swings']
-player_bat_speed = player_bat_speed[player_bat_speed['swings'] >= 100].sort_values('avg_bat_speed', ascending=False)
+player_bat_speed = player_bat_speed.sort_values('avg_bat_speed', ascending=False)
 
 print('Top 10 Bat Speed Leaders (min. 100 swings):')
 print('='*70)
@@ -168,11 +217,9 @@ plt.show()
 
 # %% Cell 10
 # Average bat speed by pitch type
-pitch_type_bat_speed = df_bat.groupby('pitch_type').agg({
-    'bat_speed': ['mean', 'count']
-}).reset_index()
+pitch_type_bat_speed = rollup(cube, ['pitch_type'], min_count=100)[['pitch_type', 'mean', 'count']]
 pitch_type_bat_speed.columns = ['pitch_type', 'avg_bat_speed', 'count']
-pitch_type_bat_speed = pitch_type_bat_speed[pitch_type_bat_speed['count'] >= 100].sort_values('avg_bat_speed', ascending=False)
+pitch_type_bat_speed = pitch_type_bat_speed.sort_values('avg_bat_speed', ascending=False)
 
 print('Average Bat Speed by Pitch Type (min. 100 swings):')
 print('='*60)
@@ -190,20 +237,11 @@ plt.tight_layout()
 plt.show()
 
 # %% Cell 11
-# Filter data with attack_angle and attack_direction
-df_attack = df_bat[df_bat['attack_angle'].notna() & df_bat['attack_direction'].notna()].copy()
-
-# Create bins
-df_attack['attack_angle_bin'] = pd.cut(df_attack['attack_angle'], bins=20)
-df_attack['attack_direction_bin'] = pd.cut(df_attack['attack_direction'], bins=20)
-
-# Pivot table
-heatmap_data = df_attack.pivot_table(
-    values='bat_speed',
-    index='attack_angle_bin',
-    columns='attack_direction_bin',
-    aggfunc='mean'
-)
+# Mean bat speed on a 20x20 attack angle x attack direction grid
+# (rows missing either angle are skipped by the binning)
+grid = Binned2D(edges_for(df_bat['attack_angle'], 20), edges_for(df_bat['attack_direction'], 20))
+grid.update(df_bat['attack_angle'], df_bat['attack_direction'], df_bat['bat_speed'])
+heatmap_data = grid.frame('mean').dropna(how='all').dropna(axis=1, how='all')
 
 # Plot
 plt.figure(figsize=(14, 10))
@@ -8,63 +8,161 @@
 # Generate full pitch-by-pitch Statcast data with Bat Tracking metrics for 2024-2025 seasons.
 # 
 # **Output:** `statcast_bat_tracking_2024_2025.csv` (~2.4GB, ~1.4M rows)
+# and `statcast_bat_tracking_2024_2025_parquet/` (partitioned by game_year/month, zstd),
+# plus `statcast_bat_tracking_2024_2025_cube.parquet` (bat-speed aggregate cube)
 # ============================================================
 
 # Install required packages
-# !pip install pybaseball -q  # uncomment in Colab/notebook
+# !pip install pybaseball pyarrow -q  # uncomment in Colab/notebook
+
+import functools
+import os
+import pathlib
+import sys
 
 import pandas as pd
 import numpy as np
+from datetime import date, datetime
 from pybaseball import statcast
-from datetime import date
 
-# ============================================================
-# ## Fetch 2024 Season
-# ============================================================
+# Shared helpers live in statcast_tools/ at the repository root
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1] if '__file__' in globals() else pathlib.Path.cwd().parent
+sys.path.insert(0, str(REPO_ROOT))
+from statcast_tools.fetch import (season_windows, fetch_windows, fetched_months, iter_partitions,
+                                  manifest_rows)
+from statcast_tools.incremental import refresh_partitions, stored_watermark
+from statcast_tools.csv_stream import StreamingCSVWriter
+from statcast_tools.cube import chunk_cube, load_cube, merge_cubes, replace_months, save_cube
+from statcast_tools.parquet import write_parquet_dataset, dir_size_mb
+from statcast_tools.scheduler import TokenBucket
+from statcast_tools.schema import apply_schema, memory_mb
+
+# Each season is fetched in week windows; every finished window is saved under
+# PARTITION_DIR/<season>/ with a manifest, so rerunning this script after a
+# failure resumes from the last finished window.
+PARTITION_DIR = pathlib.Path('partitions')
+WINDOW_FREQ = 'week'  # 'day' for smaller windows (lower memory, more requests)
+
+# Windows are fetched on FETCH_WORKERS threads sharing one rate limiter
+# (REQUESTS_PER_SEC towards Baseball Savant); failed windows retry with backoff
+FETCH_WORKERS = 4
+REQUESTS_PER_SEC = 1.0
+limiter = TokenBucket(rate=REQUESTS_PER_SEC, capacity=FETCH_WORKERS)
+fetch_fn = functools.partial(statcast, verbose=False, parallel=False)
 
-# 2024 regular season: March 20 - September 29
-print('=== Fetching 2024 Season ===')
-df_2024 = statcast(start_dt='2024-03-20', end_dt='2024-09-29')
-print(f'2024 rows: {len(df_2024):,}')
-print(f'2024 bat tracking: {df_2024["bat_speed"].notna().sum():,}')
+# Incremental mode: for seasons already on disk, fetch only the dates after the
+# latest stored game_date (minus OVERLAP_DAYS for late corrections) and merge
+# them in, deduplicating on (game_pk, at_bat_number, pitch_number)
+INCREMENTAL = True
+OVERLAP_DAYS = 3
+
+SEASONS = {
+    2024: ('2024-03-20', '2024-09-29'),  # 2024 regular season: March 20 - September 29
+    2025: ('2025-03-27', '2025-09-28'),  # 2025 regular season: March 27 - September 28
+}
 
 # ============================================================
-# ## Fetch 2025 Season
+# ## Fetch Seasons (resumable)
 # ============================================================
 
-# 2025 regular season: March 27 - September 28
-print('\n=== Fetching 2025 Season ===')
-df_2025 = statcast(start_dt='2025-03-27', end_dt='2025-09-28')
-print(f'2025 rows: {len(df_2025):,}')
-print(f'2025 bat tracking: {df_2025["bat_speed"].notna().sum():,}')
+# Every window is converted to the compact dtype schema before it is saved;
+# track raw vs compact memory for the windows fetched in this run
+fetched_mb = {'raw': 0.0, 'compact': 0.0}
+
+def compact(df):
+    fetched_mb['raw'] += memory_mb(df)
+    df = apply_schema(df)
+    fetched_mb['compact'] += memory_mb(df)
+    return df
+
+for season, (start_dt, end_dt) in SEASONS.items():
+    print(f'=== Fetching {season} Season ===')
+    season_dir = PARTITION_DIR / str(season)
+    watermark = stored_watermark(season_dir)
+    # First pull, or resume windows left unfinished by an earlier run
+    windows = season_windows(start_dt, end_dt, freq=WINDOW_FREQ)
+    fetch_windows(windows, season_dir, fetch_fn=fetch_fn, transform=compact,
+                  workers=FETCH_WORKERS, limiter=limiter)
+    # A season whose stored games already reach its end date is finished;
+    # refreshing it would only refetch the last OVERLAP_DAYS on every build
+    if INCREMENTAL and watermark is not None and watermark < date.fromisoformat(end_dt):
+        refresh_partitions(season_dir, end_dt, fetch_fn=fetch_fn, transform=compact,
+                           overlap_days=OVERLAP_DAYS, freq=WINDOW_FREQ,
+                           workers=FETCH_WORKERS, limiter=limiter)
+    print(f'{season} rows: {manifest_rows(season_dir):,}\n')
 
 # ============================================================
 # ## Combine and Save
 # ============================================================
 
-# Combine both seasons
-df = pd.concat([df_2024, df_2025], ignore_index=True)
+# Stream one window at a time into the CSV so peak memory is a single window;
+# columns added in a later season are unified into one header. The same pass
+# folds swings into the batter x pitch_type x season x month cube: when a cube
+# from an earlier build exists, only the (game_year, month) cells covered by
+# windows fetched since it was saved are rebuilt and swapped in
+cube_file = 'statcast_bat_tracking_2024_2025_cube.parquet'
+if os.path.exists(cube_file):
+    cube_saved_at = datetime.fromtimestamp(os.path.getmtime(cube_file)).isoformat(timespec='seconds')
+    rebuild_months = set().union(*(fetched_months(PARTITION_DIR / str(season), cube_saved_at)
+                                   for season in SEASONS))
+    print(f'Cube: rebuilding {len(rebuild_months)} month(s) fetched since {cube_saved_at}')
+else:
+    rebuild_months = None
+
+output_file = 'statcast_bat_tracking_2024_2025.csv'
+print(f'Saving to {output_file}...')
+bat_rows = 0
+peak_mb = 0.0
+sample = None
+cube = merge_cubes([])
+sample_cols = ['game_date', 'pitcher', 'batter', 'player_name', 'events',
+               'bat_speed', 'swing_length', 'launch_speed', 'launch_angle',
+               'release_speed', 'pitch_type', 'pfx_x', 'pfx_z']
+with StreamingCSVWriter(output_file) as writer:
+    for season in SEASONS:
+        for chunk in iter_partitions(PARTITION_DIR / str(season)):
+            writer.write(chunk)
+            bat_rows += chunk['bat_speed'].notna().sum()
+            swings = chunk[chunk['bat_speed'].notna()]
+            if rebuild_months is not None:
+                days = pd.to_datetime(swings['game_date'])
+                swings = swings[pd.MultiIndex.from_arrays([days.dt.year, days.dt.month])
+                                .isin(list(rebuild_months))]
+            if len(swings):
+                cube = merge_cubes([cube, chunk_cube(swings)])
+            peak_mb = max(peak_mb, memory_mb(chunk))
+            if sample is None and chunk['bat_speed'].notna().any():
+                sample = chunk[chunk['bat_speed'].notna()][sample_cols].head(20)
+total_rows = writer.rows
+n_columns = len(writer.columns)
+
 print(f'\n=== Combined Dataset ===')
-print(f'Total rows: {len(df):,}')
-print(f'Total columns: {len(df.columns)}')
-print(f'Bat tracking rows: {df["bat_speed"].notna().sum():,}')
-print(f'Bat tracking coverage: {df["bat_speed"].notna().sum() / len(df) * 100:.1f}%')
+print(f'Total rows: {total_rows:,}')
+print(f'Total columns: {n_columns}')
+print(f'Bat tracking rows: {bat_rows:,}')
+print(f'Bat tracking coverage: {bat_rows / total_rows * 100:.1f}%')
 
 # Check memory usage
-size_mb = df.memory_usage(deep=True).sum() / 1024**2
-print(f'\nMemory usage: {size_mb:.1f} MB')
+if fetched_mb['raw']:
+    print(f'\nMemory usage (windows fetched this run): {fetched_mb["raw"]:.1f} MB raw -> '
+          f'{fetched_mb["compact"]:.1f} MB compact schema')
+print(f'Peak window memory: {peak_mb:.1f} MB')
 
-# Save to CSV
-output_file = 'statcast_bat_tracking_2024_2025.csv'
-print(f'\nSaving to {output_file}...')
-df.to_csv(output_file, index=False)
+# Columnar copy: game_year/month partitions, zstd, 128K-row row groups
+parquet_dir = 'statcast_bat_tracking_2024_2025_parquet'
+print(f'\nSaving to {parquet_dir}/...')
+write_parquet_dataset([PARTITION_DIR / str(season) for season in SEASONS], parquet_dir)
+print(f'CSV size:     {pathlib.Path(output_file).stat().st_size / 1024**2:,.0f} MB')
+print(f'Parquet size: {dir_size_mb(parquet_dir):,.0f} MB')
+
+# Leaderboard cube: count / sum / sum of squares / min / max per cell
+if rebuild_months is not None:
+    cube = replace_months(load_cube(cube_file), cube, months=rebuild_months)
+save_cube(cube, cube_file)
+print(f'Cube: {len(cube):,} cells -> {cube_file}')
 print('Done!')
-print(f'\nDownload the file and upload to Kaggle.')
+print(f'\nDownload the files and upload to Kaggle.')
 
 # Sample data preview
 print('\n=== Sample Data (with bat tracking) ===')
-sample_cols = ['game_date', 'pitcher', 'batter', 'player_name', 'events',
-               'bat_speed', 'swing_length', 'launch_speed', 'launch_angle',
-               'release_speed', 'pitch_type', 'pfx_x', 'pfx_z']
-sample = df[df['bat_speed'].notna()][sample_cols].head(20)
 print(sample)
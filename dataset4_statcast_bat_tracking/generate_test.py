@@ -7,25 +7,53 @@
 # 
 # Generate pitch-by-pitch Statcast data with Bat Tracking metrics.
 # 
-# ## Test Version (1 week)
+# ## Test Version (capacity planner)
+# 
+# Fetches a stratified sample of days (DAYS_PER_MONTH random days from every
+# month of each season) and projects the full pull: rows, in-memory size under
+# the compact schema, on-disk size as CSV / gzip CSV / Parquet, and fetch time
+# at the concurrency and rate limit used by generate.py.
 # ============================================================
 
 # Install required packages
-# !pip install pybaseball -q  # uncomment in Colab/notebook
+# !pip install pybaseball pyarrow -q  # uncomment in Colab/notebook
+
+import functools
+import pathlib
+import sys
 
 import pandas as pd
 import numpy as np
 from pybaseball import statcast
 from datetime import date, timedelta
 
-# Test: 1 week of 2024 season
-start_date = '2024-09-01'
-end_date = '2024-09-07'
+# Shared helpers live in statcast_tools/ at the repository root
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[1] if '__file__' in globals() else pathlib.Path.cwd().parent
+sys.path.insert(0, str(REPO_ROOT))
+from statcast_tools.capacity import sample_days, fetch_sample, project
+from statcast_tools.fetch import season_windows
+from statcast_tools.scheduler import TokenBucket
+from statcast_tools.schema import memory_mb
+
+# Same seasons and fetch settings as generate.py
+SEASONS = {
+    2024: ('2024-03-20', '2024-09-29'),
+    2025: ('2025-03-27', '2025-09-28'),
+}
+WINDOW_FREQ = 'week'
+FETCH_WORKERS = 4
+REQUESTS_PER_SEC = 1.0
+DAYS_PER_MONTH = 1
 
-print(f'Fetching data: {start_date} to {end_date}')
-df = statcast(start_dt=start_date, end_dt=end_date)
+sample = sample_days(SEASONS, days_per_stratum=DAYS_PER_MONTH)
+print(f'Fetching {len(sample)} sample days: {", ".join(str(d) for d in sample["day"])}')
+limiter = TokenBucket(rate=REQUESTS_PER_SEC, capacity=FETCH_WORKERS)
+measured, df = fetch_sample(sample, fetch_fn=functools.partial(statcast, verbose=False, parallel=False),
+                            workers=FETCH_WORKERS, limiter=limiter)
 print(f'Total rows: {len(df):,}')
 print(f'Total columns: {len(df.columns)}')
+print('\n=== Sample Days ===')
+print(measured[['season', 'month', 'day', 'rows', 'bat_tracking_rows', 'seconds']].to_string(index=False))
 
 # Check Bat Tracking coverage
 bat_tracking_cols = ['bat_speed', 'swing_length', 'swing_path_tilt']
@@ -35,26 +63,32 @@ for col in bat_tracking_cols:
     pct = non_null / len(df) * 100
     print(f'{col}: {non_null:,} ({pct:.1f}%)')
 
-# Check data types and memory usage
+# Check data types and memory usage (raw pybaseball dtypes vs compact schema,
+# which is applied while fetching)
 print('\n=== Memory Usage ===')
-print(f'Total memory: {df.memory_usage(deep=True).sum() / 1024**2:.1f} MB')
-print(f'\nPer 1000 rows: {df.memory_usage(deep=True).sum() / len(df) * 1000 / 1024**2:.2f} MB')
+raw_mb = measured['raw_mb'].sum()
+compact_mb = memory_mb(df)
+print(f'Total memory: {raw_mb:.1f} MB raw -> {compact_mb:.1f} MB compact ({raw_mb / compact_mb:.1f}x)')
+print(f'\nPer 1000 rows: {raw_mb / len(df) * 1000:.2f} MB raw -> {compact_mb / len(df) * 1000:.2f} MB compact')
 
 # Sample data with bat tracking
 print('\n=== Sample Data ===')
 sample_cols = ['game_date', 'batter', 'player_name', 'events',
                'bat_speed', 'swing_length', 'launch_speed', 'launch_angle']
-sample = df[df['bat_speed'].notna()][sample_cols].head(10)
-print(sample)
+print(df[df['bat_speed'].notna()][sample_cols].head(10))
 
-# Estimate full dataset size
-# 2024 season: ~183 days, 2025 season: ~183 days (total ~366 days)
-days_test = 7
-days_full = 366
-rows_full = len(df) * days_full / days_test
-size_full_mb = df.memory_usage(deep=True).sum() / 1024**2 * days_full / days_test
+# Project the full dataset from per-month means (stratified estimate)
+n_windows = sum(len(season_windows(s, e, freq=WINDOW_FREQ)) for s, e in SEASONS.values())
+plan = project(measured, df, windows=n_windows, workers=FETCH_WORKERS, rate=REQUESTS_PER_SEC)
 
 print('\n=== Full Dataset Estimate (2024-2025) ===')
-print(f'Estimated rows: {rows_full:,.0f}')
-print(f'Estimated size: {size_full_mb:.0f} MB')
-print(f'Bat tracking rows: {df["bat_speed"].notna().sum() * days_full / days_test:,.0f}')
+print(f'Estimated rows:       {plan["rows"]:,.0f}')
+print(f'Bat tracking rows:    {plan["bat_tracking_rows"]:,.0f}')
+print(f'In-memory (raw):      {plan["memory_raw_mb"]:,.0f} MB')
+print(f'In-memory (compact):  {plan["memory_mb"]:,.0f} MB')
+print(f'CSV:                  {plan["csv_mb"]:,.0f} MB')
+print(f'CSV (gzip):           {plan["csv_gzip_mb"]:,.0f} MB')
+print(f'Parquet (zstd):       {plan["parquet_mb"]:,.0f} MB')
+print(f'Fetch time:           {plan["fetch_minutes"]:,.0f} min with {FETCH_WORKERS} workers '
+      f'@ {REQUESTS_PER_SEC} req/s ({n_windows} {WINDOW_FREQ} windows; '
+      f'{plan["fetch_minutes_sequential"]:,.0f} min sequential)')
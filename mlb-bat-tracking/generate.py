@@ -13,36 +13,50 @@
 # Install pybaseball if needed
 # !pip install pybaseball
 
+import os
 import pandas as pd
 from pybaseball import statcast_batter_bat_tracking
 from datetime import date
 
 print(f"Data generation started: {date.today()}")
 
-# ============================================================
-# ## 2024シーズン
-# ============================================================
+OUTPUT_FILE = 'mlb_bat_tracking_2024_2025.csv'
+SEASONS = [2024, 2025]
+
+# Incremental mode: this leaderboard has one row per batter-season and no
+# game_date, so the watermark is the season. Finished seasons already in
+# OUTPUT_FILE are kept as-is; only unfinished seasons are re-fetched, and a
+# re-fetched season replaces all of its stored rows.
+INCREMENTAL = True
 
-# 2024 Regular Season
-df_2024 = statcast_batter_bat_tracking(2024, minSwings=50)
-df_2024['season'] = 2024
-print(f"2024 season: {len(df_2024)} batters")
+stored = pd.read_csv(OUTPUT_FILE) if INCREMENTAL and os.path.exists(OUTPUT_FILE) else pd.DataFrame()
+stored_seasons = set(stored['season']) if len(stored) else set()
+frames, refetched = [], []
 
 # ============================================================
-# ## 2025シーズン
+# ## 2024・2025シーズン
 # ============================================================
 
-# 2025 Regular Season
-df_2025 = statcast_batter_bat_tracking(2025, minSwings=50)
-df_2025['season'] = 2025
-print(f"2025 season: {len(df_2025)} batters")
+for season in SEASONS:
+    if season in stored_seasons and season < date.today().year:
+        print(f"{season} season: {(stored['season'] == season).sum()} batters (stored, skipped)")
+        continue
+    df_season = statcast_batter_bat_tracking(season, minSwings=50)
+    df_season['season'] = season
+    frames.append(df_season)
+    refetched.append(season)
+    print(f"{season} season: {len(df_season)} batters")
 
 # ============================================================
 # ## データ結合とエクスポート
 # ============================================================
 
-# Combine both seasons
-df_combined = pd.concat([df_2024, df_2025], ignore_index=True)
+# Combine seasons; a re-fetched season drops every stored row of that season,
+# including batters missing from the new response
+if len(stored):
+    frames.insert(0, stored[~stored['season'].isin(refetched)])
+df_combined = pd.concat(frames, ignore_index=True)
+df_combined = df_combined.sort_values('season', kind='stable').reset_index(drop=True)
 print(f"\nTotal batters: {len(df_combined)}")
 print(f"Columns: {len(df_combined.columns)}")
 print(f"\nColumn names:")
@@ -50,8 +64,8 @@ print(df_combined.columns.tolist())
 print(f"\nData types:")
 print(df_combined.dtypes)
 # Export to CSV
-df_combined.to_csv('mlb_bat_tracking_2024_2025.csv', index=False)
-print(f"\nExported to mlb_bat_tracking_2024_2025.csv")
+df_combined.to_csv(OUTPUT_FILE, index=False)
+print(f"\nExported to {OUTPUT_FILE}")
 print(f"File size: {len(df_combined)} rows x {len(df_combined.columns)} columns")
 
 # ============================================================
@@ -27,8 +27,15 @@ import matplotlib.pyplot as plt
 import matplotlib.colors as mcolors
 import seaborn as sns
 import warnings
+import hashlib
+import importlib
+import json
 import os
+import pathlib
+import re
+import threading
 import time
+from datetime import date
 
 sns.set_theme(style="whitegrid")
 warnings.filterwarnings("ignore")
@@ -37,16 +44,267 @@ YEARS = [2024, 2025]
 YEAR = 2025
 TOP_N = 20
 
-def coerce_numeric(df):
-    for col in df.columns:
-        if df[col].dtype == object:
-            converted = pd.to_numeric(df[col], errors="coerce")
-            if converted.notna().sum() > df[col].notna().sum() * 0.5:
-                df[col] = converted
+# --- On-disk response cache ---------------------------------------------------
+# Every leaderboard call goes through cached_call(), which stores the returned
+# DataFrame under CACHE_DIR keyed by a hash of (function, args, kwargs).
+# Finished seasons never expire; calls touching the current season expire after
+# CACHE_TTL_CURRENT seconds (overridable per leaderboard in CACHE_TTL). When the
+# network fails, a stale entry is used instead, so reruns also work offline.
+# An entry's mtime is its write time and drives the TTL; every read bumps its
+# atime, and the least recently used entries are evicted beyond CACHE_MAX_MB.
+CACHE_DIR = pathlib.Path(os.environ.get("SAVANT_CACHE_DIR", "~/.cache/savant-extras-notebooks")).expanduser()
+CACHE_MAX_MB = 500
+CACHE_TTL_CURRENT = 24 * 3600
+CACHE_TTL = {"park_factors_range": 7 * 24 * 3600}
+CURRENT_SEASON = date.today().year
+
+def _cache_key(fn, args, kwargs):
+    payload = json.dumps([fn.__module__, fn.__qualname__, [repr(a) for a in args],
+                          sorted((k, repr(v)) for k, v in kwargs.items())])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def _cache_ttl(fn, args, kwargs):
+    """None (never expires) if every season in the call is finished."""
+    years = [int(str(v)[:4]) for v in (*args, *kwargs.values())
+             if re.fullmatch(r"\d{4}(-\d{2}-\d{2})?", str(v))]
+    if years and max(years) < CURRENT_SEASON:
+        return None
+    return CACHE_TTL.get(fn.__name__, CACHE_TTL_CURRENT)
+
+_CACHE_LOCK = threading.Lock()  # cached_call may run on worker threads
+
+def _read_cache(path):
+    """Load an entry and mark it used (atime); None if it was evicted meanwhile."""
+    try:
+        df = pd.read_pickle(path)
+        os.utime(path, (time.time(), path.stat().st_mtime))
+    except FileNotFoundError:
+        return None
+    return df
+
+def _evict_cache():
+    with _CACHE_LOCK:
+        entries = []
+        for p in CACHE_DIR.glob("*.pkl"):
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_atime, st.st_size, p))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        for _, size, p in entries:
+            if total <= CACHE_MAX_MB * 1024**2:
+                break
+            p.unlink(missing_ok=True)
+            total -= size
+
+def cached_call(fn, *args, **kwargs):
+    """Return (fn(*args, **kwargs), from_cache), served from CACHE_DIR when fresh."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = CACHE_DIR / f"{_cache_key(fn, args, kwargs)}.pkl"
+    if path.exists():
+        ttl = _cache_ttl(fn, args, kwargs)
+        if ttl is None or time.time() - path.stat().st_mtime < ttl:
+            df = _read_cache(path)
+            if df is not None:
+                return df, True
+    try:
+        df = fn(*args, **kwargs)
+    except Exception:
+        stale = _read_cache(path) if path.exists() else None
+        if stale is not None:
+            print(f"  {fn.__name__}{args}: network failed, using stale cache")
+            return stale, True
+        raise
+    tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    df.to_pickle(tmp)
+    os.replace(tmp, path)
+    _evict_cache()
+    return df, False
+
+# --- Column schemas -------------------------------------------------------------
+# Leaderboards often arrive with numeric columns stored as text, and a column can
+# be numeric in one season's frame and text in the next. parse_numeric() decides
+# once per leaderboard, from an evenly spaced sample of rows, which columns are
+# numeric, and saves that schema as JSON under SCHEMA_DIR. Later loads reuse it
+# (memoized in _SCHEMAS) and convert only those columns. A column is inferred
+# again only when it is new, or arrives as text without being marked numeric.
+SCHEMA_DIR = CACHE_DIR / "schemas"
+SCHEMA_SAMPLE_ROWS = 500
+_SCHEMAS = {}
+
+def _is_text(s):
+    return s.dtype == object or isinstance(s.dtype, pd.StringDtype)
+
+def infer_schema(df, columns=None, sample_rows=SCHEMA_SAMPLE_ROWS):
+    """{column: "numeric"} for numeric or mostly-numeric text columns, else {column: "other"}."""
+    sample = df.iloc[::max(1, len(df) // sample_rows)]
+    schema = {}
+    for col in df.columns if columns is None else columns:
+        s = sample[col]
+        numeric = pd.api.types.is_numeric_dtype(s.dtype) and s.dtype != bool
+        if not numeric and _is_text(s):
+            numeric = pd.to_numeric(s, errors="coerce").notna().sum() > s.notna().sum() * 0.5
+        schema[col] = "numeric" if numeric else "other"
+    return schema
+
+def load_schema(name, df):
+    """Schema for leaderboard name: memoized, else read from SCHEMA_DIR; stale columns re-inferred."""
+    schema = _SCHEMAS.get(name)
+    path = SCHEMA_DIR / f"{name}.json"
+    if schema is None and path.exists():
+        schema = json.loads(path.read_text())
+    schema = dict(schema or {})
+    stale = [c for c in df.columns if c not in schema or (schema[c] != "numeric" and _is_text(df[c]))]
+    changed = {c: k for c, k in infer_schema(df, stale).items() if schema.get(c) != k} if stale else {}
+    if changed:
+        schema.update(changed)
+        SCHEMA_DIR.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(schema, indent=1))
+    _SCHEMAS[name] = schema
+    return schema
+
+def parse_numeric(df, name):
+    """Convert df's numeric text columns in one pass, using leaderboard name's schema."""
+    if df.empty:
+        return df
+    schema = load_schema(name, df)
+    cols = [c for c in df.columns if schema[c] == "numeric" and _is_text(df[c])]
+    if cols:
+        df[cols] = df[cols].apply(pd.to_numeric, errors="coerce")
     return df
 
 # Dataset path
 DATASET_DIR = "/kaggle/input/baseball-savant-leaderboards-2024"
+BUNDLE_MANIFEST = os.path.join(DATASET_DIR, "manifest.json")
+
+def read_leaderboard(name, columns=None):
+    """Leaderboard `name` from DATASET_DIR, or None when the dataset doesn't have it.
+
+    Reads the Parquet bundle listed in manifest.json when present (typed, no
+    parsing), else the `*_2024_2025.csv` export. Only the listed columns that
+    exist are loaded, in file order; columns=None loads all.
+    """
+    if os.path.exists(BUNDLE_MANIFEST):
+        with open(BUNDLE_MANIFEST) as f:
+            entry = json.load(f)["leaderboards"].get(name)
+        if entry and entry["rows"]:
+            cols = None if columns is None else [c for c in entry["columns"] if c in columns]
+            return pd.read_parquet(os.path.join(DATASET_DIR, entry["file"]), columns=cols)
+    path = os.path.join(DATASET_DIR, f"{name}_2024_2025.csv")
+    if os.path.exists(path) and os.path.getsize(path) > 10:
+        return pd.read_csv(path, usecols=None if columns is None else lambda c: c in columns)
+    return None
+
+# --- Dataset resolver -----------------------------------------------------------
+# resolve(name) loads a leaderboard from the first source that has it: the local
+# dataset (read_leaderboard), then the disk cache, then the network (both through
+# cached_call, season by season, so a fetch reports which seasons came from the
+# cache and which from the network). The parsed frame is memoized in _RESOLVED, so re-running a cell or
+# asking for the same leaderboard again returns the loaded copy; treat it as
+# read-only and .copy() before modifying. Every load is timed in LOAD_TIMES and
+# load_report() compares cold and warm loads per source.
+_PQ_COLS = ["Name", "Team", "Age", "IP", "Stuff+", "Location+", "Pitching+"]
+_PQ_RENAME = {"Name": "name", "Team": "team", "Age": "age", "IP": "ip",
+              "Stuff+": "stuff_plus", "Location+": "location_plus", "Pitching+": "pitching_plus"}
+
+def _pitcher_quality(df):
+    avail = [c for c in _PQ_COLS if c in df.columns]
+    return df[avail].rename(columns=_PQ_RENAME).copy()
+
+# Player-name columns the Savant fielding leaderboards have used, in order of preference
+NAME_COLUMNS = ["last_name, first_name", "player_name", "entity_name", "name"]
+
+def name_column(df):
+    """First of NAME_COLUMNS present in df; a leaderboard without one is an error."""
+    for col in NAME_COLUMNS:
+        if col in df.columns:
+            return col
+    raise KeyError(f"no player-name column (tried {NAME_COLUMNS}) in {list(df.columns)}")
+
+# columns: what the dataset read loads (None = all); fetch: (module, function)
+# called as fn(*args(year), **kwargs) per season; post reshapes each season;
+# year_col is added when missing; pause is the delay after each network call.
+DATASETS = {
+    "outs_above_average": {
+        "columns": [*NAME_COLUMNS, "player_id", "year", "Year", "primary_pos_formatted",
+                    "outs_above_average", "fielding_runs_prevented"],
+        "fetch": ("pybaseball", "statcast_outs_above_average"), "args": lambda y: (y, "all"),
+    },
+    "outfield_jump": {
+        "columns": [*NAME_COLUMNS, "player_id", "year", "Year",
+                    "rel_league_bootup_distance", "rel_league_reaction_distance",
+                    "rel_league_burst_distance", "rel_league_routing_distance"],
+        "fetch": ("pybaseball", "statcast_outfielder_jump"), "year_col": "year",
+    },
+    "park_factors": {
+        "columns": ["team", "season", "pf_5yr", "pf_hr", "pf_fip"],
+        "fetch": ("savant_extras", "park_factors_range"),
+        "years": [None], "args": lambda _: (YEARS[0], YEARS[-1]),
+    },
+    "pitcher_quality": {  # narrow table; stuff_* columns are optional
+        "fetch": ("pybaseball", "fg_pitching_data"), "kwargs": {"qual": 0},
+        "post": _pitcher_quality, "year_col": "season", "pause": 1.5,
+    },
+}
+
+_RESOLVED = {}
+LOAD_TIMES = []  # (dataset, source, seconds)
+
+def _fetch(name, spec):
+    """(frame, {season: "cache" | "network"}) from cached_call over every season of spec."""
+    fn = getattr(importlib.import_module(spec["fetch"][0]), spec["fetch"][1])
+    years = spec.get("years", YEARS)
+    frames, sources = [], {}
+    for y in years:
+        df, from_cache = cached_call(fn, *spec.get("args", lambda y: (y,))(y), **spec.get("kwargs", {}))
+        if spec.get("post"):
+            df = spec["post"](df)
+        if spec.get("year_col") and spec["year_col"] not in df.columns:
+            df[spec["year_col"]] = y
+        frames.append(df)
+        sources[y] = "cache" if from_cache else "network"
+        if not from_cache and y != years[-1]:
+            time.sleep(spec.get("pause", 1.0))
+    return pd.concat(frames, ignore_index=True), sources
+
+def _source_label(sources):
+    """The common source when every season agrees, else e.g. "2024: cache, 2025: network"."""
+    if len(set(sources.values())) == 1:
+        return next(iter(sources.values()))
+    return ", ".join(f"{y}: {s}" for y, s in sources.items())
+
+def resolve(name):
+    """Leaderboard `name` from memo, local dataset, disk cache or network (first hit)."""
+    t0 = time.perf_counter()
+    if name in _RESOLVED:
+        LOAD_TIMES.append((name, "memo", time.perf_counter() - t0))
+        return _RESOLVED[name]
+    spec = DATASETS[name]
+    df, source = read_leaderboard(name, spec.get("columns")), "dataset"
+    if df is None:
+        try:
+            df, sources = _fetch(name, spec)
+            source = _source_label(sources)
+        except Exception as e:
+            print(f"{name}: skipped ({e})")
+            return pd.DataFrame()  # not memoized, so a rerun retries
+    df = parse_numeric(df, name)
+    _RESOLVED[name] = df
+    seconds = time.perf_counter() - t0
+    LOAD_TIMES.append((name, source, seconds))
+    print(f"{name}: {len(df)} rows from {source} in {seconds:.2f}s")
+    return df
+
+def load_report():
+    """Cold (first load, by source) vs warm (memoized) load time per dataset."""
+    times = pd.DataFrame(LOAD_TIMES, columns=["dataset", "source", "seconds"])
+    cold = times[times["source"] != "memo"].groupby("dataset").agg(
+        source=("source", "first"), cold_s=("seconds", "first"))
+    warm = times[times["source"] == "memo"].groupby("dataset").agg(
+        warm_s=("seconds", "mean"), warm_loads=("seconds", "size"))
+    return cold.join(warm).fillna({"warm_loads": 0}).astype({"warm_loads": int}).round(4)
 
 # %% [markdown]
 # ---
@@ -56,23 +314,7 @@ DATASET_DIR = "/kaggle/input/baseball-savant-leaderboards-2024"
 # based on catch probability of each batted ball.
 
 # %%
-oaa_path = os.path.join(DATASET_DIR, "outs_above_average_2024_2025.csv")
-if os.path.exists(oaa_path) and os.path.getsize(oaa_path) > 10:
-    df_oaa = pd.read_csv(oaa_path)
-else:
-    try:
-        from pybaseball import statcast_outs_above_average
-        frames = []
-        for y in YEARS:
-            df_tmp = statcast_outs_above_average(y, 'all')
-            df_tmp = coerce_numeric(df_tmp)
-            frames.append(df_tmp)
-            time.sleep(1)
-        df_oaa = pd.concat(frames, ignore_index=True)
-    except Exception as e:
-        print(f"outs_above_average: skipped ({e})")
-        df_oaa = pd.DataFrame()
-
+df_oaa = resolve("outs_above_average")
 print(f"OAA: {len(df_oaa)} fielder-seasons, columns: {list(df_oaa.columns[:8])}")
 df_oaa.head()
 
@@ -80,14 +322,13 @@ df_oaa.head()
 # --- Top and Bottom defenders ---
 year_col = "year" if "year" in df_oaa.columns else "Year"
 oaa25 = df_oaa[df_oaa[year_col] == YEAR].copy()
-oaa25 = coerce_numeric(oaa25)
 
 fig, axes = plt.subplots(1, 2, figsize=(16, 7))
 
 top_oaa = oaa25.nlargest(TOP_N, "outs_above_average")
 bot_oaa = oaa25.nsmallest(TOP_N, "outs_above_average")
 
-name_col = "last_name, first_name" if "last_name, first_name" in oaa25.columns else oaa25.columns[0]
+name_col = name_column(oaa25)
 
 axes[0].barh(top_oaa[name_col], top_oaa["outs_above_average"],
              color=sns.color_palette("crest", TOP_N))
@@ -139,7 +380,6 @@ if "primary_pos_formatted" in oaa25.columns:
 # --- 2024 vs 2025 OAA comparison (players who appear both years) ---
 if len(df_oaa[df_oaa[year_col] == 2024]) > 0 and len(oaa25) > 0:
     oaa24 = df_oaa[df_oaa[year_col] == 2024].copy()
-    oaa24 = coerce_numeric(oaa24)
     id_col = "player_id" if "player_id" in oaa24.columns else None
     if id_col:
         merged = oaa24[[id_col, name_col, "outs_above_average"]].merge(
@@ -168,33 +408,14 @@ if len(df_oaa[df_oaa[year_col] == 2024]) > 0 and len(oaa25) > 0:
 # Only includes Two-Star plays (≥90% catch probability) — where elite instincts matter most.
 
 # %%
-oj_path = os.path.join(DATASET_DIR, "outfield_jump_2024_2025.csv")
-if os.path.exists(oj_path) and os.path.getsize(oj_path) > 10:
-    df_oj = pd.read_csv(oj_path)
-else:
-    try:
-        from pybaseball import statcast_outfielder_jump
-        frames = []
-        for y in YEARS:
-            df_tmp = statcast_outfielder_jump(y)
-            df_tmp = coerce_numeric(df_tmp)
-            if "year" not in df_tmp.columns:
-                df_tmp["year"] = y
-            frames.append(df_tmp)
-            time.sleep(1)
-        df_oj = pd.concat(frames, ignore_index=True)
-    except Exception as e:
-        print(f"outfield_jump: skipped ({e})")
-        df_oj = pd.DataFrame()
-
-df_oj = coerce_numeric(df_oj)
+df_oj = resolve("outfield_jump")
 print(f"Outfield Jump: {len(df_oj)} outfielder-seasons, columns: {list(df_oj.columns[:8])}")
 df_oj.head()
 
 # %%
 oj_year_col = "year" if "year" in df_oj.columns else "Year"
 oj25 = df_oj[df_oj[oj_year_col] == YEAR].copy()
-oj_name_col = "player_name" if "player_name" in oj25.columns else df_oj.columns[0]
+oj_name_col = name_column(oj25)
 
 fig, axes = plt.subplots(1, 2, figsize=(16, 7))
 
@@ -257,18 +478,7 @@ if len(available) >= 2:
 # FanGraphs park factors — 100 = neutral, >100 = hitter-friendly, <100 = pitcher-friendly.
 
 # %%
-pf_path = os.path.join(DATASET_DIR, "park_factors_2024_2025.csv")
-if os.path.exists(pf_path) and os.path.getsize(pf_path) > 10:
-    df_pf = pd.read_csv(pf_path)
-else:
-    try:
-        from savant_extras import park_factors_range
-        df_pf = park_factors_range(2024, 2025)
-    except Exception as e:
-        print(f"park_factors: skipped ({e})")
-        df_pf = pd.DataFrame()
-
-df_pf = coerce_numeric(df_pf)
+df_pf = resolve("park_factors")
 print(f"Park Factors: {len(df_pf)} team-seasons")
 df_pf.head()
 
@@ -337,30 +547,7 @@ if len(df_pf) > 0 and "season" in df_pf.columns and len(df_pf[df_pf["season"] ==
 # 100 = MLB average. Available via pybaseball's fg_pitching_data().
 
 # %%
-pq_path = os.path.join(DATASET_DIR, "pitcher_quality_2024_2025.csv")
-if os.path.exists(pq_path) and os.path.getsize(pq_path) > 10:
-    df_pq = pd.read_csv(pq_path)
-else:
-    try:
-        from pybaseball import fg_pitching_data
-        _PQ_COLS = ["Name", "Team", "Age", "IP", "Stuff+", "Location+", "Pitching+"]
-        _PQ_RENAME = {"Name": "name", "Team": "team", "Age": "age", "IP": "ip",
-                      "Stuff+": "stuff_plus", "Location+": "location_plus", "Pitching+": "pitching_plus"}
-        frames = []
-        for y in YEARS:
-            df_tmp = fg_pitching_data(y, qual=0)
-            avail = [c for c in _PQ_COLS if c in df_tmp.columns]
-            df_tmp = df_tmp[avail].rename(columns=_PQ_RENAME).copy()
-            df_tmp = coerce_numeric(df_tmp)
-            df_tmp["season"] = y
-            frames.append(df_tmp)
-            time.sleep(1.5)
-        df_pq = pd.concat(frames, ignore_index=True)
-    except Exception as e:
-        print(f"pitcher_quality: skipped ({e})")
-        df_pq = pd.DataFrame()
-
-df_pq = coerce_numeric(df_pq)
+df_pq = resolve("pitcher_quality")
 print(f"Pitcher Quality: {len(df_pq)} pitcher-seasons")
 df_pq.head()
 
@@ -459,6 +646,16 @@ if len(df_pq[df_pq[pq_season_col] == 2024]) > 0 and "mlbam_id" in df_pq.columns:
     plt.tight_layout()
     plt.show()
 
+# %% [markdown]
+# ---
+# ## Load Times
+# Each leaderboard was loaded once from its first available source; asking again is served from memory.
+
+# %%
+for name in DATASETS:
+    resolve(name)
+load_report()
+
 # %% [markdown]
 # ---
 # ## Summary
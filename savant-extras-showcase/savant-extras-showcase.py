@@ -20,7 +20,17 @@ import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
 import seaborn as sns
 import warnings
+import hashlib
+import json
+import os
+import pathlib
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+from functools import wraps
+from itertools import zip_longest
 
 sns.set_theme(style="whitegrid")
 warnings.filterwarnings("ignore")
@@ -29,27 +39,295 @@ YEARS = [2024, 2025]
 YEAR = 2025   # used for single-year visualizations
 TOP_N = 20    # top N players for bar charts
 
-def coerce_numeric(df):
-    """Convert columns that look numeric but are stored as object dtype."""
-    for col in df.columns:
-        if df[col].dtype == object:
-            converted = pd.to_numeric(df[col], errors="coerce")
-            if converted.notna().sum() > df[col].notna().sum() * 0.5:
-                df[col] = converted
+# --- On-disk response cache ---------------------------------------------------
+# Every leaderboard call goes through cached_call(), which stores the returned
+# DataFrame under CACHE_DIR keyed by a hash of (function, args, kwargs).
+# Finished seasons never expire; calls touching the current season expire after
+# CACHE_TTL_CURRENT seconds (overridable per leaderboard in CACHE_TTL). When the
+# network fails, a stale entry is used instead, so reruns also work offline.
+# An entry's mtime is its write time and drives the TTL; every read bumps its
+# atime, and the least recently used entries are evicted beyond CACHE_MAX_MB.
+CACHE_DIR = pathlib.Path(os.environ.get("SAVANT_CACHE_DIR", "~/.cache/savant-extras-notebooks")).expanduser()
+CACHE_MAX_MB = 500
+CACHE_TTL_CURRENT = 24 * 3600
+CACHE_TTL = {"park_factors_range": 7 * 24 * 3600}
+CURRENT_SEASON = date.today().year
+
+def _cache_key(fn, args, kwargs):
+    payload = json.dumps([fn.__module__, fn.__qualname__, [repr(a) for a in args],
+                          sorted((k, repr(v)) for k, v in kwargs.items())])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def _cache_ttl(fn, args, kwargs):
+    """None (never expires) if every season in the call is finished."""
+    years = [int(str(v)[:4]) for v in (*args, *kwargs.values())
+             if re.fullmatch(r"\d{4}(-\d{2}-\d{2})?", str(v))]
+    if years and max(years) < CURRENT_SEASON:
+        return None
+    return CACHE_TTL.get(fn.__name__, CACHE_TTL_CURRENT)
+
+_CACHE_LOCK = threading.Lock()  # cached_call may run on worker threads
+
+def _read_cache(path):
+    """Load an entry and mark it used (atime); None if it was evicted meanwhile."""
+    try:
+        df = pd.read_pickle(path)
+        os.utime(path, (time.time(), path.stat().st_mtime))
+    except FileNotFoundError:
+        return None
     return df
 
-def fetch_years(fn, year_col="year", sleep_sec=1.0, **kwargs):
-    """Call fn(year, **kwargs) for each year in YEARS and concatenate."""
-    frames = []
-    for i, y in enumerate(YEARS):
-        if i > 0:
-            time.sleep(sleep_sec)
-        df = fn(y, **kwargs)
-        df = coerce_numeric(df)
-        if year_col not in df.columns:
-            df[year_col] = y
-        frames.append(df)
-    return pd.concat(frames, ignore_index=True)
+def _evict_cache():
+    with _CACHE_LOCK:
+        entries = []
+        for p in CACHE_DIR.glob("*.pkl"):
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_atime, st.st_size, p))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        for _, size, p in entries:
+            if total <= CACHE_MAX_MB * 1024**2:
+                break
+            p.unlink(missing_ok=True)
+            total -= size
+
+def cached_call(fn, *args, **kwargs):
+    """Return (fn(*args, **kwargs), from_cache), served from CACHE_DIR when fresh."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = CACHE_DIR / f"{_cache_key(fn, args, kwargs)}.pkl"
+    if path.exists():
+        ttl = _cache_ttl(fn, args, kwargs)
+        if ttl is None or time.time() - path.stat().st_mtime < ttl:
+            df = _read_cache(path)
+            if df is not None:
+                return df, True
+    try:
+        df = fn(*args, **kwargs)
+    except Exception:
+        stale = _read_cache(path) if path.exists() else None
+        if stale is not None:
+            print(f"  {fn.__name__}{args}: network failed, using stale cache")
+            return stale, True
+        raise
+    tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    df.to_pickle(tmp)
+    os.replace(tmp, path)
+    _evict_cache()
+    return df, False
+
+# --- Column schemas -------------------------------------------------------------
+# Leaderboards often arrive with numeric columns stored as text, and a column can
+# be numeric in one season's frame and text in the next. parse_numeric() decides
+# once per leaderboard, from an evenly spaced sample of rows, which columns are
+# numeric, and saves that schema as JSON under SCHEMA_DIR. Later loads reuse it
+# (memoized in _SCHEMAS) and convert only those columns. A column is inferred
+# again only when it is new, or arrives as text without being marked numeric.
+SCHEMA_DIR = CACHE_DIR / "schemas"
+SCHEMA_SAMPLE_ROWS = 500
+_SCHEMAS = {}
+
+def _is_text(s):
+    return s.dtype == object or isinstance(s.dtype, pd.StringDtype)
+
+def infer_schema(df, columns=None, sample_rows=SCHEMA_SAMPLE_ROWS):
+    """{column: "numeric"} for numeric or mostly-numeric text columns, else {column: "other"}."""
+    sample = df.iloc[::max(1, len(df) // sample_rows)]
+    schema = {}
+    for col in df.columns if columns is None else columns:
+        s = sample[col]
+        numeric = pd.api.types.is_numeric_dtype(s.dtype) and s.dtype != bool
+        if not numeric and _is_text(s):
+            numeric = pd.to_numeric(s, errors="coerce").notna().sum() > s.notna().sum() * 0.5
+        schema[col] = "numeric" if numeric else "other"
+    return schema
+
+def load_schema(name, df):
+    """Schema for leaderboard name: memoized, else read from SCHEMA_DIR; stale columns re-inferred."""
+    schema = _SCHEMAS.get(name)
+    path = SCHEMA_DIR / f"{name}.json"
+    if schema is None and path.exists():
+        schema = json.loads(path.read_text())
+    schema = dict(schema or {})
+    stale = [c for c in df.columns if c not in schema or (schema[c] != "numeric" and _is_text(df[c]))]
+    changed = {c: k for c, k in infer_schema(df, stale).items() if schema.get(c) != k} if stale else {}
+    if changed:
+        schema.update(changed)
+        SCHEMA_DIR.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(schema, indent=1))
+    _SCHEMAS[name] = schema
+    return schema
+
+def parse_numeric(df, name):
+    """Convert df's numeric text columns in one pass, using leaderboard name's schema."""
+    if df.empty:
+        return df
+    schema = load_schema(name, df)
+    cols = [c for c in df.columns if schema[c] == "numeric" and _is_text(df[c])]
+    if cols:
+        df[cols] = df[cols].apply(pd.to_numeric, errors="coerce")
+    return df
+
+# --- Concurrent fetch orchestrator ---------------------------------------------
+# fetch_all() expands every leaderboard job into one call per season and runs
+# all calls on a thread pool. A call that misses the cache first takes a token
+# from its host's bucket, so Baseball Savant and FanGraphs are rate-limited
+# separately and the total time approaches the slower host's rate-limited
+# share instead of the sum of all calls.
+HOST_LIMITS = {"savant": (1.0, 2), "fangraphs": (1 / 1.5, 1)}  # (requests/sec, burst)
+FANGRAPHS_FUNCTIONS = {"park_factors_range", "fg_pitching_data"}
+FETCH_WORKERS = 8
+
+class TokenBucket:
+    """Thread-safe token bucket: rate tokens per second, bursts up to capacity."""
+
+    def __init__(self, rate, capacity=1):
+        self.rate, self.capacity = rate, capacity
+        self._tokens, self._updated = float(capacity), time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available; returns the seconds spent waiting."""
+        t0 = time.monotonic()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return now - t0
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+def _host(fn):
+    return "fangraphs" if fn.__name__ in FANGRAPHS_FUNCTIONS else "savant"
+
+def _rate_limited(fn, bucket, waits):
+    # wraps() keeps __module__ / __qualname__, so cache keys stay the same
+    @wraps(fn)
+    def call(*args, **kwargs):
+        waits.append(bucket.acquire())
+        return fn(*args, **kwargs)
+    return call
+
+def leaderboard_job(name, fn, years=None, year_args=lambda y: (y,), year_col="year",
+                    post=None, optional=False, **kwargs):
+    """One leaderboard: fn(*year_args(y), **kwargs) for each y in years (default YEARS).
+
+    post reshapes each season's frame; year_col (if not None) is added when
+    missing. Failed seasons of an optional job are skipped, not raised.
+    """
+    return {"name": name, "fn": fn, "years": YEARS if years is None else years,
+            "year_args": year_args, "year_col": year_col, "post": post,
+            "optional": optional, "kwargs": kwargs}
+
+def fetch_all(jobs, workers=FETCH_WORKERS):
+    """Fetch every job's seasons concurrently; returns {name: DataFrame} in job order."""
+    buckets = {host: TokenBucket(rate, burst) for host, (rate, burst) in HOST_LIMITS.items()}
+    # Interleave hosts so the slower one is not queued behind the other
+    by_host = {}
+    for job in jobs:
+        for y in job["years"]:
+            by_host.setdefault(_host(job["fn"]), []).append((job, y))
+    calls = [c for group in zip_longest(*by_host.values()) for c in group if c is not None]
+
+    def run(job, y):
+        waits = []
+        t0 = time.perf_counter()
+        df, from_cache = cached_call(_rate_limited(job["fn"], buckets[_host(job["fn"])], waits),
+                                     *job["year_args"](y), **job["kwargs"])
+        return df, from_cache, time.perf_counter() - t0 - sum(waits)
+
+    t0 = time.perf_counter()
+    results, errors = {}, {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run, job, y): (job["name"], y) for job, y in calls}
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as e:
+                errors[futures[future]] = e
+    wall = time.perf_counter() - t0
+
+    out = {}
+    for job in jobs:
+        frames = []
+        for y in job["years"]:
+            key = (job["name"], y)
+            if key in errors:
+                if not job["optional"]:
+                    raise errors[key]
+                print(f"{job['name']} {y or ''}: skipped ({errors[key]})")
+                continue
+            df = results[key][0]
+            if job["post"] is not None:
+                df = job["post"](df)
+            if job["year_col"] and job["year_col"] not in df.columns:
+                df[job["year_col"]] = y
+            frames.append(df)
+        df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        out[job["name"]] = parse_numeric(df, job["name"])
+
+    n_network = sum(not from_cache for _, from_cache, _ in results.values())
+    serial = sum(seconds for _, _, seconds in results.values())
+    print(f"Fetched {len(calls)} calls ({n_network} from the network) in {wall:.1f}s "
+          f"({serial:.1f}s of request time)")
+    return out
+
+# %% [markdown]
+# ---
+# ## Fetch All Leaderboards
+# Every leaderboard and season is requested at once; Baseball Savant and FanGraphs each get their own rate limit.
+
+# %%
+from savant_extras import (
+    arm_strength, baserunning, basestealing, bat_tracking, batted_ball, catcher_blocking,
+    catcher_stance, catcher_throwing, home_runs, park_factors_range, pitch_movement,
+    pitch_tempo, pitcher_arm_angle, running_game, swing_take, timer_infractions, year_to_year,
+)
+from pybaseball import fg_pitching_data, statcast_outfielder_jump, statcast_outs_above_average
+
+def _oaa(year, **_):
+    return statcast_outs_above_average(year, 'all')
+
+_PQ_COLS = ["Name", "Team", "Age", "IP", "Stuff+", "Location+", "Pitching+"]
+_PQ_RENAME = {"Name": "name", "Team": "team", "Age": "age", "IP": "ip",
+              "Stuff+": "stuff_plus", "Location+": "location_plus", "Pitching+": "pitching_plus"}
+
+def _pitcher_quality(df):
+    avail = [c for c in _PQ_COLS if c in df.columns]
+    return df[avail].rename(columns=_PQ_RENAME).copy()
+
+LEADERBOARD_JOBS = [
+    leaderboard_job("bat_tracking", bat_tracking,
+                    year_args=lambda y: (f"{y}-04-01", f"{y}-09-30"), min_swings=100),
+    leaderboard_job("pitch_tempo", pitch_tempo),
+    leaderboard_job("arm_strength", arm_strength, min_throws=50),
+    leaderboard_job("batted_ball", batted_ball),
+    leaderboard_job("home_runs", home_runs),
+    leaderboard_job("pitch_movement", pitch_movement),
+    leaderboard_job("swing_take", swing_take),
+    leaderboard_job("pitcher_arm_angle", pitcher_arm_angle),
+    leaderboard_job("running_game", running_game),
+    leaderboard_job("catcher_blocking", catcher_blocking),
+    leaderboard_job("catcher_throwing", catcher_throwing),
+    leaderboard_job("catcher_stance", catcher_stance),
+    leaderboard_job("baserunning", baserunning),
+    leaderboard_job("basestealing", basestealing),
+    leaderboard_job("timer_infractions", timer_infractions),
+    leaderboard_job("year_to_year", year_to_year),
+    leaderboard_job("park_factors", park_factors_range, years=[None],
+                    year_args=lambda _: (YEARS[0], YEARS[-1]), year_col=None, optional=True),
+    leaderboard_job("outs_above_average", _oaa),
+    leaderboard_job("outfield_jump", statcast_outfielder_jump),
+    leaderboard_job("pitcher_quality", fg_pitching_data, year_col="season",
+                    post=_pitcher_quality, optional=True, qual=0),
+]
+
+leaderboards = fetch_all(LEADERBOARD_JOBS)
 
 # %% [markdown]
 # ---
@@ -57,15 +335,7 @@ def fetch_years(fn, year_col="year", sleep_sec=1.0, **kwargs):
 # Bat speed, attack angle, swing tilt — with custom date ranges.
 
 # %%
-from savant_extras import bat_tracking
-
-bat_frames = []
-for y in YEARS:
-    df_tmp = bat_tracking(f"{y}-04-01", f"{y}-09-30", min_swings=100)
-    df_tmp = coerce_numeric(df_tmp)
-    df_tmp["year"] = y
-    bat_frames.append(df_tmp)
-df_bat = pd.concat(bat_frames, ignore_index=True)
+df_bat = leaderboards["bat_tracking"]
 print(f"Bat Tracking: {len(df_bat)} player-seasons")
 df_bat.head()
 
@@ -94,9 +364,7 @@ plt.show()
 # Pace metrics — median seconds between pitches, hot/warm/cold frequency.
 
 # %%
-from savant_extras import pitch_tempo
-
-df_tempo = fetch_years(pitch_tempo)
+df_tempo = leaderboards["pitch_tempo"]
 print(f"Pitch Tempo: {len(df_tempo)} pitcher-seasons")
 df_tempo.head()
 
@@ -125,9 +393,7 @@ plt.show()
 # Fielder throw speed by position.
 
 # %%
-from savant_extras import arm_strength
-
-df_arm = fetch_years(arm_strength, min_throws=50)
+df_arm = leaderboards["arm_strength"]
 print(f"Arm Strength: {len(df_arm)} fielder-seasons")
 df_arm.head()
 
@@ -158,9 +424,7 @@ plt.show()
 # Ground ball, fly ball, line drive rates and pull/oppo splits.
 
 # %%
-from savant_extras import batted_ball
-
-df_bb = fetch_years(batted_ball)
+df_bb = leaderboards["batted_ball"]
 print(f"Batted Ball: {len(df_bb)} batter-seasons")
 df_bb.head()
 
@@ -187,9 +451,7 @@ plt.show()
 # HR distance, exit velocity, expected HR, no-doubters.
 
 # %%
-from savant_extras import home_runs
-
-df_hr = fetch_years(home_runs)
+df_hr = leaderboards["home_runs"]
 print(f"Home Runs: {len(df_hr)} batter-seasons")
 df_hr.head()
 
@@ -220,9 +482,7 @@ plt.show()
 # Horizontal and vertical break by pitch type.
 
 # %%
-from savant_extras import pitch_movement
-
-df_pm = fetch_years(pitch_movement)
+df_pm = leaderboards["pitch_movement"]
 print(f"Pitch Movement: {len(df_pm)} pitcher-pitch-season combos")
 df_pm.head()
 
@@ -253,10 +513,7 @@ plt.show()
 # Run values by zone: heart, shadow, chase, waste.
 
 # %%
-from savant_extras import swing_take
-
-df_st = fetch_years(swing_take)
-df_st = coerce_numeric(df_st)
+df_st = leaderboards["swing_take"]
 print(f"Swing & Take: {len(df_st)} batter-seasons")
 df_st.head()
 
@@ -281,9 +538,7 @@ else:
 # Release point angles and positions.
 
 # %%
-from savant_extras import pitcher_arm_angle
-
-df_angle = fetch_years(pitcher_arm_angle)
+df_angle = leaderboards["pitcher_arm_angle"]
 print(f"Pitcher Arm Angle: {len(df_angle)} pitcher-seasons")
 df_angle.head()
 
@@ -303,9 +558,7 @@ plt.show()
 # Pitcher's ability to control the running game.
 
 # %%
-from savant_extras import running_game
-
-df_rg = fetch_years(running_game)
+df_rg = leaderboards["running_game"]
 print(f"Running Game: {len(df_rg)} pitcher-seasons")
 df_rg.head()
 
@@ -326,9 +579,7 @@ plt.show()
 # Blocks above average, PB/WP prevention.
 
 # %%
-from savant_extras import catcher_blocking
-
-df_cb = fetch_years(catcher_blocking)
+df_cb = leaderboards["catcher_blocking"]
 print(f"Catcher Blocking: {len(df_cb)} catcher-seasons")
 df_cb.head()
 
@@ -349,9 +600,7 @@ plt.show()
 # Pop time, exchange time, CS rate, arm strength.
 
 # %%
-from savant_extras import catcher_throwing
-
-df_ct = fetch_years(catcher_throwing)
+df_ct = leaderboards["catcher_throwing"]
 print(f"Catcher Throwing: {len(df_ct)} catcher-seasons")
 df_ct.head()
 
@@ -382,9 +631,7 @@ plt.show()
 # One-knee vs traditional stance: framing, blocking, throwing impact.
 
 # %%
-from savant_extras import catcher_stance
-
-df_cs = fetch_years(catcher_stance)
+df_cs = leaderboards["catcher_stance"]
 print(f"Catcher Stance: {len(df_cs)} catcher-seasons")
 df_cs.head()
 
@@ -404,9 +651,7 @@ plt.show()
 # Total baserunning value (extra bases + stolen bases).
 
 # %%
-from savant_extras import baserunning
-
-df_br = fetch_years(baserunning)
+df_br = leaderboards["baserunning"]
 print(f"Baserunning: {len(df_br)} runner-seasons")
 df_br.head()
 
@@ -427,9 +672,7 @@ plt.show()
 # Stolen base run value, success rate, lead distances.
 
 # %%
-from savant_extras import basestealing
-
-df_bs = fetch_years(basestealing)
+df_bs = leaderboards["basestealing"]
 print(f"Basestealing: {len(df_bs)} runner-seasons")
 df_bs.head()
 
@@ -450,9 +693,7 @@ plt.show()
 # Pitch clock violations by type.
 
 # %%
-from savant_extras import timer_infractions
-
-df_ti = fetch_years(timer_infractions)
+df_ti = leaderboards["timer_infractions"]
 print(f"Timer Infractions: {len(df_ti)} player-seasons")
 df_ti.head()
 
@@ -485,9 +726,7 @@ plt.show()
 # xwOBA changes across seasons.
 
 # %%
-from savant_extras import year_to_year
-
-df_yty = fetch_years(year_to_year)
+df_yty = leaderboards["year_to_year"]
 print(f"Year to Year: {len(df_yty)} batter-seasons")
 df_yty.head()
 
@@ -510,15 +749,9 @@ if delta_col in df_yty.columns:
 # Per-team park factors for runs, HR, 1B/2B/3B, SO, BB, FIP. 100 = neutral.
 
 # %%
-from savant_extras import park_factors_range
-
-try:
-    df_pf = park_factors_range(YEARS[0], YEARS[-1])
-    print(f"Park Factors: {len(df_pf)} team-seasons")
-    df_pf.head()
-except Exception as e:
-    print(f"park_factors: skipped ({e})")
-    df_pf = pd.DataFrame()
+df_pf = leaderboards["park_factors"]
+print(f"Park Factors: {len(df_pf)} team-seasons")
+df_pf.head()
 
 # %%
 if not df_pf.empty:
@@ -549,12 +782,7 @@ else:
 # Defensive runs saved vs expected, with directional breakdowns.
 
 # %%
-from pybaseball import statcast_outs_above_average
-
-def _oaa(year, **_):
-    return statcast_outs_above_average(year, 'all')
-
-df_oaa = fetch_years(_oaa, year_col="year")
+df_oaa = leaderboards["outs_above_average"]
 print(f"Outs Above Average: {len(df_oaa)} fielder-seasons")
 df_oaa.head()
 
@@ -587,9 +815,7 @@ plt.show()
 # First-step reaction and routing efficiency for outfielders (2-star plays only).
 
 # %%
-from pybaseball import statcast_outfielder_jump
-
-df_oj = fetch_years(statcast_outfielder_jump, year_col="year")
+df_oj = leaderboards["outfield_jump"]
 print(f"Outfield Jump: {len(df_oj)} outfielder-seasons")
 df_oj.head()
 
@@ -625,25 +851,7 @@ plt.show()
 # Model-based pitcher quality metrics. 100 = MLB average.
 
 # %%
-from pybaseball import fg_pitching_data
-
-_PQ_COLS = ["Name", "Team", "Age", "IP", "Stuff+", "Location+", "Pitching+"]
-_PQ_RENAME = {"Name": "name", "Team": "team", "Age": "age", "IP": "ip",
-              "Stuff+": "stuff_plus", "Location+": "location_plus", "Pitching+": "pitching_plus"}
-pq_frames = []
-for y in YEARS:
-    try:
-        df_tmp = fg_pitching_data(y, qual=0)
-        avail = [c for c in _PQ_COLS if c in df_tmp.columns]
-        df_tmp = df_tmp[avail].rename(columns=_PQ_RENAME).copy()
-        df_tmp = coerce_numeric(df_tmp)
-        df_tmp["season"] = y
-        pq_frames.append(df_tmp)
-        print(f"pitcher_quality {y}: {len(df_tmp)} pitchers")
-    except Exception as e:
-        print(f"pitcher_quality {y}: skipped ({e})")
-    time.sleep(1.5)
-df_pq = pd.concat(pq_frames, ignore_index=True) if pq_frames else pd.DataFrame()
+df_pq = leaderboards["pitcher_quality"]
 print(f"Pitcher Quality total: {len(df_pq)} pitcher-seasons")
 df_pq.head()
 
@@ -674,16 +882,18 @@ else:
 
 # %% [markdown]
 # ---
-# ## Save All Data as CSV (2024–2025)
-# Export all leaderboards for the dataset. Files named `*_2024_2025.csv`.
+# ## Save All Data (2024–2025)
+# Export all leaderboards for the dataset. Files named `*_2024_2025.csv`, plus a columnar bundle:
+# one `*_2024_2025.parquet` per leaderboard and a `manifest.json` with row counts, column types and key columns.
 
 # %%
-import os
+import pyarrow.parquet as pq
+
 output_dir = "savant_extras_2024_2025"
 os.makedirs(output_dir, exist_ok=True)
 
 # park_factors uses "season" column; pitcher_quality uses "season" column
-# all others have "year" column added by fetch_years()
+# all others have "year" column added by fetch_all()
 datasets = {
     "bat_tracking":       df_bat,
     "pitch_tempo":        df_tempo,
@@ -714,6 +924,51 @@ for name, df in datasets.items():
 
 print(f"\nTotal: {len(datasets)} CSV files saved to {output_dir}/")
 
+# %%
+# --- Parquet bundle ---
+# Typed columns need no parsing on load, and readers can select columns
+# (pd.read_parquet(path, columns=[...])). manifest.json lists every leaderboard's
+# file, row count, Arrow column types and key columns, so a reader can plan
+# which columns to load without opening the files.
+BUNDLE_COMPRESSION = "zstd"
+KEY_CANDIDATES = ["player_id", "entity_id", "mlbam_id", "pitcher_id", "batter_id", "id", "team", "name"]
+
+def key_columns(df):
+    """First id-like column plus the season column, e.g. ["player_id", "year"]."""
+    ids = [c for c in KEY_CANDIDATES if c in df.columns][:1]
+    period = [c for c in ("year", "season") if c in df.columns][:1]
+    return ids + period
+
+def write_bundle(datasets, out_dir, suffix="_2024_2025"):
+    """Write each leaderboard to Parquet plus out_dir/manifest.json; returns the manifest."""
+    manifest = {"format": "parquet", "compression": BUNDLE_COMPRESSION, "leaderboards": {}}
+    for name, df in datasets.items():
+        df = df.copy()
+        mixed = df.columns[df.dtypes == object]  # leftover mixed text/number columns
+        df[mixed] = df[mixed].astype("string")
+        file = f"{name}{suffix}.parquet"
+        path = os.path.join(out_dir, file)
+        df.to_parquet(path, index=False, compression=BUNDLE_COMPRESSION)
+        keys = key_columns(df)
+        manifest["leaderboards"][name] = {
+            "file": file,
+            "rows": len(df),
+            "columns": {field.name: str(field.type) for field in pq.read_schema(path)},
+            "key_columns": keys,
+            "key_unique": bool(keys) and not df.duplicated(keys).any(),
+        }
+    with open(os.path.join(out_dir, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=1)
+    return manifest
+
+manifest = write_bundle(datasets, output_dir)
+parquet_mb = sum(os.path.getsize(os.path.join(output_dir, m["file"]))
+                 for m in manifest["leaderboards"].values()) / 1024**2
+csv_mb = sum(os.path.getsize(os.path.join(output_dir, f"{name}_2024_2025.csv"))
+             for name in datasets) / 1024**2
+print(f"Parquet bundle: {len(manifest['leaderboards'])} files + manifest.json "
+      f"({parquet_mb:.1f} MB vs {csv_mb:.1f} MB of CSV)")
+
 # %% [markdown]
 # ---
 # ## Summary
@@ -0,0 +1,19 @@
+"""Shared helpers for the pitch-level Statcast dataset builds.
+
+Modules:
+  fetch       -- date-window splitting and resumable, partitioned Statcast fetching
+  parquet     -- game_year/month partitioned Parquet output and pruned reads
+  schema      -- versioned compact dtype schema (category / float32 / Int32)
+  csv_stream  -- chunk-by-chunk CSV writer that unifies columns across chunks
+  scheduler   -- bounded thread pool with a shared token-bucket rate limiter and retries
+  cache       -- on-disk pickle cache of leaderboard calls with season-aware TTL and LRU eviction
+  incremental -- game_date watermark refresh with (game_pk, at_bat_number, pitch_number) dedup
+  capacity    -- stratified-sample projection of rows, sizes and fetch time
+  loader      -- column-projected, predicate-filtered reads of the CSV or Parquet dataset
+  cube        -- batter x pitch_type x season x month aggregate cube with mergeable stats
+  binning     -- fixed-edge 2D count / sum / mean grids via np.bincount, updatable per chunk
+  moments     -- one-pass pairwise co-moment accumulators for correlation matrices and OLS fits
+
+The generate scripts add the repository root to ``sys.path`` and import
+from here, e.g. ``from statcast_tools.fetch import season_windows``.
+"""
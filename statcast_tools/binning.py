@@ -0,0 +1,85 @@
+"""Fixed-edge 2D binned statistics with chunk-updatable accumulators.
+
+Points are mapped to integer bin codes on fixed edges and reduced with
+``np.bincount`` into count and sum grids (mean = sum / count). Grids from
+separate chunks simply add, so a heatmap over the full dataset can be built
+one chunk at a time without keeping the raw points around.
+
+Points with a NaN coordinate or value, or outside the edges, are skipped.
+As with ``np.histogram``, bins are half-open except the last, which also
+includes its right edge.
+
+Usage:
+  grid = Binned2D(np.linspace(-30, 60, 21), np.linspace(-60, 60, 21))
+  for chunk in chunks:
+      grid.update(chunk["attack_angle"], chunk["attack_direction"], chunk["bat_speed"])
+  sns.heatmap(grid.frame("mean"))
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def _codes(values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """Bin index of every value, -1 outside the edges."""
+    codes = np.searchsorted(edges, values, side="right") - 1
+    codes[values == edges[-1]] = len(edges) - 2
+    codes[(codes < 0) | (codes >= len(edges) - 1)] = -1
+    return codes
+
+
+class Binned2D:
+    """Count and sum accumulators on an (x_edges, y_edges) grid; x is the first axis."""
+
+    def __init__(self, x_edges, y_edges):
+        self.x_edges = np.asarray(x_edges, dtype="float64")
+        self.y_edges = np.asarray(y_edges, dtype="float64")
+        self.shape = (len(self.x_edges) - 1, len(self.y_edges) - 1)
+        self.count = np.zeros(self.shape, dtype="int64")
+        self.sum = np.zeros(self.shape, dtype="float64")
+
+    def update(self, x, y, values=None) -> "Binned2D":
+        """Add one chunk of points (and values to average, if given)."""
+        x = np.asarray(x, dtype="float64")
+        y = np.asarray(y, dtype="float64")
+        v = None if values is None else np.asarray(values, dtype="float64")
+        ix, iy = _codes(x, self.x_edges), _codes(y, self.y_edges)
+        keep = (ix >= 0) & (iy >= 0)
+        if v is not None:
+            keep &= ~np.isnan(v)
+        flat = ix[keep] * self.shape[1] + iy[keep]
+        size = self.shape[0] * self.shape[1]
+        self.count += np.bincount(flat, minlength=size).reshape(self.shape)
+        if v is not None:
+            self.sum += np.bincount(flat, weights=v[keep], minlength=size).reshape(self.shape)
+        return self
+
+    def merge(self, other: "Binned2D") -> "Binned2D":
+        """Add another grid built on the same edges."""
+        if not (np.array_equal(self.x_edges, other.x_edges)
+                and np.array_equal(self.y_edges, other.y_edges)):
+            raise ValueError("cannot merge grids with different edges")
+        self.count += other.count
+        self.sum += other.sum
+        return self
+
+    @property
+    def mean(self) -> np.ndarray:
+        """sum / count, NaN for empty bins."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.count > 0, self.sum / self.count, np.nan)
+
+    def frame(self, stat: str = "mean", decimals: int = 1) -> pd.DataFrame:
+        """Grid as a DataFrame indexed by x intervals with y interval columns."""
+        data = {"count": self.count, "sum": self.sum, "mean": self.mean}[stat]
+        return pd.DataFrame(
+            data,
+            index=pd.IntervalIndex.from_breaks(np.round(self.x_edges, decimals)),
+            columns=pd.IntervalIndex.from_breaks(np.round(self.y_edges, decimals)),
+        )
+
+
+def edges_for(values, bins: int) -> np.ndarray:
+    """``bins`` equal-width bins spanning the finite range of values."""
+    values = np.asarray(values, dtype="float64")
+    return np.linspace(np.nanmin(values), np.nanmax(values), bins + 1)
@@ -0,0 +1,113 @@
+"""On-disk response cache for leaderboard fetches.
+
+ResponseCache.call(fn, *args, **kwargs) stores the returned DataFrame as a
+pickle under ``directory``, keyed by a hash of (function, args, kwargs).
+Finished seasons never expire; calls touching the current season expire
+after ``ttl_current`` seconds (overridable per function name in ``ttl``).
+When the call fails, a stale entry is used instead, so reruns also work
+offline.
+
+An entry's mtime is its write time and drives the TTL; every read bumps its
+atime. Once the directory exceeds ``max_mb`` the entries with the oldest
+atime (least recently used) are evicted first. Calls are thread-safe.
+
+Usage:
+  cache = ResponseCache("~/.cache/savant-extras-notebooks", ttl={"park_factors_range": 7 * 86400})
+  df, from_cache = cache.call(bat_tracking, "2025-04-01", "2025-09-30", min_swings=100)
+"""
+
+import datetime as dt
+import hashlib
+import json
+import os
+import pathlib
+import re
+import threading
+import time
+from typing import Callable
+
+import pandas as pd
+
+DEFAULT_TTL_CURRENT = 24 * 3600
+_SEASON_ARG = re.compile(r"\d{4}(-\d{2}-\d{2})?")
+
+
+def cache_key(fn: Callable, args: tuple, kwargs: dict) -> str:
+    """Stable hash of the function's module / qualname and its arguments."""
+    payload = json.dumps([fn.__module__, fn.__qualname__, [repr(a) for a in args],
+                          sorted((k, repr(v)) for k, v in kwargs.items())])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Pickle cache of fn(*args, **kwargs) results with TTL and LRU eviction."""
+
+    def __init__(self, directory, max_mb: float = 500, ttl_current: float = DEFAULT_TTL_CURRENT,
+                 ttl: dict[str, float] | None = None, current_season: int | None = None):
+        self.directory = pathlib.Path(directory).expanduser()
+        self.max_mb = max_mb
+        self.ttl_current = ttl_current
+        self.ttl = dict(ttl or {})
+        self.current_season = current_season or dt.date.today().year
+        self._lock = threading.Lock()
+
+    def path(self, fn: Callable, args: tuple = (), kwargs: dict | None = None) -> pathlib.Path:
+        return self.directory / f"{cache_key(fn, args, kwargs or {})}.pkl"
+
+    def ttl_for(self, fn: Callable, args: tuple, kwargs: dict) -> float | None:
+        """None (never expires) if every season in the call is finished."""
+        years = [int(str(v)[:4]) for v in (*args, *kwargs.values())
+                 if _SEASON_ARG.fullmatch(str(v))]
+        if years and max(years) < self.current_season:
+            return None
+        return self.ttl.get(fn.__name__, self.ttl_current)
+
+    def _read(self, path: pathlib.Path) -> pd.DataFrame | None:
+        """Load an entry and mark it used (atime); None if it was evicted meanwhile."""
+        try:
+            df = pd.read_pickle(path)
+            os.utime(path, (time.time(), path.stat().st_mtime))
+        except FileNotFoundError:
+            return None
+        return df
+
+    def _evict(self) -> None:
+        with self._lock:
+            entries = []
+            for p in self.directory.glob("*.pkl"):
+                try:
+                    st = p.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_atime, st.st_size, p))
+            entries.sort()
+            total = sum(size for _, size, _ in entries)
+            for _, size, p in entries:
+                if total <= self.max_mb * 1024**2:
+                    break
+                p.unlink(missing_ok=True)
+                total -= size
+
+    def call(self, fn: Callable, *args, **kwargs) -> tuple[pd.DataFrame, bool]:
+        """Return (fn(*args, **kwargs), from_cache), served from the cache when fresh."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(fn, args, kwargs)
+        if path.exists():
+            ttl = self.ttl_for(fn, args, kwargs)
+            if ttl is None or time.time() - path.stat().st_mtime < ttl:
+                df = self._read(path)
+                if df is not None:
+                    return df, True
+        try:
+            df = fn(*args, **kwargs)
+        except Exception:
+            stale = self._read(path) if path.exists() else None
+            if stale is not None:
+                print(f"  {fn.__name__}{args}: network failed, using stale cache")
+                return stale, True
+            raise
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        df.to_pickle(tmp)
+        os.replace(tmp, path)
+        self._evict()
+        return df, False
@@ -0,0 +1,133 @@
+"""Capacity planning for multi-season Statcast pulls.
+
+Samples a few days from every calendar month of each season (stratified
+sampling), fetches them, and projects the full pull from the per-month
+means: row count, in-memory size under the compact schema, on-disk size as
+CSV, gzip CSV and Parquet, and wall-clock fetch time at a given concurrency
+and rate limit.
+
+Usage:
+  sample = sample_days({2024: ("2024-03-20", "2024-09-29")}, days_per_stratum=1)
+  measured, df = fetch_sample(sample)
+  plan = project(measured, df, windows=52, workers=4, rate=1.0)
+"""
+
+import datetime as dt
+import io
+import random
+import time
+from typing import Callable
+
+import pandas as pd
+
+from statcast_tools.fetch import _to_date
+from statcast_tools.scheduler import TokenBucket, run_parallel
+from statcast_tools.schema import apply_schema, concat_compact, memory_mb
+
+
+def sample_days(seasons: dict, days_per_stratum: int = 1, seed: int = 0) -> pd.DataFrame:
+    """Pick days at random within every (season, month) stratum.
+
+    seasons maps season -> (start, end). Returns one row per sampled day with
+    the stratum key and the number of days in that stratum.
+    """
+    rng = random.Random(seed)
+    rows = []
+    for season, (start, end) in seasons.items():
+        start, end = _to_date(start), _to_date(end)
+        days = [start + dt.timedelta(days=i) for i in range((end - start).days + 1)]
+        by_month: dict[int, list[dt.date]] = {}
+        for day in days:
+            by_month.setdefault(day.month, []).append(day)
+        for month, month_days in sorted(by_month.items()):
+            for day in sorted(rng.sample(month_days, min(days_per_stratum, len(month_days)))):
+                rows.append({"season": season, "month": month, "day": day,
+                             "stratum_days": len(month_days)})
+    return pd.DataFrame(rows)
+
+
+def fetch_sample(sample: pd.DataFrame, fetch_fn: Callable[..., pd.DataFrame] | None = None,
+                 workers: int = 1, limiter: TokenBucket | None = None) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Fetch every sampled day; return (per-day measurements, combined compact frame).
+
+    Measurements hold rows, bat-tracking rows, request seconds and in-memory
+    size before (raw_mb) and after (compact_mb) the compact schema per day.
+    """
+    if fetch_fn is None:
+        from pybaseball import statcast as fetch_fn
+
+    def job(day):
+        t0 = time.perf_counter()
+        df = fetch_fn(start_dt=day.isoformat(), end_dt=day.isoformat())
+        return df, time.perf_counter() - t0
+
+    measured, frames = [], []
+    for day, result, error in run_parallel(list(sample["day"]), job, workers=workers,
+                                           limiter=limiter):
+        if error is not None:
+            raise RuntimeError(f"sample day {day} failed: {error}") from error
+        df, seconds = result
+        n = 0 if df is None else len(df)
+        bat = int(df["bat_speed"].notna().sum()) if n and "bat_speed" in df.columns else 0
+        raw_mb = compact_mb = 0.0
+        if n:
+            raw_mb = memory_mb(df)
+            df = apply_schema(df)
+            compact_mb = memory_mb(df)
+            frames.append(df)
+        measured.append({"day": day, "rows": n, "bat_tracking_rows": bat, "seconds": seconds,
+                         "raw_mb": raw_mb, "compact_mb": compact_mb})
+    measured = sample.merge(pd.DataFrame(measured), on="day")
+    return measured, concat_compact(frames)
+
+
+def _stratified_total(measured: pd.DataFrame, col: str) -> float:
+    """Sum over strata of (days in stratum) x (mean per sampled day)."""
+    per = measured.groupby(["season", "month"]).agg(mean=(col, "mean"), days=("stratum_days", "first"))
+    return float((per["mean"] * per["days"]).sum())
+
+
+def bytes_per_row(df: pd.DataFrame) -> dict[str, float]:
+    """Encoded size per row of df as CSV, gzip CSV and zstd Parquet."""
+    if df.empty:
+        return {"csv": 0.0, "csv_gzip": 0.0, "parquet": 0.0}
+    sizes = {}
+    buf = io.BytesIO()
+    df.to_csv(buf, index=False)
+    sizes["csv"] = buf.tell()
+    buf = io.BytesIO()
+    df.to_csv(buf, index=False, compression={"method": "gzip"})
+    sizes["csv_gzip"] = buf.tell()
+    buf = io.BytesIO()
+    df.to_parquet(buf, index=False, compression="zstd")
+    sizes["parquet"] = buf.tell()
+    return {k: v / len(df) for k, v in sizes.items()}
+
+
+def project(measured: pd.DataFrame, df: pd.DataFrame, windows: int,
+            workers: int = 4, rate: float = 1.0) -> dict:
+    """Project full-pull rows, sizes (MB) and fetch time (minutes).
+
+    Request time is projected like rows (sampled seconds per day, per month)
+    and spread over ``workers`` threads, but ``windows`` requests can never
+    go faster than ``rate`` requests per second.
+    """
+    rows = _stratified_total(measured, "rows")
+    bat_rows = _stratified_total(measured, "bat_tracking_rows")
+    per_row = bytes_per_row(df)
+    mem_per_row = float(memory_mb(df)) * 1024**2 / len(df) if len(df) else 0.0
+
+    request_seconds = _stratified_total(measured, "seconds")
+    wall = max(request_seconds / max(1, workers), windows / rate)
+
+    return {
+        "rows": rows,
+        "bat_tracking_rows": bat_rows,
+        "memory_mb": rows * mem_per_row / 1024**2,
+        "memory_raw_mb": _stratified_total(measured, "raw_mb"),
+        "csv_mb": rows * per_row["csv"] / 1024**2,
+        "csv_gzip_mb": rows * per_row["csv_gzip"] / 1024**2,
+        "parquet_mb": rows * per_row["parquet"] / 1024**2,
+        "fetch_minutes": wall / 60,
+        "fetch_minutes_sequential": request_seconds / 60,
+    }
@@ -0,0 +1,102 @@
+"""Streaming CSV writer for chunked Statcast output.
+
+Chunks are appended to the output as they arrive, so memory stays at one
+chunk no matter how many seasons are written. The header is written once.
+When a later chunk brings new columns (e.g. bat tracking fields added in a
+new season) they are appended to the end of the column list; chunks missing
+a known column get empty fields for it.
+
+Rows are written into segment files, one per column set. On close, a single
+segment is simply renamed into place; otherwise earlier segments are copied
+into the final file with empty fields for the columns they lack, streaming
+them back in chunks so memory stays flat.
+
+Usage:
+  with StreamingCSVWriter("statcast_bat_tracking_2024_2025.csv") as writer:
+      for chunk in chunks:
+          writer.write(chunk)
+"""
+
+import os
+import pathlib
+import shutil
+
+import pandas as pd
+
+REWRITE_CHUNKSIZE = 200_000
+
+
+class StreamingCSVWriter:
+    """Append DataFrame chunks to one CSV, unifying columns across chunks."""
+
+    def __init__(self, path):
+        self.path = pathlib.Path(path)
+        self.columns: list[str] = []
+        self.rows = 0
+        self._segments: list[tuple[pathlib.Path, list[str]]] = []
+
+    def __enter__(self) -> "StreamingCSVWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._cleanup()
+
+    def _new_segment(self) -> pathlib.Path:
+        seg = self.path.with_name(f"{self.path.name}.part{len(self._segments)}")
+        self._segments.append((seg, list(self.columns)))
+        return seg
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        """Append one chunk; starts a new segment if it adds columns."""
+        if chunk.empty:
+            return
+        new_cols = [c for c in chunk.columns if c not in self.columns]
+        if new_cols or not self._segments:
+            self.columns.extend(new_cols)
+            seg = self._new_segment()
+            header = True
+        else:
+            seg = self._segments[-1][0]
+            header = False
+        # A segment's first write truncates it, dropping any stale .partN a
+        # killed run left behind (its cleanup in __exit__ never ran)
+        chunk.reindex(columns=self.columns).to_csv(seg, mode="w" if header else "a",
+                                                   header=header, index=False)
+        self.rows += len(chunk)
+
+    def close(self) -> pathlib.Path:
+        """Assemble the segments into the final CSV and return its path."""
+        if not self._segments:
+            pd.DataFrame(columns=self.columns).to_csv(self.path, index=False)
+            return self.path
+        if len(self._segments) == 1:
+            os.replace(self._segments[0][0], self.path)
+            self._segments = []
+            return self.path
+
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w", newline="", encoding="utf-8") as out:
+            pd.DataFrame(columns=self.columns).to_csv(out, index=False)
+            for seg, cols in self._segments:
+                if cols == self.columns:
+                    with open(seg, "r", newline="", encoding="utf-8") as src:
+                        src.readline()  # skip segment header
+                        shutil.copyfileobj(src, out)
+                else:
+                    # Keep the original text exactly; only add empty fields
+                    reader = pd.read_csv(seg, dtype=str, keep_default_na=False,
+                                         chunksize=REWRITE_CHUNKSIZE)
+                    for part in reader:
+                        part.reindex(columns=self.columns, fill_value="").to_csv(
+                            out, header=False, index=False)
+        os.replace(tmp, self.path)
+        self._cleanup()
+        return self.path
+
+    def _cleanup(self) -> None:
+        for seg, _ in self._segments:
+            seg.unlink(missing_ok=True)
+        self._segments = []
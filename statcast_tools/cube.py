@@ -0,0 +1,128 @@
+"""Materialized aggregate cube for bat tracking leaderboards.
+
+Swings are aggregated once per (batter, player_name, pitch_type, game_year,
+month) cell into mergeable sufficient statistics for each value column:
+count, sum, sum of squares, min and max. Any coarser leaderboard (per
+player, per pitch type, per season, ...) is a rollup of the cube, which is a
+few thousand rows instead of the full swing table.
+
+Cubes built from separate chunks merge exactly (counts and sums add, min /
+max combine), so new data is folded in without rescanning the old. Months
+that were re-fetched are swapped in whole with ``replace_months``.
+
+Usage:
+  cube = build_cube(iter_statcast(path, CUBE_COLUMNS, [("bat_speed", "notna", None)]))
+  save_cube(cube, "statcast_bat_tracking_2024_2025_cube.parquet")
+  leaders = rollup(cube, ["player_name"], min_count=100)
+"""
+
+import pathlib
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+CUBE_KEYS = ["batter", "player_name", "pitch_type", "game_year", "month"]
+CUBE_VALUES = ["bat_speed", "swing_length"]
+CUBE_COLUMNS = ["game_date", "game_year", "batter", "player_name", "pitch_type"] + CUBE_VALUES
+STATS = ("count", "sum", "sumsq", "min", "max")
+
+
+def _stat_cols(values) -> list[str]:
+    return [f"{v}_{s}" for v in values for s in STATS]
+
+
+def _reduce(df: pd.DataFrame, keys: list[str], values) -> pd.DataFrame:
+    """Combine rows of partial cubes that share the same keys."""
+    how = {}
+    for v in values:
+        how.update({f"{v}_count": "sum", f"{v}_sum": "sum", f"{v}_sumsq": "sum",
+                    f"{v}_min": "min", f"{v}_max": "max"})
+    return df.groupby(keys, observed=True, dropna=False, sort=False).agg(how).reset_index()
+
+
+def chunk_cube(chunk: pd.DataFrame, values=CUBE_VALUES) -> pd.DataFrame:
+    """Aggregate one chunk of swings into cube cells."""
+    df = chunk[[k for k in CUBE_KEYS if k != "month"] + list(values)].copy()
+    df["month"] = pd.to_datetime(chunk["game_date"]).dt.month.astype("int8")
+    parts = {}
+    for v in values:
+        x = df[v].astype("float64")
+        parts[f"{v}_count"] = x.notna().astype("int64")
+        parts[f"{v}_sum"] = x.fillna(0.0)
+        parts[f"{v}_sumsq"] = (x * x).fillna(0.0)
+        parts[f"{v}_min"] = x
+        parts[f"{v}_max"] = x
+    cells = pd.concat([df[CUBE_KEYS], pd.DataFrame(parts, index=df.index)], axis=1)
+    return _reduce(cells, CUBE_KEYS, values)
+
+
+def merge_cubes(cubes: Iterable[pd.DataFrame], values=CUBE_VALUES) -> pd.DataFrame:
+    """Merge cubes built from disjoint data into one."""
+    cubes = [c for c in cubes if len(c)]
+    if not cubes:
+        return pd.DataFrame(columns=CUBE_KEYS + _stat_cols(values))
+    # Align categories so the keys concatenate without falling back to object
+    for col in ("player_name", "pitch_type"):
+        cats = pd.api.types.union_categoricals(
+            [c[col].astype("category") for c in cubes]).categories
+        cubes = [c.assign(**{col: pd.Categorical(c[col], categories=cats)}) for c in cubes]
+    merged = _reduce(pd.concat(cubes, ignore_index=True), CUBE_KEYS, values)
+    return merged.sort_values(["game_year", "month", "batter"], kind="stable").reset_index(drop=True)
+
+
+def build_cube(chunks: Iterable[pd.DataFrame], values=CUBE_VALUES) -> pd.DataFrame:
+    """Build a cube chunk by chunk, folding each chunk's cells into the running cube."""
+    cube = merge_cubes([], values)
+    for chunk in chunks:
+        cube = merge_cubes([cube, chunk_cube(chunk, values)], values)
+    return cube
+
+
+def replace_months(cube: pd.DataFrame, new: pd.DataFrame, values=CUBE_VALUES,
+                   months=None) -> pd.DataFrame:
+    """Swap in rebuilt (game_year, month) cells, e.g. after an incremental refresh.
+
+    ``months`` lists the rebuilt (game_year, month) pairs; it defaults to the
+    months present in ``new``, so pass it when a rebuilt month may be empty.
+    """
+    months = set(zip(new["game_year"], new["month"])) if months is None else set(months)
+    keep = [ym not in months for ym in zip(cube["game_year"], cube["month"])]
+    return merge_cubes([cube[keep], new], values)
+
+
+def rollup(cube: pd.DataFrame, by: list[str], value: str = "bat_speed",
+           min_count: int = 0, dropna: bool = True) -> pd.DataFrame:
+    """Count, mean, std, min and max of ``value`` per ``by`` group.
+
+    Like DataFrame.groupby, groups with a missing key are dropped unless
+    dropna=False.
+    """
+    cols = [f"{value}_{s}" for s in STATS]
+    g = _reduce(cube[by + cols], by, [value])
+    if dropna:
+        g = g.dropna(subset=by)
+    g = g[g[f"{value}_count"] >= max(1, min_count)]
+    n = g[f"{value}_count"]
+    mean = g[f"{value}_sum"] / n
+    var = (g[f"{value}_sumsq"] - n * mean**2) / (n - 1)
+    return pd.DataFrame({
+        **{k: g[k] for k in by},
+        "count": n,
+        "mean": mean,
+        "std": np.sqrt(var.clip(lower=0)),
+        "min": g[f"{value}_min"],
+        "max": g[f"{value}_max"],
+    }).reset_index(drop=True)
+
+
+def save_cube(cube: pd.DataFrame, path) -> pathlib.Path:
+    """Write the cube as a single Parquet file."""
+    path = pathlib.Path(path)
+    cube.to_parquet(path, index=False)
+    return path
+
+
+def load_cube(path) -> pd.DataFrame:
+    """Read a cube written by save_cube."""
+    return pd.read_parquet(path)
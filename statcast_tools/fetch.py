@@ -0,0 +1,217 @@
+"""Resumable, chunked Statcast fetching.
+
+A season is split into day or week windows. Each finished window is written
+to its own Parquet partition and recorded in a JSON manifest, so a rerun
+after a failure skips every window that already completed. Only one window
+is held in memory at a time.
+
+A window that ends today or later may still gain games, so it is recorded
+as provisional and fetched again on the next run. When the requested end
+moves (e.g. a season end capped at today), the longer window supersedes the
+provisional one it covers, which is then dropped.
+
+Layout of a partition directory:
+  manifest.json                          -- finished windows and row counts
+  window_<start>_<end>.parquet           -- one file per non-empty window
+
+Usage:
+  windows = season_windows("2024-03-20", "2024-09-29", freq="week")
+  fetch_windows(windows, "partitions/2024", workers=4, limiter=TokenBucket(rate=1.0))
+  for df in iter_partitions("partitions/2024"):
+      ...
+"""
+
+import datetime as dt
+import json
+import os
+import pathlib
+from typing import Callable, Iterator
+
+import pandas as pd
+
+from statcast_tools.scheduler import TokenBucket, run_parallel
+
+MANIFEST_NAME = "manifest.json"
+WINDOW_DAYS = {"day": 1, "week": 7}
+
+
+def _to_date(value) -> dt.date:
+    """Accept a date, datetime or ISO string and return a date."""
+    if isinstance(value, dt.datetime):
+        return value.date()
+    if isinstance(value, dt.date):
+        return value
+    return dt.date.fromisoformat(str(value))
+
+
+def season_windows(start, end, freq: str = "week") -> list[tuple[dt.date, dt.date]]:
+    """Split [start, end] (inclusive) into consecutive day or week windows."""
+    if freq not in WINDOW_DAYS:
+        raise ValueError(f"freq must be one of {sorted(WINDOW_DAYS)}, got {freq!r}")
+    start, end = _to_date(start), _to_date(end)
+    if end < start:
+        raise ValueError(f"end ({end}) is before start ({start})")
+    step = dt.timedelta(days=WINDOW_DAYS[freq])
+    windows = []
+    lo = start
+    while lo <= end:
+        hi = min(lo + step - dt.timedelta(days=1), end)
+        windows.append((lo, hi))
+        lo = hi + dt.timedelta(days=1)
+    return windows
+
+
+def window_key(window: tuple[dt.date, dt.date]) -> str:
+    """Stable manifest key / file stem for a window."""
+    lo, hi = window
+    return f"{lo.isoformat()}_{hi.isoformat()}"
+
+
+# ---------------------------------------------------------------------------
+# Manifest
+# ---------------------------------------------------------------------------
+def _write_json_atomic(path: pathlib.Path, payload: dict) -> None:
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def load_manifest(out_dir) -> dict:
+    """Return the manifest for out_dir, or an empty one if none exists yet."""
+    path = pathlib.Path(out_dir) / MANIFEST_NAME
+    if not path.exists():
+        return {"windows": {}}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _is_done(out_dir: pathlib.Path, entry: dict | None) -> bool:
+    if entry is None or entry.get("provisional"):
+        return False
+    return entry["file"] is None or (out_dir / entry["file"]).exists()
+
+
+# ---------------------------------------------------------------------------
+# Fetch
+# ---------------------------------------------------------------------------
+def fetch_window(window, out_dir, fetch_fn: Callable[..., pd.DataFrame],
+                 transform: Callable[[pd.DataFrame], pd.DataFrame] | None = None) -> dict:
+    """Fetch one window and write its partition; return the manifest entry.
+
+    transform (e.g. schema.apply_schema) is applied before writing. The
+    partition is written to a temporary file and renamed into place, so an
+    interrupted write never looks like a finished window. A window ending
+    today or later is marked provisional, so fetch_windows refetches it.
+    """
+    out_dir = pathlib.Path(out_dir)
+    lo, hi = window
+    df = fetch_fn(start_dt=lo.isoformat(), end_dt=hi.isoformat())
+    rows = 0 if df is None else len(df)
+    entry = {
+        "start": lo.isoformat(),
+        "end": hi.isoformat(),
+        "rows": rows,
+        "file": None,
+        "fetched_at": dt.datetime.now().isoformat(timespec="seconds"),
+        "provisional": hi >= dt.date.today(),
+    }
+    if rows:
+        if transform is not None:
+            df = transform(df)
+        entry["schema_version"] = df.attrs.get("statcast_schema_version")
+        name = f"window_{window_key(window)}.parquet"
+        tmp = out_dir / (name + ".tmp")
+        df.to_parquet(tmp, index=False)
+        os.replace(tmp, out_dir / name)
+        entry["file"] = name
+    return entry
+
+
+def _drop_superseded(done: dict, window) -> list[str]:
+    """Remove provisional entries lying inside window (other than its own key).
+
+    Returns the partition files to delete once the manifest is rewritten.
+    """
+    lo, hi = (d.isoformat() for d in window)
+    stale = [k for k, e in done.items()
+             if e.get("provisional") and k != window_key(window)
+             and lo <= e["start"] and e["end"] <= hi]
+    return [f for f in (done.pop(k)["file"] for k in stale) if f]
+
+
+def fetch_windows(windows, out_dir, fetch_fn: Callable[..., pd.DataFrame] | None = None,
+                  transform: Callable[[pd.DataFrame], pd.DataFrame] | None = None,
+                  workers: int = 1, limiter: TokenBucket | None = None,
+                  retries: int = 3, backoff: float = 2.0, verbose: bool = True) -> dict:
+    """Fetch every window not yet recorded in the manifest.
+
+    fetch_fn is called as fetch_fn(start_dt=..., end_dt=...) and defaults to
+    pybaseball.statcast. Windows run on ``workers`` threads behind the shared
+    ``limiter`` and each is retried up to ``retries`` times (see scheduler).
+    The manifest is rewritten after every finished window, so a crash loses
+    at most the windows in flight. Windows that still fail are reported in a
+    RuntimeError after the others finish; rerunning resumes from there.
+    Returns the final manifest.
+    """
+    if fetch_fn is None:
+        from pybaseball import statcast as fetch_fn
+
+    out_dir = pathlib.Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest = load_manifest(out_dir)
+    done = manifest["windows"]
+
+    pending = [w for w in windows if not _is_done(out_dir, done.get(window_key(w)))]
+    if verbose and len(pending) < len(windows):
+        print(f"  resuming: {len(windows) - len(pending)}/{len(windows)} windows already fetched")
+
+    def job(window):
+        return fetch_window(window, out_dir, fetch_fn, transform)
+
+    failed = []
+    results = run_parallel(pending, job, workers=workers, limiter=limiter,
+                           retries=retries, backoff=backoff)
+    for i, (window, entry, error) in enumerate(results, 1):
+        if error is not None:
+            failed.append(window_key(window))
+            if verbose:
+                print(f"  [{i}/{len(pending)}] {window_key(window)}: FAILED ({error})")
+            continue
+        done[window_key(window)] = entry
+        stale_files = _drop_superseded(done, window)
+        _write_json_atomic(out_dir / MANIFEST_NAME, manifest)
+        for name in stale_files:
+            (out_dir / name).unlink(missing_ok=True)
+        if verbose:
+            print(f"  [{i}/{len(pending)}] {entry['start']} .. {entry['end']}: {entry['rows']:,} rows")
+
+    if failed:
+        raise RuntimeError(f"{len(failed)} window(s) failed after retries: {', '.join(sorted(failed))}")
+    return manifest
+
+
+def iter_partitions(out_dir, columns: list[str] | None = None) -> Iterator[pd.DataFrame]:
+    """Yield each non-empty partition in date order, one frame at a time."""
+    out_dir = pathlib.Path(out_dir)
+    entries = sorted(load_manifest(out_dir)["windows"].values(), key=lambda e: e["start"])
+    for entry in entries:
+        if entry["file"]:
+            yield pd.read_parquet(out_dir / entry["file"], columns=columns)
+
+
+def fetched_months(out_dir, since: str | None = None) -> set[tuple[int, int]]:
+    """(year, month) pairs covered by windows fetched at or after ``since``.
+
+    ``since`` is an ISO timestamp compared with each entry's fetched_at;
+    None returns the months of every window in the manifest.
+    """
+    months = set()
+    for entry in load_manifest(out_dir)["windows"].values():
+        if since is None or entry["fetched_at"] >= since:
+            months.update((p.year, p.month)
+                          for p in pd.period_range(entry["start"], entry["end"], freq="M"))
+    return months
+
+
+def manifest_rows(out_dir) -> int:
+    """Total rows across all finished windows."""
+    return sum(e["rows"] for e in load_manifest(out_dir)["windows"].values())
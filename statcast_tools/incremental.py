@@ -0,0 +1,149 @@
+"""Incremental refresh of a fetched Statcast partition directory.
+
+Instead of re-downloading a whole season, read the latest ``game_date``
+already stored (the watermark) and fetch only the dates after it, starting
+``overlap_days`` earlier so late scoring corrections are picked up. Stored
+rows in the overlap are merged with the new ones and deduplicated on
+(game_pk, at_bat_number, pitch_number), keeping the newly fetched version.
+
+All new windows are fetched before anything on disk changes, so a failed
+refresh leaves the partition directory exactly as it was.
+
+Usage:
+  refresh_partitions("partitions/2025", end="2025-09-28", overlap_days=3)
+"""
+
+import datetime as dt
+import os
+import pathlib
+import shutil
+from typing import Callable
+
+import pandas as pd
+
+from statcast_tools.fetch import (
+    MANIFEST_NAME, _to_date, _write_json_atomic, fetch_window, iter_partitions,
+    load_manifest, season_windows, window_key,
+)
+from statcast_tools.scheduler import TokenBucket, run_parallel
+from statcast_tools.schema import concat_compact
+
+DEDUP_KEYS = ["game_pk", "at_bat_number", "pitch_number"]
+
+
+def stored_watermark(out_dir) -> dt.date | None:
+    """Latest game_date stored in out_dir, or None if nothing is stored."""
+    latest = None
+    for part in iter_partitions(out_dir, columns=["game_date"]):
+        day = pd.to_datetime(part["game_date"]).max()
+        if pd.notna(day) and (latest is None or day > latest):
+            latest = day
+    return None if latest is None else latest.date()
+
+
+def merge_dedup(old: pd.DataFrame, new: pd.DataFrame, keys=DEDUP_KEYS) -> pd.DataFrame:
+    """Concatenate old and new rows, keeping the new version of duplicate pitches."""
+    merged = concat_compact([old, new])
+    if merged.empty:
+        return merged
+    return merged.drop_duplicates(subset=keys, keep="last").reset_index(drop=True)
+
+
+def _in_range(df: pd.DataFrame, lo: dt.date, hi: dt.date) -> pd.Series:
+    days = pd.to_datetime(df["game_date"]).dt.date
+    return (days >= lo) & (days <= hi)
+
+
+def refresh_partitions(out_dir, end, fetch_fn: Callable[..., pd.DataFrame] | None = None,
+                       transform: Callable[[pd.DataFrame], pd.DataFrame] | None = None,
+                       overlap_days: int = 3, freq: str = "week", workers: int = 1,
+                       limiter: TokenBucket | None = None, retries: int = 3,
+                       backoff: float = 2.0, verbose: bool = True) -> dict:
+    """Fetch dates after the stored watermark (minus overlap) and merge them in.
+
+    ``end`` is capped at today. Returns the updated manifest; if nothing is
+    stored yet, raises ValueError (use fetch_windows for the first pull).
+    """
+    if fetch_fn is None:
+        from pybaseball import statcast as fetch_fn
+
+    out_dir = pathlib.Path(out_dir)
+    watermark = stored_watermark(out_dir)
+    if watermark is None:
+        raise ValueError(f"no stored rows in {out_dir}; run fetch_windows first")
+    end = min(_to_date(end), dt.date.today())
+    start = watermark - dt.timedelta(days=overlap_days)
+    if start > end:
+        if verbose:
+            print(f"  up to date (watermark {watermark})")
+        return load_manifest(out_dir)
+
+    windows = season_windows(start, end, freq=freq)
+    if verbose:
+        print(f"  watermark {watermark}: refreshing {start} .. {end} ({len(windows)} windows)")
+
+    # 1. Fetch everything first, into a scratch directory
+    scratch = out_dir / "_refresh"
+    shutil.rmtree(scratch, ignore_errors=True)
+    scratch.mkdir()
+    fetched, failed = {}, []
+    for window, entry, error in run_parallel(
+            windows, lambda w: fetch_window(w, scratch, fetch_fn, transform),
+            workers=workers, limiter=limiter, retries=retries, backoff=backoff):
+        if error is not None:
+            failed.append(window_key(window))
+        else:
+            fetched[window_key(window)] = (window, entry)
+    if failed:
+        shutil.rmtree(scratch)
+        raise RuntimeError(f"refresh failed for window(s): {', '.join(sorted(failed))}; "
+                           "stored partitions were not modified")
+
+    # 2. Stored rows in the overlap, from every window that reaches past start
+    manifest = load_manifest(out_dir)
+    affected = {k: e for k, e in manifest["windows"].items()
+                if e["file"] and _to_date(e["end"]) >= start}
+    kept, overlap = {}, []
+    for key, entry in affected.items():
+        part = pd.read_parquet(out_dir / entry["file"])
+        mask = pd.to_datetime(part["game_date"]).dt.date >= start
+        kept[key] = part[~mask]
+        overlap.append(part[mask])
+    overlap = concat_compact(overlap)
+
+    # 3. Write merged new windows, then trim the old ones
+    added = 0
+    for key, (window, entry) in sorted(fetched.items()):
+        new = pd.read_parquet(scratch / entry["file"]) if entry["file"] else pd.DataFrame()
+        old = overlap[_in_range(overlap, *window)] if len(overlap) else pd.DataFrame()
+        merged = merge_dedup(old, new)
+        added += len(merged) - len(old)
+        if merged.empty:
+            entry.update(rows=0, file=None)
+        else:
+            name = f"window_{key}.parquet"
+            merged.to_parquet(out_dir / name, index=False)
+            entry.update(rows=len(merged), file=name)
+        manifest["windows"][key] = entry
+
+    for key, part in kept.items():
+        if key in fetched:
+            continue
+        # Keep emptied windows in the manifest (rows=0) so fetch_windows
+        # still treats them as done and never re-adds the moved rows; their
+        # remaining dates end before start, so they are no longer provisional
+        entry = manifest["windows"][key]
+        entry["rows"] = len(part)
+        entry["provisional"] = False
+        if part.empty:
+            os.remove(out_dir / entry["file"])
+            entry["file"] = None
+        else:
+            entry["end"] = (start - dt.timedelta(days=1)).isoformat()
+            part.to_parquet(out_dir / entry["file"], index=False)
+
+    _write_json_atomic(out_dir / MANIFEST_NAME, manifest)
+    shutil.rmtree(scratch)
+    if verbose:
+        print(f"  merged: {added:+,} rows")
+    return manifest
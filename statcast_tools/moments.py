@@ -0,0 +1,103 @@
+"""One-pass streaming correlation and regression statistics.
+
+CoMoments keeps, for every pair of columns, the number of rows where both
+are present, their means over those rows, the sums of squared deviations and
+the co-moment. Each chunk is reduced with a few matrix products and merged
+into the running totals with the pairwise (Chan et al.) form of Welford's
+update, so the result matches ``df.corr()`` (pairwise-complete rows) and
+``np.polyfit(x, y, 1)`` without ever holding more than one chunk.
+
+Usage:
+  stats = CoMoments(["bat_speed", "launch_speed", "swing_length"])
+  for chunk in iter_statcast(path, stats.columns):
+      stats.update(chunk)
+  stats.corr()
+  slope, intercept = stats.ols("bat_speed", "launch_speed")
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class CoMoments:
+    """Pairwise count / mean / M2 / co-moment accumulators for ``columns``.
+
+    Entry [i, j] of ``n``, ``mean`` and ``m2`` refers to column i over the
+    rows where columns i and j are both present; ``comoment`` is symmetric.
+    """
+
+    def __init__(self, columns: list[str]):
+        self.columns = list(columns)
+        k = len(self.columns)
+        self.n = np.zeros((k, k))
+        self.mean = np.zeros((k, k))
+        self.m2 = np.zeros((k, k))
+        self.comoment = np.zeros((k, k))
+
+    def _chunk(self, df: pd.DataFrame):
+        x = df[self.columns].to_numpy(dtype="float64", na_value=np.nan)
+        valid = ~np.isnan(x)
+        v = valid.astype("float64")
+        # Centre on the chunk's column means first to keep the sums small
+        present = v.sum(axis=0)
+        shift = np.where(valid, x, 0.0).sum(axis=0) / np.maximum(present, 1)
+        xc = np.where(valid, x - shift, 0.0)
+
+        n = v.T @ v
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean_c = np.where(n > 0, (xc.T @ v) / n, 0.0)
+            m2 = (xc**2).T @ v - n * mean_c**2
+            comoment = xc.T @ xc - n * mean_c * mean_c.T
+        return n, mean_c + shift[:, None], m2, comoment
+
+    def update(self, df: pd.DataFrame) -> "CoMoments":
+        """Fold one chunk into the running statistics."""
+        nb, mb, m2b, cb = self._chunk(df)
+        return self._combine(nb, mb, m2b, cb)
+
+    def merge(self, other: "CoMoments") -> "CoMoments":
+        """Fold in statistics accumulated separately over the same columns."""
+        if other.columns != self.columns:
+            raise ValueError("cannot merge statistics over different columns")
+        return self._combine(other.n, other.mean, other.m2, other.comoment)
+
+    def _combine(self, nb, mb, m2b, cb) -> "CoMoments":
+        na, ma = self.n, self.mean
+        n = na + nb
+        with np.errstate(invalid="ignore", divide="ignore"):
+            frac = np.where(n > 0, nb / n, 0.0)
+            w = np.where(n > 0, na * nb / n, 0.0)
+        delta = mb - ma
+        self.mean = ma + delta * frac
+        self.m2 = self.m2 + m2b + delta**2 * w
+        self.comoment = self.comoment + cb + delta * delta.T * w
+        self.n = n
+        return self
+
+    def _ij(self, x: str, y: str) -> tuple[int, int]:
+        return self.columns.index(x), self.columns.index(y)
+
+    def count(self, x: str, y: str) -> int:
+        """Rows where both x and y are present."""
+        i, j = self._ij(x, y)
+        return int(self.n[i, j])
+
+    def cov(self) -> pd.DataFrame:
+        """Pairwise sample covariance matrix."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cov = np.where(self.n > 1, self.comoment / (self.n - 1), np.nan)
+        return pd.DataFrame(cov, index=self.columns, columns=self.columns)
+
+    def corr(self) -> pd.DataFrame:
+        """Pairwise Pearson correlation matrix."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            corr = self.comoment / np.sqrt(self.m2 * self.m2.T)
+        corr = np.where(self.n > 1, corr, np.nan)
+        np.fill_diagonal(corr, np.where(np.diag(self.n) > 1, 1.0, np.nan))
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+
+    def ols(self, x: str, y: str) -> tuple[float, float]:
+        """Least-squares (slope, intercept) of y on x, like np.polyfit(x, y, 1)."""
+        i, j = self._ij(x, y)
+        slope = self.comoment[i, j] / self.m2[i, j]
+        return float(slope), float(self.mean[j, i] - slope * self.mean[i, j])
@@ -0,0 +1,167 @@
+"""Partitioned Parquet output for pitch-level Statcast data.
+
+Writes a Hive-style dataset partitioned by season and month:
+
+  <out_dir>/game_year=2024/month=4/part-0.parquet
+  <out_dir>/game_year=2024/month=5/part-0.parquet
+  ...
+
+Files are zstd-compressed and rows are buffered per partition so each row
+group holds ``row_group_size`` rows (the last group of a month may be
+smaller). ``game_year`` and ``month`` are stored only in the directory
+names; readers get them back as columns through Hive partitioning.
+
+Usage:
+  write_parquet_dataset(["partitions/2024", "partitions/2025"], "statcast_parquet")
+  df = read_parquet_dataset("statcast_parquet", columns=["bat_speed"], year=2025, month=5)
+"""
+
+import pathlib
+import shutil
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from statcast_tools.fetch import load_manifest
+
+PARTITION_COLS = ("game_year", "month")
+ROW_GROUP_SIZE = 128_000
+COMPRESSION = "zstd"
+COMPRESSION_LEVEL = 6
+
+
+def _window_files(partition_dirs) -> list[pathlib.Path]:
+    """Non-empty window partitions from one or more fetch directories, in date order."""
+    files = []
+    for d in partition_dirs:
+        d = pathlib.Path(d)
+        entries = sorted(load_manifest(d)["windows"].values(), key=lambda e: e["start"])
+        files.extend(d / e["file"] for e in entries if e["file"])
+    return files
+
+
+def unified_schema(files) -> pa.Schema:
+    """Union of the file schemas, widening types where windows disagree."""
+    schemas = [pq.read_schema(f).remove_metadata() for f in files]
+    schema = pa.unify_schemas(schemas, promote_options="permissive")
+    for name in PARTITION_COLS:
+        if name in schema.names:
+            schema = schema.remove(schema.get_field_index(name))
+    return schema
+
+
+def _conform(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Reorder/cast table to schema, adding missing columns as nulls."""
+    arrays = []
+    for field in schema:
+        if field.name in table.column_names:
+            arrays.append(table[field.name].cast(field.type))
+        else:
+            arrays.append(pa.nulls(len(table), type=field.type))
+    return pa.table(arrays, schema=schema)
+
+
+def _year_month(table: pa.Table) -> tuple[pa.Array, pa.Array]:
+    """Season and month of every row, derived from game_date."""
+    dates = table["game_date"]
+    if pa.types.is_string(dates.type) or pa.types.is_large_string(dates.type):
+        dates = pc.strptime(pc.utf8_slice_codeunits(dates, 0, 10), format="%Y-%m-%d", unit="s")
+    return pc.year(dates), pc.month(dates)
+
+
+class _PartitionWriter:
+    """Buffers one partition's rows and flushes them in full row groups."""
+
+    def __init__(self, path: pathlib.Path, schema: pa.Schema, row_group_size: int):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.writer = pq.ParquetWriter(path, schema, compression=COMPRESSION,
+                                       compression_level=COMPRESSION_LEVEL)
+        self.row_group_size = row_group_size
+        self.buffer: list[pa.Table] = []
+        self.buffered = 0
+        self.rows = 0
+
+    def write(self, table: pa.Table) -> None:
+        self.buffer.append(table)
+        self.buffered += len(table)
+        if self.buffered >= self.row_group_size:
+            self.flush(final=False)
+
+    def flush(self, final: bool) -> None:
+        if not self.buffer:
+            return
+        table = pa.concat_tables(self.buffer)
+        n_full = len(table) // self.row_group_size * self.row_group_size
+        cut = len(table) if final else n_full
+        if cut:
+            self.writer.write_table(table.slice(0, cut), row_group_size=self.row_group_size)
+            self.rows += cut
+        rest = table.slice(cut)
+        self.buffer = [rest] if len(rest) else []
+        self.buffered = len(rest)
+
+    def close(self) -> None:
+        self.flush(final=True)
+        self.writer.close()
+
+
+def write_parquet_dataset(partition_dirs, out_dir, row_group_size: int = ROW_GROUP_SIZE,
+                          verbose: bool = True) -> dict[tuple[int, int], int]:
+    """Rewrite fetched window partitions as a game_year/month Parquet dataset.
+
+    Reads one window at a time, so memory stays bounded by one window plus
+    at most one unflushed row group per open month. Returns rows written per
+    (game_year, month).
+    """
+    files = _window_files(partition_dirs)
+    out_dir = pathlib.Path(out_dir)
+    if out_dir.exists():
+        shutil.rmtree(out_dir)
+    if not files:
+        return {}
+    schema = unified_schema(files)
+
+    writers: dict[tuple[int, int], _PartitionWriter] = {}
+    try:
+        for f in files:
+            table = pq.read_table(f)
+            years, months = _year_month(table)
+            table = _conform(table, schema)
+            keys = sorted(set(zip(years.to_pylist(), months.to_pylist())))
+            for year, month in keys:
+                mask = pc.and_(pc.equal(years, year), pc.equal(months, month))
+                if (year, month) not in writers:
+                    path = out_dir / f"game_year={year}" / f"month={month}" / "part-0.parquet"
+                    writers[(year, month)] = _PartitionWriter(path, schema, row_group_size)
+                writers[(year, month)].write(table.filter(mask))
+    finally:
+        for w in writers.values():
+            w.close()
+
+    counts = {k: w.rows for k, w in sorted(writers.items())}
+    if verbose:
+        for (year, month), rows in counts.items():
+            print(f"  game_year={year}/month={month}: {rows:,} rows")
+    return counts
+
+
+def read_parquet_dataset(path, columns: list[str] | None = None,
+                         year: int | None = None, month: int | None = None) -> pd.DataFrame:
+    """Load selected columns, optionally for one season and/or month only.
+
+    Partition filters prune whole directories and ``columns`` is pushed down
+    to the Parquet reader, so neither unused months nor unused columns are read.
+    """
+    filters = []
+    if year is not None:
+        filters.append(("game_year", "=", year))
+    if month is not None:
+        filters.append(("month", "=", month))
+    return pd.read_parquet(path, columns=columns, filters=filters or None)
+
+
+def dir_size_mb(path) -> float:
+    """Total size of all files under path, in MB."""
+    return sum(p.stat().st_size for p in pathlib.Path(path).rglob("*") if p.is_file()) / 1024**2
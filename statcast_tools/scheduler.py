@@ -0,0 +1,89 @@
+"""Parallel, rate-limited job scheduling for Statcast window fetches.
+
+Jobs (typically date windows) run on a bounded thread pool. Every attempt
+first takes a token from a shared token bucket, so the request rate towards
+Baseball Savant stays under ``rate`` per second however many workers run.
+Failed attempts are retried with exponential backoff plus jitter.
+
+Wall-clock time scales with the number of workers until the bucket becomes
+the bottleneck: with W workers and requests that take T seconds each, the
+throughput is min(W / T, rate) requests per second.
+
+Usage:
+  limiter = TokenBucket(rate=1.0, capacity=4)
+  for job, result, error in run_parallel(windows, fetch, workers=4, limiter=limiter):
+      ...
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterable, Iterator
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, bursts up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: int = 1):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Block until a token is available, take it and return the seconds waited."""
+        start = time.monotonic()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return now - start
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def retry_call(fn: Callable, *args, retries: int = 3, backoff: float = 2.0,
+               limiter: TokenBucket | None = None, **kwargs):
+    """Call fn, retrying up to ``retries`` times with exponential backoff.
+
+    Waits backoff * 2**attempt seconds (+/- 25% jitter) between attempts and
+    takes a limiter token before every attempt. Re-raises the last error.
+    """
+    for attempt in range(retries + 1):
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            return fn(*args, **kwargs)
+        except Exception:
+            if attempt == retries:
+                raise
+            delay = backoff * 2 ** attempt
+            time.sleep(delay * random.uniform(0.75, 1.25))
+
+
+def run_parallel(jobs: Iterable, fn: Callable, workers: int = 4,
+                 limiter: TokenBucket | None = None, retries: int = 3,
+                 backoff: float = 2.0) -> Iterator[tuple]:
+    """Run fn(job) for every job on a thread pool; yield (job, result, error) as they finish.
+
+    A job that still fails after its retries is yielded with result None and
+    the exception, so one bad window does not cancel the others.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {
+            pool.submit(retry_call, fn, job, retries=retries, backoff=backoff, limiter=limiter): job
+            for job in jobs
+        }
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                yield job, future.result(), None
+            except Exception as e:
+                yield job, None, e
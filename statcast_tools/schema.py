@@ -0,0 +1,115 @@
+"""Compact dtype schema for pitch-level Statcast frames.
+
+pybaseball returns most Statcast columns as object strings or float64.
+The schema below stores low-cardinality strings as categoricals, pitch and
+batted-ball measurements as float32, and ids / counts as nullable Int32,
+which cuts in-memory size several times without changing any value that
+Statcast actually reports.
+
+Bump SCHEMA_VERSION whenever a column moves between groups; the version is
+recorded in ``df.attrs`` and in the fetch manifest so stored partitions can
+be traced back to the schema that produced them.
+
+Columns that are not listed are left untouched, so new Statcast fields pass
+through until they are added here.
+
+Usage:
+  df = apply_schema(statcast(start_dt, end_dt))
+  df = pd.read_csv(path, dtype=csv_dtypes(), parse_dates=["game_date"])
+"""
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+SCHEMA_VERSION = 1
+
+CATEGORY_COLUMNS = (
+    "pitch_type", "pitch_name", "events", "description", "type", "bb_type",
+    "player_name", "stand", "p_throws", "home_team", "away_team",
+    "inning_topbot", "game_type", "if_fielding_alignment", "of_fielding_alignment",
+)
+
+FLOAT32_COLUMNS = (
+    "release_speed", "release_pos_x", "release_pos_y", "release_pos_z",
+    "release_spin_rate", "release_extension", "effective_speed", "spin_axis",
+    "pfx_x", "pfx_z", "plate_x", "plate_z", "sz_top", "sz_bot",
+    "vx0", "vy0", "vz0", "ax", "ay", "az",
+    "hc_x", "hc_y", "hit_distance_sc", "launch_speed", "launch_angle", "hyper_speed",
+    "estimated_ba_using_speedangle", "estimated_woba_using_speedangle",
+    "estimated_slg_using_speedangle", "woba_value", "babip_value", "iso_value",
+    "home_win_exp", "bat_win_exp", "delta_home_win_exp", "delta_run_exp",
+    "delta_pitcher_run_exp", "api_break_z_with_gravity", "api_break_x_arm",
+    "api_break_x_batter_in", "arm_angle",
+    "bat_speed", "swing_length", "swing_path_tilt", "attack_angle", "attack_direction",
+    "intercept_ball_minus_batter_pos_x_inches", "intercept_ball_minus_batter_pos_y_inches",
+)
+
+INT32_COLUMNS = (
+    "game_pk", "game_year", "pitcher", "batter", "on_1b", "on_2b", "on_3b",
+    "fielder_2", "fielder_3", "fielder_4", "fielder_5", "fielder_6",
+    "fielder_7", "fielder_8", "fielder_9",
+    "at_bat_number", "pitch_number", "inning", "outs_when_up", "balls", "strikes",
+    "zone", "hit_location", "launch_speed_angle", "woba_denom",
+    "home_score", "away_score", "bat_score", "fld_score",
+    "post_home_score", "post_away_score", "post_bat_score", "post_fld_score",
+    "home_score_diff", "bat_score_diff", "age_pit", "age_bat",
+    "age_pit_legacy", "age_bat_legacy", "n_thruorder_pitcher",
+    "n_priorpa_thisgame_player_at_bat", "pitcher_days_since_prev_game",
+    "batter_days_since_prev_game", "pitcher_days_until_next_game",
+    "batter_days_until_next_game",
+)
+
+
+def schema_dtypes() -> dict[str, str]:
+    """Column -> pandas dtype for every column covered by the schema."""
+    dtypes = {c: "category" for c in CATEGORY_COLUMNS}
+    dtypes.update({c: "float32" for c in FLOAT32_COLUMNS})
+    dtypes.update({c: "Int32" for c in INT32_COLUMNS})
+    return dtypes
+
+
+def csv_dtypes(columns=None) -> dict[str, str]:
+    """dtype mapping for pd.read_csv, optionally limited to ``columns``."""
+    dtypes = schema_dtypes()
+    if columns is not None:
+        dtypes = {c: t for c, t in dtypes.items() if c in set(columns)}
+    return dtypes
+
+
+def apply_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert the schema columns present in df in place and return it."""
+    for col, dtype in schema_dtypes().items():
+        if col not in df.columns or str(df[col].dtype) == dtype:
+            continue
+        if dtype == "Int32" and df[col].dtype == object:
+            df[col] = pd.to_numeric(df[col])
+        df[col] = df[col].astype(dtype)
+    if "game_date" in df.columns:
+        df["game_date"] = pd.to_datetime(df["game_date"])
+    df.attrs["statcast_schema_version"] = SCHEMA_VERSION
+    return df
+
+
+def concat_compact(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """pd.concat that keeps categorical columns categorical.
+
+    Plain concat falls back to object dtype when the frames' categories
+    differ, so the categories are unioned first.
+    """
+    frames = [f for f in frames if len(f)]
+    if not frames:
+        return pd.DataFrame()
+    for col in frames[0].select_dtypes("category").columns:
+        parts = [f[col] for f in frames if col in f.columns]
+        if not all(isinstance(p.dtype, pd.CategoricalDtype) for p in parts):
+            continue
+        cats = union_categoricals(parts).categories
+        for f in frames:
+            if col in f.columns:
+                f[col] = f[col].cat.set_categories(cats)
+    return pd.concat(frames, ignore_index=True)
+
+
+def memory_mb(df: pd.DataFrame) -> float:
+    """Deep in-memory size of df in MB."""
+    return df.memory_usage(deep=True).sum() / 1024**2
@@ -0,0 +1,90 @@
+"""statcast_tools.cache.ResponseCache: season-aware TTL and the stale fallback."""
+
+import os
+import pathlib
+import sys
+import time
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+from statcast_tools.cache import ResponseCache  # noqa: E402
+
+CURRENT = 2025
+
+
+class Leaderboard:
+    """Stands in for a savant-extras fetcher; fails while ``down`` is set."""
+
+    calls = 0
+    down = False
+
+
+def leaderboard(year, min_pa=0):
+    if Leaderboard.down:
+        raise ConnectionError("savant is down")
+    Leaderboard.calls += 1
+    return pd.DataFrame({"year": [year], "call": [Leaderboard.calls]})
+
+
+@pytest.fixture
+def cache(tmp_path):
+    Leaderboard.calls, Leaderboard.down = 0, False
+    return ResponseCache(tmp_path, ttl_current=60, current_season=CURRENT)
+
+
+def _age(cache, args, seconds):
+    path = cache.path(leaderboard, args)
+    old = time.time() - seconds
+    os.utime(path, (old, old))
+
+
+def test_fresh_entry_is_served_from_cache(cache):
+    first, hit = cache.call(leaderboard, CURRENT)
+    assert not hit
+    again, hit = cache.call(leaderboard, CURRENT)
+    assert hit and Leaderboard.calls == 1
+    pd.testing.assert_frame_equal(first, again)
+
+
+def test_arguments_are_part_of_the_key(cache):
+    cache.call(leaderboard, CURRENT)
+    cache.call(leaderboard, CURRENT, min_pa=50)
+    assert Leaderboard.calls == 2
+
+
+def test_current_season_expires(cache):
+    cache.call(leaderboard, CURRENT)
+    _age(cache, (CURRENT,), 120)
+    _, hit = cache.call(leaderboard, CURRENT)
+    assert not hit and Leaderboard.calls == 2
+
+
+def test_finished_season_never_expires(cache):
+    cache.call(leaderboard, CURRENT - 1)
+    _age(cache, (CURRENT - 1,), 10 * 365 * 86400)
+    _, hit = cache.call(leaderboard, CURRENT - 1)
+    assert hit and Leaderboard.calls == 1
+
+
+def test_date_range_in_current_season_uses_per_function_ttl(tmp_path):
+    cache = ResponseCache(tmp_path, ttl_current=60, ttl={"leaderboard": 3600},
+                          current_season=CURRENT)
+    assert cache.ttl_for(leaderboard, (f"{CURRENT}-04-01",), {}) == 3600
+    assert cache.ttl_for(leaderboard, (f"{CURRENT - 1}-04-01",), {}) is None
+
+
+def test_stale_entry_is_used_when_the_call_fails(cache):
+    first, _ = cache.call(leaderboard, CURRENT)
+    _age(cache, (CURRENT,), 120)
+    Leaderboard.down = True
+    stale, hit = cache.call(leaderboard, CURRENT)
+    assert hit
+    pd.testing.assert_frame_equal(first, stale)
+
+
+def test_failure_without_an_entry_raises(cache):
+    Leaderboard.down = True
+    with pytest.raises(ConnectionError):
+        cache.call(leaderboard, CURRENT)
@@ -0,0 +1,58 @@
+"""statcast_tools.cube: rebuilt months swap in exactly like a full rebuild."""
+
+import pathlib
+import sys
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+from statcast_tools.cube import CUBE_KEYS, build_cube, merge_cubes, replace_months, rollup  # noqa: E402
+
+
+def _swings(dates, seed):
+    rng = np.random.default_rng(seed)
+    n = len(dates)
+    return pd.DataFrame({
+        "game_date": dates,
+        "game_year": pd.to_datetime(dates).year,
+        "batter": rng.integers(1, 4, n),
+        "player_name": pd.Categorical(rng.choice(["A", "B", "C"], n)),
+        "pitch_type": pd.Categorical(rng.choice(["FF", "SL"], n)),
+        "bat_speed": rng.normal(70, 3, n),
+        "swing_length": rng.normal(7, 0.5, n),
+    })
+
+
+def _sorted(cube):
+    cube = cube.astype({"player_name": str, "pitch_type": str})
+    return cube.sort_values(CUBE_KEYS).reset_index(drop=True)
+
+
+APRIL = ["2025-04-0%d" % d for d in range(1, 10)]
+MAY = ["2025-05-1%d" % d for d in range(0, 10)]
+
+
+def test_replace_months_matches_full_rebuild():
+    april, may_old, may_new = _swings(APRIL, 0), _swings(MAY, 1), _swings(MAY, 2)
+    cube = build_cube([april, may_old])
+    patched = replace_months(cube, build_cube([may_new]))
+    pdt.assert_frame_equal(_sorted(patched), _sorted(build_cube([april, may_new])))
+
+
+def test_explicit_months_clear_a_month_that_is_now_empty():
+    april, may = _swings(APRIL, 0), _swings(MAY, 1)
+    cube = build_cube([april, may])
+    patched = replace_months(cube, merge_cubes([]), months={(2025, 5)})
+    pdt.assert_frame_equal(_sorted(patched), _sorted(build_cube([april])))
+
+
+def test_rollup_matches_pandas():
+    swings = pd.concat([_swings(APRIL, 0), _swings(MAY, 1)], ignore_index=True)
+    leaders = rollup(build_cube([swings]), ["player_name"]).set_index("player_name")
+    expected = swings.groupby("player_name", observed=True)["bat_speed"].agg(["count", "mean", "std"])
+    for name, row in expected.iterrows():
+        assert leaders.loc[name, "count"] == row["count"]
+        assert np.isclose(leaders.loc[name, "mean"], row["mean"])
+        assert np.isclose(leaders.loc[name, "std"], row["std"])
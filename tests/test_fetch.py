@@ -0,0 +1,80 @@
+"""statcast_tools.fetch: resumable windows, provisional windows and their supersession."""
+
+import datetime as dt
+import json
+import pathlib
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+from statcast_tools.fetch import (  # noqa: E402
+    MANIFEST_NAME, _drop_superseded, fetch_windows, iter_partitions, window_key,
+)
+
+TODAY = dt.date.today()
+
+
+class FakeStatcast:
+    """One row per day in [start_dt, end_dt]; records every call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, start_dt, end_dt):
+        self.calls.append((start_dt, end_dt))
+        days = pd.date_range(start_dt, end_dt, freq="D")
+        return pd.DataFrame({"game_date": days.strftime("%Y-%m-%d"), "game_pk": range(len(days))})
+
+
+def _manifest(out_dir):
+    return json.loads((out_dir / MANIFEST_NAME).read_text())["windows"]
+
+
+def test_finished_windows_are_not_refetched(tmp_path):
+    fetch = FakeStatcast()
+    windows = [(dt.date(2024, 4, 1), dt.date(2024, 4, 7)), (dt.date(2024, 4, 8), dt.date(2024, 4, 14))]
+    fetch_windows(windows, tmp_path, fetch_fn=fetch, verbose=False)
+    fetch_windows(windows, tmp_path, fetch_fn=fetch, verbose=False)
+    assert len(fetch.calls) == 2
+    assert not any(e["provisional"] for e in _manifest(tmp_path).values())
+
+
+def test_window_ending_today_is_provisional_and_refetched(tmp_path):
+    fetch = FakeStatcast()
+    windows = [(TODAY - dt.timedelta(days=2), TODAY)]
+    fetch_windows(windows, tmp_path, fetch_fn=fetch, verbose=False)
+    assert _manifest(tmp_path)[window_key(windows[0])]["provisional"]
+    fetch_windows(windows, tmp_path, fetch_fn=fetch, verbose=False)
+    assert len(fetch.calls) == 2
+
+
+def test_longer_window_supersedes_provisional_one(tmp_path):
+    fetch = FakeStatcast()
+    lo = TODAY - dt.timedelta(days=2)
+    short, longer = (lo, TODAY), (lo, TODAY + dt.timedelta(days=3))
+    fetch_windows([short], tmp_path, fetch_fn=fetch, verbose=False)
+    short_file = _manifest(tmp_path)[window_key(short)]["file"]
+
+    fetch_windows([longer], tmp_path, fetch_fn=fetch, verbose=False)
+    assert list(_manifest(tmp_path)) == [window_key(longer)]
+    assert not (tmp_path / short_file).exists()
+    days = pd.concat(iter_partitions(tmp_path))["game_date"]
+    assert not days.duplicated().any()
+
+
+def test_drop_superseded_keeps_finished_and_outside_entries():
+    window = (dt.date(2025, 9, 1), dt.date(2025, 9, 30))
+    done = {
+        "inside_provisional": {"start": "2025-09-01", "end": "2025-09-10", "provisional": True,
+                               "file": "a.parquet"},
+        "inside_empty": {"start": "2025-09-11", "end": "2025-09-12", "provisional": True, "file": None},
+        "inside_finished": {"start": "2025-09-01", "end": "2025-09-07", "provisional": False,
+                            "file": "b.parquet"},
+        "outside_provisional": {"start": "2025-08-28", "end": "2025-09-03", "provisional": True,
+                                "file": "c.parquet"},
+        window_key(window): {"start": "2025-09-01", "end": "2025-09-30", "provisional": True,
+                             "file": "d.parquet"},
+    }
+    assert _drop_superseded(done, window) == ["a.parquet"]
+    assert set(done) == {"inside_finished", "outside_provisional", window_key(window)}
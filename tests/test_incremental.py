@@ -0,0 +1,44 @@
+"""statcast_tools.incremental.merge_dedup: refetched pitches replace stored ones."""
+
+import pathlib
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+from statcast_tools.incremental import merge_dedup  # noqa: E402
+
+
+def _pitches(keys, speed, **extra):
+    df = pd.DataFrame(keys, columns=["game_pk", "at_bat_number", "pitch_number"])
+    df["release_speed"] = speed
+    return df.assign(**extra)
+
+
+def test_new_version_of_a_pitch_wins():
+    old = _pitches([(1, 1, 1), (1, 1, 2), (2, 1, 1)], [90.0, 91.0, 92.0])
+    new = _pitches([(1, 1, 2), (3, 1, 1)], [95.0, 96.0])
+    merged = merge_dedup(old, new).set_index(["game_pk", "at_bat_number", "pitch_number"])
+    assert len(merged) == 4
+    assert merged.loc[(1, 1, 2), "release_speed"] == 95.0
+    assert merged.loc[(1, 1, 1), "release_speed"] == 90.0
+    assert merged.loc[(3, 1, 1), "release_speed"] == 96.0
+
+
+def test_same_pitch_number_in_another_at_bat_is_kept():
+    old = _pitches([(1, 1, 1)], [90.0])
+    new = _pitches([(1, 2, 1)], [91.0])
+    assert len(merge_dedup(old, new)) == 2
+
+
+def test_columns_are_unified():
+    old = _pitches([(1, 1, 1)], [90.0])
+    new = _pitches([(1, 1, 1), (1, 1, 2)], [90.5, 91.0], bat_speed=[70.0, None])
+    merged = merge_dedup(old, new)
+    assert list(merged.columns) == ["game_pk", "at_bat_number", "pitch_number", "release_speed",
+                                    "bat_speed"]
+    assert merged["bat_speed"].tolist()[0] == 70.0
+
+
+def test_empty_inputs():
+    assert merge_dedup(pd.DataFrame(), pd.DataFrame()).empty
@@ -0,0 +1,44 @@
+"""statcast_tools.loader: the CSV and Parquet paths must apply a predicate alike."""
+
+import pathlib
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+from statcast_tools.loader import load_statcast  # noqa: E402
+
+PREDICATES = [
+    [("bat_speed", "!=", 70.0)],
+    [("bat_speed", "==", 70.0)],
+    [("bat_speed", ">", 69.0)],
+    [("bat_speed", "<=", 70.0)],
+    [("pitch_type", "!=", "FF")],
+    [("pitch_type", "in", ["FF", "SL"])],
+    [("pitch_type", "not in", ["FF"])],
+    [("bat_speed", "notna", None), ("pitch_type", "!=", "SL")],
+    [("bat_speed", "isna", None)],
+]
+
+
+@pytest.fixture(scope="module")
+def paths(tmp_path_factory):
+    df = pd.DataFrame({
+        "game_pk": np.arange(6),
+        "pitch_type": ["FF", "SL", None, "FF", "CH", None],
+        "bat_speed": [70.0, np.nan, 72.5, np.nan, 68.0, 70.0],
+    })
+    out = tmp_path_factory.mktemp("loader")
+    df.to_csv(out / "statcast.csv", index=False)
+    df.to_parquet(out / "statcast.parquet", index=False)
+    return out / "statcast.csv", out / "statcast.parquet"
+
+
+@pytest.mark.parametrize("predicate", PREDICATES, ids=str)
+def test_csv_and_parquet_select_the_same_rows(paths, predicate):
+    csv_path, parquet_path = paths
+    from_csv = load_statcast(csv_path, columns=["game_pk"], predicate=predicate)
+    from_parquet = load_statcast(parquet_path, columns=["game_pk"], predicate=predicate)
+    assert sorted(from_csv["game_pk"]) == sorted(from_parquet["game_pk"])
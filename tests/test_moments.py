@@ -0,0 +1,58 @@
+"""statcast_tools.moments.CoMoments: chunked and merged results match numpy / pandas."""
+
+import pathlib
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+from statcast_tools.moments import CoMoments  # noqa: E402
+
+COLUMNS = ["bat_speed", "launch_speed", "swing_length"]
+
+
+def _frame(n=2_000, seed=0):
+    rng = np.random.default_rng(seed)
+    bat = rng.normal(70, 4, n)
+    df = pd.DataFrame({
+        "bat_speed": bat,
+        "launch_speed": 1.2 * bat + rng.normal(0, 6, n) + 5,
+        "swing_length": 0.05 * bat + rng.normal(0, 0.4, n) + 3.5,
+    })
+    # Missing values in different rows per column, so counts are pairwise
+    for col, frac in zip(COLUMNS, (0.05, 0.3, 0.1)):
+        df.loc[rng.random(n) < frac, col] = np.nan
+    return df
+
+
+def _accumulate(df, chunk_rows):
+    stats = CoMoments(COLUMNS)
+    for start in range(0, len(df), chunk_rows):
+        stats.update(df.iloc[start:start + chunk_rows])
+    return stats
+
+
+def test_merged_halves_match_pandas():
+    df = _frame()
+    stats = _accumulate(df.iloc[:700], 128).merge(_accumulate(df.iloc[700:], 333))
+    np.testing.assert_allclose(stats.corr().to_numpy(), df.corr().to_numpy(), rtol=1e-10)
+    np.testing.assert_allclose(stats.cov().to_numpy(), df.cov().to_numpy(), rtol=1e-10)
+    assert stats.count("bat_speed", "launch_speed") == df[["bat_speed", "launch_speed"]].notna().all(axis=1).sum()
+
+
+def test_ols_matches_polyfit_on_pairwise_complete_rows():
+    df = _frame(seed=1)
+    stats = _accumulate(df, 250)
+    both = df[["bat_speed", "launch_speed"]].dropna()
+    expected = np.polyfit(both["bat_speed"], both["launch_speed"], 1)
+    np.testing.assert_allclose(stats.ols("bat_speed", "launch_speed"), expected, rtol=1e-10)
+
+
+def test_merge_order_does_not_matter():
+    df = _frame(seed=2)
+    a, b = df.iloc[:1_200], df.iloc[1_200:]
+    ab = _accumulate(a, 400).merge(_accumulate(b, 400))
+    ba = _accumulate(b, 400).merge(_accumulate(a, 400))
+    np.testing.assert_allclose(ab.corr().to_numpy(), ba.corr().to_numpy(), rtol=1e-12)
+    np.testing.assert_allclose(ab.mean, ba.mean, rtol=1e-12)
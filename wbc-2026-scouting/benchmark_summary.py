@@ -0,0 +1,223 @@
+"""Benchmark: vectorized vs legacy per-player summary stats
+
+Builds synthetic batter / pitcher Statcast frames the size of the published
+files, runs the vectorized batting_summary / pitching_summary from
+generate.py and the original per-group loops kept below, checks that the
+CSV output is byte-identical and prints the timings.
+
+Usage:
+  python benchmark_summary.py [--batter-rows 338000] [--pitcher-rows 220000] [--repeat 3]
+"""
+
+import argparse
+import pathlib
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent))
+from generate import (AB_EVENTS, COUNTRY_MAP, HIT_EVENTS, PA_EVENTS,  # noqa: E402
+                      batting_summary, pitching_summary)
+
+# Share of pitches per event (the rest end without a PA outcome)
+EVENT_MIX = {
+    "field_out": 0.090, "strikeout": 0.055, "single": 0.035, "walk": 0.020,
+    "double": 0.011, "home_run": 0.007, "grounded_into_double_play": 0.005,
+    "force_out": 0.004, "hit_by_pitch": 0.003, "sac_fly": 0.002,
+    "field_error": 0.002, "fielders_choice": 0.001, "triple": 0.001,
+    "intent_walk": 0.001, "double_play": 0.0005, "sac_bunt": 0.0005,
+    "strikeout_double_play": 0.0003, "catcher_interf": 0.0002,
+    "fielders_choice_out": 0.0005, "truncated_pa": 0.0005,
+}
+PITCH_TYPES = ["FF", "SI", "SL", "CH", "CU", "FC", "ST", "FS", "KC", "SV"]
+
+
+# ---------------------------------------------------------------------------
+# Synthetic input
+# ---------------------------------------------------------------------------
+def synthetic_statcast(rows: int, players: int, role: str, seed: int) -> pd.DataFrame:
+    """Pitch-level frame with the columns the summaries read."""
+    rng = np.random.default_rng(seed)
+    ids = rng.choice(np.arange(400000, 700000), players, replace=False)
+    # Skewed workloads, a few duplicate names, some two-country players
+    weights = rng.pareto(1.5, players) + 0.05
+    player = rng.choice(ids, rows, p=weights / weights.sum())
+    names = {pid: f"Player {i % (players - 3)}" for i, pid in enumerate(ids)}
+    countries = [v[0] for v in COUNTRY_MAP.values()]
+    home = {pid: countries[i % len(countries)] for i, pid in enumerate(ids)}
+    country = np.array([home[p] for p in player], dtype=object)
+    swap = np.isin(player, ids[:3]) & (rng.random(rows) < 0.3)
+    country[swap] = "ITA"
+
+    events = np.full(rows, None, dtype=object)
+    labels = list(EVENT_MIX)
+    p = np.array(list(EVENT_MIX.values()))
+    has_event = rng.random(rows) < p.sum()
+    events[has_event] = rng.choice(labels, has_event.sum(), p=p / p.sum())
+
+    def with_nans(values, share):
+        values = values.astype("float64")
+        values[rng.random(rows) < share] = np.nan
+        return values
+
+    df = pd.DataFrame({
+        role: player,
+        "player_name": [names[p] for p in player],
+        "events": events,
+        "pitch_type": np.where(rng.random(rows) < 0.01, None,
+                               rng.choice(PITCH_TYPES, rows, p=np.linspace(3, 1, 10) / 20)),
+        "release_speed": with_nans(rng.normal(91, 5, rows).round(1), 0.01),
+        "release_spin_rate": with_nans(rng.normal(2300, 250, rows).round(0), 0.03),
+        "launch_speed": with_nans(rng.normal(88, 14, rows).round(1), 0.7),
+        "launch_angle": with_nans(rng.normal(12, 25, rows).round(0), 0.7),
+        "estimated_woba_using_speedangle": with_nans(rng.beta(2, 4, rows).round(3), 0.75),
+        "country": country,
+    })
+    df["country_name"] = df["country"]
+    return df
+
+
+# ---------------------------------------------------------------------------
+# Legacy implementations (per-group Python loops), kept for comparison
+# ---------------------------------------------------------------------------
+def legacy_batting_summary(df: pd.DataFrame) -> pd.DataFrame:
+    rows = []
+    for (batter_id, country), gdf in df.groupby(["batter", "country"]):
+        name = gdf["player_name"].iloc[0]
+        evts = gdf.dropna(subset=["events"])
+        pa = evts[evts["events"].isin(PA_EVENTS)]
+        ab = evts[evts["events"].isin(AB_EVENTS)]
+        hits = evts[evts["events"].isin(HIT_EVENTS)]
+
+        n_pa   = len(pa)
+        n_ab   = len(ab)
+        n_h    = len(hits)
+        n_bb   = len(pa[pa["events"].isin({"walk", "intent_walk"})])
+        n_hbp  = len(pa[pa["events"] == "hit_by_pitch"])
+        n_1b   = len(hits[hits["events"] == "single"])
+        n_2b   = len(hits[hits["events"] == "double"])
+        n_3b   = len(hits[hits["events"] == "triple"])
+        n_hr   = len(hits[hits["events"] == "home_run"])
+        n_k    = len(ab[ab["events"].str.contains("strikeout", na=False)])
+        tb     = n_1b + 2 * n_2b + 3 * n_3b + 4 * n_hr
+        avg    = n_h / n_ab if n_ab else np.nan
+        obp    = (n_h + n_bb + n_hbp) / n_pa if n_pa else np.nan
+        slg    = tb / n_ab if n_ab else np.nan
+        ops    = obp + slg if not (pd.isna(obp) or pd.isna(slg)) else np.nan
+        k_pct  = n_k / n_pa * 100 if n_pa else np.nan
+        bb_pct = n_bb / n_pa * 100 if n_pa else np.nan
+        xwoba  = gdf["estimated_woba_using_speedangle"].dropna().mean()
+        avg_ev = gdf["launch_speed"].dropna().mean()
+        avg_la = gdf["launch_angle"].dropna().mean()
+
+        rows.append({
+            "mlbam_id": int(batter_id), "player_name": name, "country": country,
+            "PA": n_pa, "AB": n_ab, "H": n_h,
+            "1B": n_1b, "2B": n_2b, "3B": n_3b, "HR": n_hr,
+            "BB": n_bb, "HBP": n_hbp, "K": n_k, "TB": tb,
+            "AVG":   round(avg,   3) if not pd.isna(avg)   else np.nan,
+            "OBP":   round(obp,   3) if not pd.isna(obp)   else np.nan,
+            "SLG":   round(slg,   3) if not pd.isna(slg)   else np.nan,
+            "OPS":   round(ops,   3) if not pd.isna(ops)   else np.nan,
+            "K_pct": round(k_pct,  1) if not pd.isna(k_pct)  else np.nan,
+            "BB_pct": round(bb_pct, 1) if not pd.isna(bb_pct) else np.nan,
+            "xwOBA": round(xwoba,  3) if not pd.isna(xwoba)  else np.nan,
+            "avg_exit_velo":    round(avg_ev, 1) if not pd.isna(avg_ev) else np.nan,
+            "avg_launch_angle": round(avg_la, 1) if not pd.isna(avg_la) else np.nan,
+        })
+
+    return pd.DataFrame(rows).sort_values(["country", "player_name"]).reset_index(drop=True)
+
+
+def legacy_pitching_summary(df: pd.DataFrame) -> pd.DataFrame:
+    rows = []
+    for (pitcher_id, country), gdf in df.groupby(["pitcher", "country"]):
+        name = gdf["player_name"].iloc[0]
+        total_pitches = len(gdf)
+        evts  = gdf.dropna(subset=["events"])
+        pa    = evts[evts["events"].isin(PA_EVENTS)]
+        ab    = evts[evts["events"].isin(AB_EVENTS)]
+        hits  = evts[evts["events"].isin(HIT_EVENTS)]
+
+        n_pa  = len(pa)
+        n_ab  = len(ab)
+        n_h   = len(hits)
+        n_k   = len(ab[ab["events"].str.contains("strikeout", na=False)])
+        n_bb  = len(pa[pa["events"].isin({"walk", "intent_walk"})])
+        n_hr  = len(hits[hits["events"] == "home_run"])
+        n_1b  = len(hits[hits["events"] == "single"])
+        n_2b  = len(hits[hits["events"] == "double"])
+        n_3b  = len(hits[hits["events"] == "triple"])
+        tb    = n_1b + 2 * n_2b + 3 * n_3b + 4 * n_hr
+        opp_avg = n_h / n_ab if n_ab else np.nan
+        opp_slg = tb / n_ab if n_ab else np.nan
+        k_pct   = n_k / n_pa * 100 if n_pa else np.nan
+        bb_pct  = n_bb / n_pa * 100 if n_pa else np.nan
+        xwoba   = gdf["estimated_woba_using_speedangle"].dropna().mean()
+        avg_velo = gdf["release_speed"].dropna().mean() if "release_speed" in gdf.columns else np.nan
+        avg_spin = gdf["release_spin_rate"].dropna().mean() if "release_spin_rate" in gdf.columns else np.nan
+        pitch_counts  = gdf["pitch_type"].value_counts()
+        top_pitch     = pitch_counts.index[0] if len(pitch_counts) > 0 else ""
+        n_pitch_types = len(pitch_counts)
+
+        rows.append({
+            "mlbam_id": int(pitcher_id), "player_name": name, "country": country,
+            "total_pitches": total_pitches, "PA_faced": n_pa,
+            "K": n_k, "BB": n_bb, "HR_allowed": n_hr, "H_allowed": n_h,
+            "opp_AVG": round(opp_avg, 3) if not pd.isna(opp_avg) else np.nan,
+            "opp_SLG": round(opp_slg, 3) if not pd.isna(opp_slg) else np.nan,
+            "K_pct":   round(k_pct,  1) if not pd.isna(k_pct)  else np.nan,
+            "BB_pct":  round(bb_pct, 1) if not pd.isna(bb_pct) else np.nan,
+            "xwOBA_against":  round(xwoba,    3) if not pd.isna(xwoba)    else np.nan,
+            "avg_velo":       round(avg_velo,  1) if not pd.isna(avg_velo) else np.nan,
+            "avg_spin_rate":  round(avg_spin,  0) if not pd.isna(avg_spin) else np.nan,
+            "pitch_type_count": n_pitch_types,
+            "primary_pitch": top_pitch,
+        })
+
+    return pd.DataFrame(rows).sort_values(["country", "player_name"]).reset_index(drop=True)
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+def best_time(fn, df: pd.DataFrame, repeat: int) -> tuple[float, pd.DataFrame]:
+    """Fastest of ``repeat`` runs (seconds) and the last result."""
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn(df)
+        times.append(time.perf_counter() - t0)
+    return min(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batting/pitching summary engines")
+    parser.add_argument("--batter-rows", type=int, default=338_000)
+    parser.add_argument("--pitcher-rows", type=int, default=220_000)
+    parser.add_argument("--batters", type=int, default=105)
+    parser.add_argument("--pitchers", type=int, default=86)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    cases = [
+        ("batting_summary", synthetic_statcast(args.batter_rows, args.batters, "batter", seed=1),
+         legacy_batting_summary, batting_summary),
+        ("pitching_summary", synthetic_statcast(args.pitcher_rows, args.pitchers, "pitcher", seed=2),
+         legacy_pitching_summary, pitching_summary),
+    ]
+    print(f"{'function':18s} {'rows':>9s} {'legacy':>9s} {'vectorized':>11s} {'speedup':>8s}  identical")
+    for name, df, legacy, vectorized in cases:
+        t_old, old = best_time(legacy, df, args.repeat)
+        t_new, new = best_time(vectorized, df, args.repeat)
+        identical = old.to_csv(index=False) == new.to_csv(index=False)
+        print(f"{name:18s} {len(df):9,d} {t_old:8.3f}s {t_new:10.3f}s {t_old / t_new:7.1f}x  "
+              f"{'yes' if identical else 'NO'}")
+        if not identical:
+            raise SystemExit(f"{name}: vectorized output differs from the legacy loop")
+
+
+if __name__ == "__main__":
+    main()
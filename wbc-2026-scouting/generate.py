@@ -8,10 +8,13 @@ Data source:
   WBC 2026 official roster (Baseball America, February 2026)
 
 Usage:
-  python generate.py --wbc-dir /path/to/wbc-scouting --out-dir /path/to/output
+  python generate.py --wbc-dir /path/to/wbc-scouting --out-dir /path/to/output \
+      [--workers N] [--cache-dir /path/to/parse-cache]
+  python generate.py --wbc-dir ... --engine duckdb [--memory-limit 2GB]
 
 Requirements:
-  pip install pandas numpy pybaseball
+  pip install pandas numpy pyarrow pybaseball
+  pip install duckdb  (only for --engine duckdb)
 
 Input directory layout expected (wbc-scouting/data/):
   <country>_statcast.csv          -- batter pitch-level data
@@ -21,11 +24,27 @@ Input directory layout expected (wbc-scouting/data/):
 """
 
 import argparse
+import hashlib
+import json
+import os
 import pathlib
 import re
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+
+# The compact Statcast dtype schema lives in statcast_tools/ at the repository root
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+from statcast_tools.schema import (  # noqa: E402
+    CATEGORY_COLUMNS, FLOAT32_COLUMNS, INT32_COLUMNS, SCHEMA_VERSION,
+)
 
 # ---------------------------------------------------------------------------
 # Country mapping: CSV prefix -> (ISO code, country name, pool)
@@ -188,10 +207,118 @@ def parse_roster(data_dir: pathlib.Path) -> pd.DataFrame:
 # ---------------------------------------------------------------------------
 # 2. Combine raw Statcast CSVs
 # ---------------------------------------------------------------------------
-def combine_statcast(data_dir: pathlib.Path, pattern_suffix: str,
-                     exclude_pattern: str = "") -> pd.DataFrame:
-    """Combine all Statcast CSVs matching pattern into one DataFrame."""
-    frames = []
+READ_THREADS = 4  # files parsed at once; each parse is itself multithreaded
+
+# Compact schema as pyarrow parse types. Integer columns are parsed as
+# float64 first because pandas-written CSVs store nullable ids as "660271.0".
+PARSE_TYPES = {
+    **{c: pa.dictionary(pa.int32(), pa.string()) for c in CATEGORY_COLUMNS},
+    **{c: pa.float32() for c in FLOAT32_COLUMNS},
+    **{c: pa.float64() for c in INT32_COLUMNS},
+    "game_date": pa.string(),
+}
+
+
+def _constant_column(value: str, n: int) -> pa.DictionaryArray:
+    return pa.DictionaryArray.from_arrays(pa.array(np.zeros(n, dtype="int32")), pa.array([value]))
+
+
+def read_statcast_csv(csv_path: pathlib.Path, iso: str, country_name: str) -> pa.Table:
+    """Parse one Statcast CSV with the compact schema applied at parse time."""
+    table = pa_csv.read_csv(
+        csv_path,
+        read_options=pa_csv.ReadOptions(use_threads=True),
+        convert_options=pa_csv.ConvertOptions(column_types=PARSE_TYPES, strings_can_be_null=True),
+    )
+    for i, name in enumerate(table.column_names):
+        if name in INT32_COLUMNS:
+            table = table.set_column(i, name, table.column(i).cast(pa.int32()))
+    n = table.num_rows
+    table = table.append_column("country", _constant_column(iso, n))
+    return table.append_column("country_name", _constant_column(country_name, n))
+
+
+def unify_tables(tables: list[pa.Table]) -> pa.Table:
+    """Concatenate tables whose column sets or types differ.
+
+    Columns keep their first-seen order; missing columns are filled with
+    nulls and types are promoted (e.g. all-null -> float32), never to object.
+    """
+    schema = pa.unify_schemas([t.schema for t in tables], promote_options="permissive")
+    aligned = []
+    for t in tables:
+        for field in schema:
+            if field.name not in t.column_names:
+                t = t.append_column(field, pa.nulls(t.num_rows, field.type))
+        aligned.append(t.select(schema.names).cast(schema))
+    return pa.concat_tables(aligned)
+
+
+# Parse cache: one Arrow (feather) copy of every parsed CSV plus a manifest of
+# the source's size, mtime and SHA-256. A file is re-parsed only when its
+# content changed; an mtime change alone (e.g. a fresh checkout) just costs a
+# hash. Bump PARSE_CACHE_VERSION when read_statcast_csv changes its output.
+PARSE_CACHE_VERSION = 1
+PARSE_CACHE_MANIFEST = "manifest.json"
+
+
+def _sha256(path: pathlib.Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_parse_cache(cache_dir: pathlib.Path) -> dict:
+    """Cache manifest, or an empty one if missing or written by another version."""
+    empty = {"version": PARSE_CACHE_VERSION, "schema_version": SCHEMA_VERSION, "files": {}}
+    path = cache_dir / PARSE_CACHE_MANIFEST
+    if not path.exists():
+        return empty
+    manifest = json.loads(path.read_text(encoding="utf-8"))
+    if (manifest.get("version"), manifest.get("schema_version")) != (PARSE_CACHE_VERSION, SCHEMA_VERSION):
+        return empty
+    return manifest
+
+
+def save_parse_cache(cache_dir: pathlib.Path, manifest: dict) -> None:
+    """Write the manifest atomically."""
+    tmp = cache_dir / (PARSE_CACHE_MANIFEST + ".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, cache_dir / PARSE_CACHE_MANIFEST)
+
+
+def cached_read(csv_path: pathlib.Path, iso: str, country_name: str,
+                cache_dir: pathlib.Path, manifest: dict) -> tuple[pa.Table, bool]:
+    """read_statcast_csv through the parse cache; returns (table, from_cache)."""
+    stat = csv_path.stat()
+    entry = manifest["files"].get(csv_path.name)
+    cached = cache_dir / f"{csv_path.stem}.arrow"
+    digest = None
+    if entry and entry["country"] == iso and entry["size"] == stat.st_size and cached.exists():
+        if entry["mtime_ns"] == stat.st_mtime_ns:
+            return feather.read_table(cached), True
+        digest = _sha256(csv_path)
+        if digest == entry["sha256"]:
+            entry["mtime_ns"] = stat.st_mtime_ns
+            return feather.read_table(cached), True
+
+    table = read_statcast_csv(csv_path, iso, country_name)
+    tmp = cached.with_suffix(".arrow.tmp")
+    feather.write_feather(table, tmp, compression="zstd")
+    os.replace(tmp, cached)
+    manifest["files"][csv_path.name] = {
+        "country": iso, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+        "sha256": digest or _sha256(csv_path), "rows": table.num_rows,
+    }
+    return table, False
+
+
+def statcast_inputs(data_dir: pathlib.Path, pattern_suffix: str,
+                    exclude_pattern: str = "") -> list[tuple[pathlib.Path, str, str]]:
+    """(csv_path, ISO code, country name) of every Statcast CSV matching pattern."""
+    jobs = []
     for csv_path in sorted(data_dir.glob(f"*{pattern_suffix}")):
         if exclude_pattern and exclude_pattern in csv_path.name:
             continue
@@ -201,140 +328,558 @@ def combine_statcast(data_dir: pathlib.Path, pattern_suffix: str,
             print(f"  SKIP unknown prefix: {prefix} ({csv_path.name})")
             continue
         iso, country_name, _ = COUNTRY_MAP[prefix]
-        df = pd.read_csv(csv_path)
-        df["country"] = iso
-        df["country_name"] = country_name
-        frames.append(df)
-        print(f"  {csv_path.name}: {len(df):,} rows ({iso})")
+        jobs.append((csv_path, iso, country_name))
+    return jobs
 
-    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+def combine_statcast(data_dir: pathlib.Path, pattern_suffix: str,
+                     exclude_pattern: str = "",
+                     cache_dir: pathlib.Path | None = None) -> pd.DataFrame:
+    """Combine all Statcast CSVs matching pattern into one DataFrame.
+
+    Files are parsed concurrently by pyarrow's multithreaded CSV reader
+    straight into the compact schema (category / float32 / Int32). With
+    ``cache_dir``, unchanged files are loaded from the parse cache instead.
+    """
+    jobs = statcast_inputs(data_dir, pattern_suffix, exclude_pattern)
+    if not jobs:
+        return pd.DataFrame()
+
+    if cache_dir is None:
+        def read(job):
+            return read_statcast_csv(*job), False
+    else:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        manifest = load_parse_cache(cache_dir)
+
+        def read(job):
+            return cached_read(*job, cache_dir, manifest)
+
+    with ThreadPoolExecutor(max_workers=READ_THREADS) as pool:
+        results = list(pool.map(read, jobs))
+    if cache_dir is not None:
+        # Forget inputs that no longer exist
+        for name in [n for n in manifest["files"] if not (data_dir / n).exists()]:
+            (cache_dir / f"{pathlib.Path(name).stem}.arrow").unlink(missing_ok=True)
+            del manifest["files"][name]
+        save_parse_cache(cache_dir, manifest)
+    tables = [table for table, _ in results]
+    for (csv_path, iso, _), (table, hit) in zip(jobs, results):
+        print(f"  {csv_path.name}: {table.num_rows:,} rows ({iso}){' [cached]' if hit else ''}")
+
+    df = unify_tables(tables).to_pandas(types_mapper={pa.int32(): pd.Int32Dtype()}.get)
+    # Sorted categories so categorical columns order like plain strings
+    for col in df.select_dtypes("category").columns:
+        df[col] = df[col].cat.set_categories(sorted(df[col].cat.categories))
+    return df
+
+
+# ---------------------------------------------------------------------------
+# 2a. Spray coordinates for batted balls
+# ---------------------------------------------------------------------------
+# hc_x / hc_y are Savant pixel coordinates; the same transform as
+# baseball_field_viz.transform_coords turns them into feet with home plate at
+# (0, 0) and y toward center field. spray_angle is degrees from the center
+# field line (negative toward left field). A ball is "pull" more than
+# SPRAY_PULL_ANGLE degrees to the batter's pull side (left field for R,
+# right field for L), "oppo" as far the other way and "center" in between.
+SPRAY_HOME_X = 125.42
+SPRAY_HOME_Y = 198.27
+SPRAY_SCALE = 2.5
+SPRAY_PULL_ANGLE = 15.0
+SPRAY_COLUMNS = ["spray_x", "spray_y", "spray_angle", "spray_distance", "spray_direction"]
+
+
+def add_spray_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Append SPRAY_COLUMNS (float32 / category), NaN where hc_x or hc_y is missing."""
+    hc_x = df["hc_x"].to_numpy("float64", na_value=np.nan)
+    hc_y = df["hc_y"].to_numpy("float64", na_value=np.nan)
+    x = SPRAY_SCALE * (hc_x - SPRAY_HOME_X)
+    y = SPRAY_SCALE * (SPRAY_HOME_Y - hc_y)
+    angle = np.degrees(np.arctan2(x, y))
+
+    # Signed toward the batter's pull side: positive = pulled
+    stand = df["stand"].astype(object).to_numpy() if "stand" in df.columns else np.full(len(df), None)
+    pull = np.where(stand == "R", -angle, np.where(stand == "L", angle, np.nan))
+    direction = np.select([pull > SPRAY_PULL_ANGLE, pull < -SPRAY_PULL_ANGLE, ~np.isnan(pull)],
+                          ["pull", "oppo", "center"], default=None)
+
+    df = df.copy()
+    df["spray_x"] = x.astype("float32")
+    df["spray_y"] = y.astype("float32")
+    df["spray_angle"] = angle.astype("float32")
+    df["spray_distance"] = np.hypot(x, y).astype("float32")
+    df["spray_direction"] = pd.Categorical(direction, categories=["center", "oppo", "pull"])
+    return df
+
+
+def spray_sql() -> str:
+    """SPRAY_COLUMNS as DuckDB select expressions over hc_x / hc_y / stand."""
+    x = f"({SPRAY_SCALE} * (hc_x - {SPRAY_HOME_X}))"
+    y = f"({SPRAY_SCALE} * ({SPRAY_HOME_Y} - hc_y))"
+    angle = f"degrees(atan2({x}, {y}))"
+    pull = f"(CASE stand WHEN 'R' THEN -{angle} WHEN 'L' THEN {angle} END)"
+    return (f"CAST({x} AS FLOAT) AS spray_x, CAST({y} AS FLOAT) AS spray_y, "
+            f"CAST({angle} AS FLOAT) AS spray_angle, "
+            f"CAST(sqrt({x} * {x} + {y} * {y}) AS FLOAT) AS spray_distance, "
+            f"CASE WHEN {pull} > {SPRAY_PULL_ANGLE} THEN 'pull' "
+            f"WHEN {pull} < -{SPRAY_PULL_ANGLE} THEN 'oppo' "
+            f"WHEN {pull} IS NOT NULL THEN 'center' END AS spray_direction")
+
+
+# ---------------------------------------------------------------------------
+# 2b. Country-clustered Parquet copies with a row-range index
+# ---------------------------------------------------------------------------
+# statcast_batters.parquet / statcast_pitchers.parquet hold the combined rows
+# sorted by (country, player id), one row group per country. The sidecar
+# <name>_index.json maps every country and player to its [start, stop) row
+# range and every country to its [first, stop) row groups, so a reader can
+# load one country's row groups only, or slice a loaded frame instead of
+# filtering it.
+CLUSTER_COMPRESSION = "zstd"
+
+
+def write_clustered_parquet(df: pd.DataFrame, path: pathlib.Path, player_col: str) -> None:
+    """Write df sorted by (country, player_col), one row group per country."""
+    df = df.sort_values(["country", player_col], kind="stable")
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sizes = df.groupby("country", observed=True, sort=True).size()
+    with pq.ParquetWriter(path, table.schema, compression=CLUSTER_COMPRESSION) as writer:
+        start = 0
+        for n in sizes.to_numpy():
+            writer.write_table(table.slice(start, n), row_group_size=max(int(n), 1))
+            start += n
+
+
+def write_cluster_index(path: pathlib.Path, player_col: str) -> pathlib.Path:
+    """Build <stem>_index.json for a clustered Parquet file from its key columns."""
+    pf = pq.ParquetFile(path)
+    keys = pf.read(columns=["country", "country_name", player_col, "player_name"]).to_pandas()
+    group_stops = np.cumsum([pf.metadata.row_group(i).num_rows for i in range(pf.num_row_groups)])
+
+    countries, players = {}, {}
+    for (iso, name), rows in keys.groupby(["country", "country_name"], observed=True, sort=False).indices.items():
+        start, stop = int(rows[0]), int(rows[-1]) + 1
+        countries[iso] = {
+            "country_name": name,
+            "rows": [start, stop],
+            "row_groups": [int(np.searchsorted(group_stops, start, side="right")),
+                           int(np.searchsorted(group_stops, stop - 1, side="right")) + 1],
+        }
+        players[iso] = {}
+    for (iso, pid), rows in keys.groupby(["country", player_col], observed=True, sort=False).indices.items():
+        players[iso][str(int(pid))] = {
+            "player_name": keys["player_name"].iat[rows[0]],
+            "rows": [int(rows[0]), int(rows[-1]) + 1],
+        }
+
+    index_path = path.with_name(f"{path.stem}_index.json")
+    with open(index_path, "w") as f:
+        json.dump({"file": path.name, "rows": pf.metadata.num_rows,
+                   "sort_keys": ["country", player_col],
+                   "countries": countries, "players": players}, f, indent=1)
+    return index_path
 
 
 # ---------------------------------------------------------------------------
 # 3. Compute summary stats
 # ---------------------------------------------------------------------------
+AB_EVENTS = {
+    "single", "double", "triple", "home_run", "field_out",
+    "strikeout", "grounded_into_double_play", "double_play",
+    "force_out", "fielders_choice", "fielders_choice_out",
+    "strikeout_double_play", "triple_play", "field_error",
+}
+PA_EVENTS = AB_EVENTS | {
+    "walk", "hit_by_pitch", "sac_fly", "sac_bunt",
+    "sac_fly_double_play", "catcher_interf", "intent_walk",
+}
+HIT_EVENTS = {"single", "double", "triple", "home_run"}
+
+# Indicator column -> events it counts
+EVENT_INDICATORS = {
+    "PA":  PA_EVENTS,
+    "AB":  AB_EVENTS,
+    "H":   HIT_EVENTS,
+    "1B":  {"single"},
+    "2B":  {"double"},
+    "3B":  {"triple"},
+    "HR":  {"home_run"},
+    "BB":  {"walk", "intent_walk"},
+    "HBP": {"hit_by_pitch"},
+    "K":   {e for e in AB_EVENTS if "strikeout" in e},
+}
+
+
+def event_indicators(events: pd.Series) -> pd.DataFrame:
+    """One-hot encode the events column into 0/1 EVENT_INDICATORS columns."""
+    codes, uniques = pd.factorize(events)
+    uniques = np.asarray(uniques, dtype=object)
+    out = {}
+    for name, members in EVENT_INDICATORS.items():
+        # Trailing False is picked by code -1 (no event on this pitch)
+        flags = np.append(np.isin(uniques, list(members)), False)
+        out[name] = flags[codes].astype("int64")
+    return pd.DataFrame(out, index=events.index)
+
+
+def _event_counts(df: pd.DataFrame, keys: list[str]) -> pd.DataFrame:
+    """Indicator sums per group, plus the first player_name of each group."""
+    counts = pd.concat([df[keys], event_indicators(df["events"])], axis=1).groupby(keys, observed=True).sum()
+    names = df[keys + ["player_name"]].drop_duplicates(keys).set_index(keys)["player_name"]
+    counts.insert(0, "player_name", names.reindex(counts.index))
+    return counts
+
+
+def _group_mean(df: pd.DataFrame, keys: list[str], col: str, index: pd.Index) -> np.ndarray:
+    """Mean of the non-null values of col per group, aligned to index.
+
+    Each group's values are summed in row order with one NumPy reduction,
+    the same way Series.mean() does, so rounded results match it exactly.
+    """
+    if col not in df.columns:
+        return np.full(len(index), np.nan)
+    sub = df.loc[df[col].notna(), keys + [col]]
+    grouped = sub.groupby(keys, observed=True)
+    gid = grouped.ngroup().to_numpy()
+    keep = gid >= 0  # rows with a null key belong to no group
+    order = np.argsort(gid[keep], kind="stable")
+    values = sub[col].to_numpy()
+    if values.dtype == np.float32:
+        # Widen through the shortest decimal repr: 95.3f -> 95.3, not 95.30000305
+        values = values.astype(str)
+    values = values.astype("float64")[keep][order]
+    sizes = grouped.size()
+    chunks = np.split(values, np.cumsum(sizes.to_numpy())[:-1])
+    means = pd.Series([c.sum() / len(c) for c in chunks], index=sizes.index, dtype="float64")
+    return means.reindex(index).to_numpy()
+
+
+def _ratio(num, den, scale: int = 1) -> np.ndarray:
+    """num / den * scale, NaN where den is 0."""
+    num = np.asarray(num, dtype="float64")
+    den = np.asarray(den, dtype="float64")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(den > 0, num / den * scale, np.nan)
+
+
+def _round(values: np.ndarray, ndigits: int) -> list:
+    """Round like the builtin round() on Python floats (np.round can differ)."""
+    return [round(v, ndigits) if v == v else np.nan for v in np.asarray(values).tolist()]
+
+
+def _batting_table(g: pd.DataFrame) -> pd.DataFrame:
+    """batter_summary rows from per-(batter, country) aggregates.
+
+    g holds player_name, the EVENT_INDICATORS counts and the means of the
+    source columns; both engines (pandas and DuckDB) build it.
+    """
+    tb = g["1B"] + 2 * g["2B"] + 3 * g["3B"] + 4 * g["HR"]
+    avg = _ratio(g["H"], g["AB"])
+    obp = _ratio(g["H"] + g["BB"] + g["HBP"], g["PA"])
+    slg = _ratio(tb, g["AB"])
+
+    out = pd.DataFrame({
+        "mlbam_id": g.index.get_level_values(0).astype("int64"),
+        "player_name": g["player_name"].to_numpy(),
+        "country": g.index.get_level_values("country"),
+        **{k: g[k].to_numpy() for k in ["PA", "AB", "H", "1B", "2B", "3B", "HR", "BB", "HBP", "K"]},
+        "TB": tb.to_numpy(),
+        "AVG": _round(avg, 3),
+        "OBP": _round(obp, 3),
+        "SLG": _round(slg, 3),
+        "OPS": _round(obp + slg, 3),
+        "K_pct": _round(_ratio(g["K"], g["PA"], 100), 1),
+        "BB_pct": _round(_ratio(g["BB"], g["PA"], 100), 1),
+        "xwOBA": np.round(g["estimated_woba_using_speedangle"].to_numpy("float64"), 3),
+        "avg_exit_velo": np.round(g["launch_speed"].to_numpy("float64"), 1),
+        "avg_launch_angle": np.round(g["launch_angle"].to_numpy("float64"), 1),
+    })
+    return out.sort_values(["country", "player_name"]).reset_index(drop=True)
+
+
+def _pitching_table(g: pd.DataFrame) -> pd.DataFrame:
+    """pitcher_summary rows from per-(pitcher, country) aggregates.
+
+    Like _batting_table, plus total_pitches, pitch_type_count and primary_pitch.
+    """
+    tb = g["1B"] + 2 * g["2B"] + 3 * g["3B"] + 4 * g["HR"]
+
+    out = pd.DataFrame({
+        "mlbam_id": g.index.get_level_values(0).astype("int64"),
+        "player_name": g["player_name"].to_numpy(),
+        "country": g.index.get_level_values("country"),
+        "total_pitches": g["total_pitches"].to_numpy(),
+        "PA_faced": g["PA"].to_numpy(),
+        "K": g["K"].to_numpy(),
+        "BB": g["BB"].to_numpy(),
+        "HR_allowed": g["HR"].to_numpy(),
+        "H_allowed": g["H"].to_numpy(),
+        "opp_AVG": _round(_ratio(g["H"], g["AB"]), 3),
+        "opp_SLG": _round(_ratio(tb, g["AB"]), 3),
+        "K_pct": _round(_ratio(g["K"], g["PA"], 100), 1),
+        "BB_pct": _round(_ratio(g["BB"], g["PA"], 100), 1),
+        "xwOBA_against": np.round(g["estimated_woba_using_speedangle"].to_numpy("float64"), 3),
+        "avg_velo": np.round(g["release_speed"].to_numpy("float64"), 1),
+        "avg_spin_rate": np.round(g["release_spin_rate"].to_numpy("float64"), 0),
+        "pitch_type_count": g["pitch_type_count"].to_numpy(),
+        "primary_pitch": g["primary_pitch"].to_numpy(),
+    })
+    return out.sort_values(["country", "player_name"]).reset_index(drop=True)
+
+
+BATTING_MEANS = ["estimated_woba_using_speedangle", "launch_speed", "launch_angle"]
+PITCHING_MEANS = ["estimated_woba_using_speedangle", "release_speed", "release_spin_rate"]
+
+
 def batting_summary(df: pd.DataFrame) -> pd.DataFrame:
     """Compute per-player batting summary from Statcast event-level data."""
-    AB_EVENTS = {
-        "single", "double", "triple", "home_run", "field_out",
-        "strikeout", "grounded_into_double_play", "double_play",
-        "force_out", "fielders_choice", "fielders_choice_out",
-        "strikeout_double_play", "triple_play", "field_error",
-    }
-    PA_EVENTS = AB_EVENTS | {
-        "walk", "hit_by_pitch", "sac_fly", "sac_bunt",
-        "sac_fly_double_play", "catcher_interf", "intent_walk",
-    }
-    HIT_EVENTS = {"single", "double", "triple", "home_run"}
+    keys = ["batter", "country"]
+    g = _event_counts(df, keys)
+    for col in BATTING_MEANS:
+        g[col] = _group_mean(df, keys, col, g.index)
+    return _batting_table(g)
 
-    rows = []
-    for (batter_id, country), gdf in df.groupby(["batter", "country"]):
-        name = gdf["player_name"].iloc[0]
-        evts = gdf.dropna(subset=["events"])
-        pa = evts[evts["events"].isin(PA_EVENTS)]
-        ab = evts[evts["events"].isin(AB_EVENTS)]
-        hits = evts[evts["events"].isin(HIT_EVENTS)]
-
-        n_pa   = len(pa)
-        n_ab   = len(ab)
-        n_h    = len(hits)
-        n_bb   = len(pa[pa["events"].isin({"walk", "intent_walk"})])
-        n_hbp  = len(pa[pa["events"] == "hit_by_pitch"])
-        n_1b   = len(hits[hits["events"] == "single"])
-        n_2b   = len(hits[hits["events"] == "double"])
-        n_3b   = len(hits[hits["events"] == "triple"])
-        n_hr   = len(hits[hits["events"] == "home_run"])
-        n_k    = len(ab[ab["events"].str.contains("strikeout", na=False)])
-        tb     = n_1b + 2 * n_2b + 3 * n_3b + 4 * n_hr
-        avg    = n_h / n_ab if n_ab else np.nan
-        obp    = (n_h + n_bb + n_hbp) / n_pa if n_pa else np.nan
-        slg    = tb / n_ab if n_ab else np.nan
-        ops    = obp + slg if not (pd.isna(obp) or pd.isna(slg)) else np.nan
-        k_pct  = n_k / n_pa * 100 if n_pa else np.nan
-        bb_pct = n_bb / n_pa * 100 if n_pa else np.nan
-        xwoba  = gdf["estimated_woba_using_speedangle"].dropna().mean()
-        avg_ev = gdf["launch_speed"].dropna().mean()
-        avg_la = gdf["launch_angle"].dropna().mean()
-
-        rows.append({
-            "mlbam_id": int(batter_id), "player_name": name, "country": country,
-            "PA": n_pa, "AB": n_ab, "H": n_h,
-            "1B": n_1b, "2B": n_2b, "3B": n_3b, "HR": n_hr,
-            "BB": n_bb, "HBP": n_hbp, "K": n_k, "TB": tb,
-            "AVG":   round(avg,   3) if not pd.isna(avg)   else np.nan,
-            "OBP":   round(obp,   3) if not pd.isna(obp)   else np.nan,
-            "SLG":   round(slg,   3) if not pd.isna(slg)   else np.nan,
-            "OPS":   round(ops,   3) if not pd.isna(ops)   else np.nan,
-            "K_pct": round(k_pct,  1) if not pd.isna(k_pct)  else np.nan,
-            "BB_pct": round(bb_pct, 1) if not pd.isna(bb_pct) else np.nan,
-            "xwOBA": round(xwoba,  3) if not pd.isna(xwoba)  else np.nan,
-            "avg_exit_velo":    round(avg_ev, 1) if not pd.isna(avg_ev) else np.nan,
-            "avg_launch_angle": round(avg_la, 1) if not pd.isna(avg_la) else np.nan,
-        })
-
-    return pd.DataFrame(rows).sort_values(["country", "player_name"]).reset_index(drop=True)
+
+def _pitch_mix(df: pd.DataFrame, keys: list[str], index: pd.Index) -> tuple[np.ndarray, np.ndarray]:
+    """Number of pitch types and most-thrown pitch per group (ties: first thrown)."""
+    thrown = df.loc[df["pitch_type"].notna(), keys + ["pitch_type"]]
+    mix = thrown.groupby(keys + ["pitch_type"], sort=False, observed=True).size().rename("n").reset_index()
+    n_types = mix.groupby(keys, observed=True).size().reindex(index, fill_value=0)
+    top = (mix.sort_values("n", ascending=False, kind="stable")
+              .drop_duplicates(keys).set_index(keys)["pitch_type"].astype(object))
+    return n_types.to_numpy(), top.reindex(index).fillna("").to_numpy()
 
 
 def pitching_summary(df: pd.DataFrame) -> pd.DataFrame:
     """Compute per-player pitching summary from Statcast pitch-level data."""
-    AB_EVENTS = {
-        "single", "double", "triple", "home_run", "field_out",
-        "strikeout", "grounded_into_double_play", "double_play",
-        "force_out", "fielders_choice", "fielders_choice_out",
-        "strikeout_double_play", "triple_play", "field_error",
-    }
-    PA_EVENTS = AB_EVENTS | {
-        "walk", "hit_by_pitch", "sac_fly", "sac_bunt",
-        "sac_fly_double_play", "catcher_interf", "intent_walk",
-    }
-    HIT_EVENTS = {"single", "double", "triple", "home_run"}
+    keys = ["pitcher", "country"]
+    g = _event_counts(df, keys)
+    g["total_pitches"] = df.groupby(keys, observed=True).size().reindex(g.index).to_numpy()
+    g["pitch_type_count"], g["primary_pitch"] = _pitch_mix(df, keys, g.index)
+    for col in PITCHING_MEANS:
+        g[col] = _group_mean(df, keys, col, g.index)
+    return _pitching_table(g)
 
-    rows = []
-    for (pitcher_id, country), gdf in df.groupby(["pitcher", "country"]):
-        name = gdf["player_name"].iloc[0]
-        total_pitches = len(gdf)
-        evts  = gdf.dropna(subset=["events"])
-        pa    = evts[evts["events"].isin(PA_EVENTS)]
-        ab    = evts[evts["events"].isin(AB_EVENTS)]
-        hits  = evts[evts["events"].isin(HIT_EVENTS)]
-
-        n_pa  = len(pa)
-        n_ab  = len(ab)
-        n_h   = len(hits)
-        n_k   = len(ab[ab["events"].str.contains("strikeout", na=False)])
-        n_bb  = len(pa[pa["events"].isin({"walk", "intent_walk"})])
-        n_hr  = len(hits[hits["events"] == "home_run"])
-        n_1b  = len(hits[hits["events"] == "single"])
-        n_2b  = len(hits[hits["events"] == "double"])
-        n_3b  = len(hits[hits["events"] == "triple"])
-        tb    = n_1b + 2 * n_2b + 3 * n_3b + 4 * n_hr
-        opp_avg = n_h / n_ab if n_ab else np.nan
-        opp_slg = tb / n_ab if n_ab else np.nan
-        k_pct   = n_k / n_pa * 100 if n_pa else np.nan
-        bb_pct  = n_bb / n_pa * 100 if n_pa else np.nan
-        xwoba   = gdf["estimated_woba_using_speedangle"].dropna().mean()
-        avg_velo = gdf["release_speed"].dropna().mean() if "release_speed" in gdf.columns else np.nan
-        avg_spin = gdf["release_spin_rate"].dropna().mean() if "release_spin_rate" in gdf.columns else np.nan
-        pitch_counts  = gdf["pitch_type"].value_counts()
-        top_pitch     = pitch_counts.index[0] if len(pitch_counts) > 0 else ""
-        n_pitch_types = len(pitch_counts)
-
-        rows.append({
-            "mlbam_id": int(pitcher_id), "player_name": name, "country": country,
-            "total_pitches": total_pitches, "PA_faced": n_pa,
-            "K": n_k, "BB": n_bb, "HR_allowed": n_hr, "H_allowed": n_h,
-            "opp_AVG": round(opp_avg, 3) if not pd.isna(opp_avg) else np.nan,
-            "opp_SLG": round(opp_slg, 3) if not pd.isna(opp_slg) else np.nan,
-            "K_pct":   round(k_pct,  1) if not pd.isna(k_pct)  else np.nan,
-            "BB_pct":  round(bb_pct, 1) if not pd.isna(bb_pct) else np.nan,
-            "xwOBA_against":  round(xwoba,    3) if not pd.isna(xwoba)    else np.nan,
-            "avg_velo":       round(avg_velo,  1) if not pd.isna(avg_velo) else np.nan,
-            "avg_spin_rate":  round(avg_spin,  0) if not pd.isna(avg_spin) else np.nan,
-            "pitch_type_count": n_pitch_types,
-            "primary_pitch": top_pitch,
-        })
-
-    return pd.DataFrame(rows).sort_values(["country", "player_name"]).reset_index(drop=True)
+
+# ---------------------------------------------------------------------------
+# 3b. Country-partitioned summaries on a process pool
+# ---------------------------------------------------------------------------
+SUMMARIES = {"batting_summary": batting_summary, "pitching_summary": pitching_summary}
+
+# Columns each summary reads; partitions carry only these
+SUMMARY_COLUMNS = {
+    "batting_summary": ["batter", "player_name", "country", "events",
+                        "estimated_woba_using_speedangle", "launch_speed", "launch_angle"],
+    "pitching_summary": ["pitcher", "player_name", "country", "events", "pitch_type",
+                         "estimated_woba_using_speedangle", "release_speed", "release_spin_rate"],
+}
+
+
+def _to_buffers(df: pd.DataFrame) -> dict:
+    """Column -> NumPy buffers; text columns become int32 codes plus their uniques."""
+    buffers = {}
+    for col in df.columns:
+        s = df[col]
+        if pd.api.types.is_extension_array_dtype(s.dtype) and pd.api.types.is_integer_dtype(s.dtype):
+            # Nullable ints travel as float64 with NaN for missing
+            buffers[col] = ("values", s.to_numpy("float64", na_value=np.nan), str(s.dtype))
+        elif pd.api.types.is_numeric_dtype(s.dtype):
+            buffers[col] = ("values", s.to_numpy(), str(s.dtype))
+        else:
+            codes, uniques = pd.factorize(s)
+            buffers[col] = ("codes", codes.astype("int32"), np.asarray(uniques, dtype=object), str(s.dtype))
+    return buffers
+
+
+def _from_buffers(buffers: dict) -> pd.DataFrame:
+    """Rebuild the partition DataFrame from _to_buffers output."""
+    cols = {}
+    for col, buf in buffers.items():
+        if buf[0] == "values":
+            cols[col] = pd.Series(buf[1], dtype=buf[2])
+        else:
+            _, codes, uniques, dtype = buf
+            values = np.append(uniques, np.nan)[codes]  # code -1 -> NaN
+            cols[col] = pd.Series(values, dtype=dtype)
+    return pd.DataFrame(cols)
+
+
+def _summarize_partition(summary_name: str, buffers: dict) -> pd.DataFrame:
+    return SUMMARIES[summary_name](_from_buffers(buffers))
+
+
+def summarize_by_country(df: pd.DataFrame, summary_name: str, workers: int = 1) -> pd.DataFrame:
+    """Run a summary per country partition on ``workers`` processes.
+
+    The group keys include country, so partitions are independent. Results
+    are merged in country order and sorted like the single-process output,
+    which they match exactly.
+    """
+    summary = SUMMARIES[summary_name]
+    if workers <= 1 or df["country"].nunique() <= 1:
+        return summary(df)
+
+    cols = [c for c in SUMMARY_COLUMNS[summary_name] if c in df.columns]
+    parts = {country: part for country, part in df[cols].groupby("country", sort=True, observed=True)}
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Largest partitions first so the long tasks start early
+        futures = {
+            country: pool.submit(_summarize_partition, summary_name, _to_buffers(parts[country]))
+            for country in sorted(parts, key=lambda c: -len(parts[c]))
+        }
+        for country, future in futures.items():
+            results[country] = future.result()
+    merged = pd.concat([results[c] for c in sorted(results)], ignore_index=True)
+    return merged.sort_values(["country", "player_name"]).reset_index(drop=True)
+
+
+# ---------------------------------------------------------------------------
+# 3c. Out-of-core engine: DuckDB SQL straight over the CSVs
+# ---------------------------------------------------------------------------
+# With --engine duckdb the raw CSVs are never loaded into pandas: the combined
+# files are streamed by COPY and the summaries are GROUP BY queries that
+# produce the same per-player aggregates _batting_table / _pitching_table
+# consume. DuckDB spills to a temporary directory above the memory limit.
+#
+# Counts match the pandas engine exactly. Means are summed in a different
+# order, so a value sitting exactly on a rounding boundary can differ in the
+# last digit; player_name is the group's min() rather than its first row,
+# and primary_pitch ties go to the alphabetically first pitch type. The
+# combined files list their columns in the pandas engine's order
+# (duckdb_columns).
+DUCKDB_MEMORY_LIMIT = "2GB"
+
+
+def _sql_str(value) -> str:
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _sql_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def duckdb_connect(memory_limit: str = DUCKDB_MEMORY_LIMIT, temp_dir: pathlib.Path | None = None):
+    """In-memory DuckDB connection capped at ``memory_limit``."""
+    import duckdb
+
+    con = duckdb.connect()
+    con.execute(f"SET memory_limit = {_sql_str(memory_limit)}")
+    if temp_dir is not None:
+        con.execute(f"SET temp_directory = {_sql_str(temp_dir)}")
+    return con
+
+
+def duckdb_columns(con, inputs: list[tuple[pathlib.Path, str, str]]) -> list[str]:
+    """Combined column order of the pandas engine (unify_tables' first-seen order).
+
+    The first file's columns, then country / country_name, then columns that
+    only later files have, in file order.
+    """
+    order = []
+    for path, _, _ in inputs:
+        names = [row[0] for row in
+                 con.execute(f"DESCRIBE SELECT * FROM read_csv({_sql_str(path)})").fetchall()]
+        order += [c for c in [*names, "country", "country_name"] if c not in order]
+    return order
+
+
+def duckdb_source(inputs: list[tuple[pathlib.Path, str, str]], spray: bool = False,
+                  columns: list[str] | None = None) -> str:
+    """SELECT over the input CSVs with country / country_name taken from the file name.
+
+    ``columns`` fixes the output order (spray columns still come last).
+    """
+    paths = ", ".join(_sql_str(path) for path, _, _ in inputs)
+    iso = " ".join(f"WHEN {_sql_str(path)} THEN {_sql_str(code)}" for path, code, _ in inputs)
+    name = " ".join(f"WHEN {_sql_str(path)} THEN {_sql_str(cname)}" for path, _, cname in inputs)
+    query = (f"SELECT * EXCLUDE (filename), CASE filename {iso} END AS country, "
+             f"CASE filename {name} END AS country_name "
+             f"FROM read_csv([{paths}], union_by_name = true, filename = true)")
+    if columns is not None:
+        query = f"SELECT {', '.join(_sql_ident(c) for c in columns)} FROM ({query})"
+    if spray:
+        query = f"SELECT *, {spray_sql()} FROM ({query})"
+    return query
+
+
+def duckdb_combine(con, inputs: list[tuple[pathlib.Path, str, str]], out_path: pathlib.Path,
+                   spray: bool = False) -> int:
+    """Stream the combined CSV to out_path; returns the row count."""
+    source = duckdb_source(inputs, spray, duckdb_columns(con, inputs))
+    return con.execute(f"COPY ({source}) TO {_sql_str(out_path)} (HEADER)").fetchone()[0]
+
+
+def duckdb_clustered(con, inputs: list[tuple[pathlib.Path, str, str]], path: pathlib.Path,
+                     player_col: str, spray: bool = False) -> None:
+    """write_clustered_parquet's layout, streamed from DuckDB one country at a time."""
+    source = duckdb_source(inputs, spray, duckdb_columns(con, inputs))
+    query = f"{source} ORDER BY country, {player_col}"
+    reader = con.execute(query).fetch_record_batch()
+    with pq.ParquetWriter(path, reader.schema, compression=CLUSTER_COMPRESSION) as writer:
+        current, pending = None, []
+
+        def flush():
+            if pending:
+                table = pa.Table.from_batches(pending, schema=reader.schema)
+                writer.write_table(table, row_group_size=max(table.num_rows, 1))
+                pending.clear()
+
+        for batch in reader:
+            codes = batch.column("country").to_numpy(zero_copy_only=False)
+            stops = [*(np.flatnonzero(codes[1:] != codes[:-1]) + 1), len(codes)]
+            start = 0
+            for stop in stops:
+                if stop == start:
+                    continue
+                if codes[start] != current:
+                    flush()
+                    current = codes[start]
+                pending.append(batch.slice(start, stop - start))
+                start = stop
+        flush()
+
+
+def _duckdb_aggregates(con, inputs: list[tuple[pathlib.Path, str, str]], player_col: str,
+                       means: list[str], pitching: bool = False) -> pd.DataFrame:
+    """Per-(player, country) aggregate frame in the shape _event_counts builds."""
+    source = duckdb_source(inputs)
+    columns = {row[0] for row in con.execute(f"DESCRIBE {source}").fetchall()}
+    select = [f"CAST({player_col} AS BIGINT) AS {player_col}", "country",
+              "min(player_name) AS player_name"]
+    for name, members in EVENT_INDICATORS.items():
+        events = ", ".join(_sql_str(e) for e in sorted(members))
+        select.append(f'count(*) FILTER (WHERE events IN ({events})) AS "{name}"')
+    for col in means:
+        select.append(f"avg({col}) AS {col}" if col in columns else f"NULL::DOUBLE AS {col}")
+    if pitching:
+        select.append("count(*) AS total_pitches")
+    query = (f"WITH src AS ({source}) "
+             f"SELECT {', '.join(select)} FROM src WHERE {player_col} IS NOT NULL "
+             f"GROUP BY {player_col}, country")
+    if pitching:
+        query = (f"WITH src AS ({source}), "
+                 f"agg AS (SELECT {', '.join(select)} FROM src WHERE pitcher IS NOT NULL "
+                 f"GROUP BY pitcher, country), "
+                 f"mix AS (SELECT CAST(pitcher AS BIGINT) AS pitcher, country, pitch_type, count(*) AS n "
+                 f"FROM src WHERE pitcher IS NOT NULL AND pitch_type IS NOT NULL "
+                 f"GROUP BY ALL), "
+                 f"top AS (SELECT pitcher, country, count(*) AS pitch_type_count, "
+                 f"first(pitch_type ORDER BY n DESC, pitch_type) AS primary_pitch "
+                 f"FROM mix GROUP BY pitcher, country) "
+                 f"SELECT agg.*, coalesce(top.pitch_type_count, 0) AS pitch_type_count, "
+                 f"coalesce(top.primary_pitch, '') AS primary_pitch "
+                 f"FROM agg LEFT JOIN top USING (pitcher, country)")
+    g = con.execute(query).df()
+    return g.set_index([player_col, "country"]).sort_index()
+
+
+def duckdb_summary(con, inputs: list[tuple[pathlib.Path, str, str]], summary_name: str) -> pd.DataFrame:
+    """batting_summary / pitching_summary computed by DuckDB over the raw CSVs."""
+    if summary_name == "batting_summary":
+        return _batting_table(_duckdb_aggregates(con, inputs, "batter", BATTING_MEANS))
+    return _pitching_table(_duckdb_aggregates(con, inputs, "pitcher", PITCHING_MEANS, pitching=True))
 
 
 # ---------------------------------------------------------------------------
@@ -346,11 +891,21 @@ def main():
                         help="Path to wbc-scouting repo root (must contain data/ subdirectory)")
     parser.add_argument("--out-dir", default=".",
                         help="Output directory for generated CSVs (default: current directory)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Processes for the per-country summary stats (default: 1)")
+    parser.add_argument("--cache-dir", default=None,
+                        help="Parse cache for the Statcast CSVs; unchanged files are not re-parsed")
+    parser.add_argument("--engine", choices=["pandas", "duckdb"], default="pandas",
+                        help="pandas loads the CSVs in memory; duckdb streams them out of core "
+                             "(default: pandas)")
+    parser.add_argument("--memory-limit", default=DUCKDB_MEMORY_LIMIT,
+                        help=f"DuckDB memory limit before spilling to disk (default: {DUCKDB_MEMORY_LIMIT})")
     args = parser.parse_args()
 
     data_dir = pathlib.Path(args.wbc_dir) / "data"
     out_dir  = pathlib.Path(args.out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
+    cache_dir = pathlib.Path(args.cache_dir) if args.cache_dir else None
 
     print("=== WBC 2026 Kaggle Dataset Generator ===\n")
 
@@ -359,29 +914,68 @@ def main():
     roster.to_csv(out_dir / "rosters.csv", index=False)
     print(f"  -> rosters.csv: {len(roster)} players, {roster['country'].nunique()} countries\n")
 
+    con = None
+    if args.engine == "duckdb":
+        spill_dir = tempfile.TemporaryDirectory(prefix="wbc-duckdb-")
+        con = duckdb_connect(args.memory_limit, pathlib.Path(spill_dir.name))
+    batter_inputs = statcast_inputs(data_dir, "_statcast.csv", exclude_pattern="_pitchers_")
+    pitcher_inputs = statcast_inputs(data_dir, "_pitchers_statcast.csv")
+
     print("[2/6] Combining batter Statcast CSVs...")
-    batter_raw = combine_statcast(data_dir, "_statcast.csv", exclude_pattern="_pitchers_")
-    if not batter_raw.empty:
-        batter_raw.to_csv(out_dir / "statcast_batters.csv", index=False)
-        print(f"  -> statcast_batters.csv: {len(batter_raw):,} rows\n")
+    if con is not None:
+        if batter_inputs:
+            n = duckdb_combine(con, batter_inputs, out_dir / "statcast_batters.csv", spray=True)
+            print(f"  -> statcast_batters.csv: {n:,} rows")
+            duckdb_clustered(con, batter_inputs, out_dir / "statcast_batters.parquet", "batter",
+                             spray=True)
+    else:
+        batter_raw = combine_statcast(data_dir, "_statcast.csv", exclude_pattern="_pitchers_",
+                                      cache_dir=cache_dir)
+        if not batter_raw.empty:
+            batter_raw = add_spray_columns(batter_raw)
+            batter_raw.to_csv(out_dir / "statcast_batters.csv", index=False)
+            print(f"  -> statcast_batters.csv: {len(batter_raw):,} rows")
+            write_clustered_parquet(batter_raw, out_dir / "statcast_batters.parquet", "batter")
+    if batter_inputs:
+        index_path = write_cluster_index(out_dir / "statcast_batters.parquet", "batter")
+        print(f"  -> statcast_batters.parquet + {index_path.name}\n")
 
     print("[3/6] Combining pitcher Statcast CSVs...")
-    pitcher_raw = combine_statcast(data_dir, "_pitchers_statcast.csv")
-    if not pitcher_raw.empty:
-        pitcher_raw.to_csv(out_dir / "statcast_pitchers.csv", index=False)
-        print(f"  -> statcast_pitchers.csv: {len(pitcher_raw):,} rows\n")
+    if con is not None:
+        if pitcher_inputs:
+            n = duckdb_combine(con, pitcher_inputs, out_dir / "statcast_pitchers.csv")
+            print(f"  -> statcast_pitchers.csv: {n:,} rows")
+            duckdb_clustered(con, pitcher_inputs, out_dir / "statcast_pitchers.parquet", "pitcher")
+    else:
+        pitcher_raw = combine_statcast(data_dir, "_pitchers_statcast.csv", cache_dir=cache_dir)
+        if not pitcher_raw.empty:
+            pitcher_raw.to_csv(out_dir / "statcast_pitchers.csv", index=False)
+            print(f"  -> statcast_pitchers.csv: {len(pitcher_raw):,} rows")
+            write_clustered_parquet(pitcher_raw, out_dir / "statcast_pitchers.parquet", "pitcher")
+    if pitcher_inputs:
+        index_path = write_cluster_index(out_dir / "statcast_pitchers.parquet", "pitcher")
+        print(f"  -> statcast_pitchers.parquet + {index_path.name}\n")
 
     print("[4/6] Computing batter summary stats...")
-    if not batter_raw.empty:
-        bat_summary = batting_summary(batter_raw)
+    if batter_inputs:
+        if con is not None:
+            bat_summary = duckdb_summary(con, batter_inputs, "batting_summary")
+        else:
+            bat_summary = summarize_by_country(batter_raw, "batting_summary", args.workers)
         bat_summary.to_csv(out_dir / "batter_summary.csv", index=False)
         print(f"  -> batter_summary.csv: {len(bat_summary)} players\n")
 
     print("[5/6] Computing pitcher summary stats...")
-    if not pitcher_raw.empty:
-        pit_summary = pitching_summary(pitcher_raw)
+    if pitcher_inputs:
+        if con is not None:
+            pit_summary = duckdb_summary(con, pitcher_inputs, "pitching_summary")
+        else:
+            pit_summary = summarize_by_country(pitcher_raw, "pitching_summary", args.workers)
         pit_summary.to_csv(out_dir / "pitcher_summary.csv", index=False)
         print(f"  -> pitcher_summary.csv: {len(pit_summary)} players\n")
+    if con is not None:
+        con.close()
+        spill_dir.cleanup()
 
     print("[6/6] Copying stadium data...")
     stadiums_src = data_dir / "mlbstadiums_wbc.csv"
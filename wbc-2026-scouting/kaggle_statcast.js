@@ -6,6 +6,11 @@
     const columns = {
   "country":      "ISO country code added for this dataset (e.g. USA, JPN, DOM)",
   "country_name": "Full country name added for this dataset (e.g. Japan, Dominican Republic)",
+  "spray_x":         "statcast_batters only: batted ball x in feet from home plate (2.5 * (hc_x - 125.42); negative=left field)",
+  "spray_y":         "statcast_batters only: batted ball y in feet from home plate toward center field (2.5 * (198.27 - hc_y))",
+  "spray_angle":     "statcast_batters only: spray angle in degrees from the center field line (negative=left field, positive=right field)",
+  "spray_distance":  "statcast_batters only: distance in feet from home plate to the hc_x/hc_y landing point",
+  "spray_direction": "statcast_batters only: pull / center / oppo relative to the batter's stand (more than 15 degrees to the pull or opposite side)",
   "pitch_type": "Pitch type abbreviation (FF=Four-Seam Fastball, SL=Slider, CH=Changeup, CU=Curveball, etc.) - Classified by Statcast's pitch tracking system",
   "game_date": "Date of the game (YYYY-MM-DD format)",
   "release_speed": "Pitch velocity at release point in miles per hour (mph)",
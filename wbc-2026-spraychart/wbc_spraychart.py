@@ -3,12 +3,20 @@
 # %% Cell 1
 !pip install baseball-field-viz -q
 
+import json
+import multiprocessing as mp
 import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 import matplotlib.cm as cm
 import matplotlib.pyplot as plt
-import seaborn as sns
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 %matplotlib inline
 
 from baseball_field_viz import transform_coords, draw_field, spraychart, draw_strike_zone, pitch_zone_chart
@@ -29,7 +37,59 @@ def _find_data_dir():
 DATA_DIR = _find_data_dir()
 print(f"Data directory: {DATA_DIR}")
 
-df = pd.read_csv(f"{DATA_DIR}/statcast_batters.csv")
+# statcast_*.parquet are sorted by country and player; the _index.json sidecar
+# holds each country's row range and row groups, so a country is a slice
+# (or a partial read) instead of a filter over every row.
+def _load_index(name):
+    path = f"{DATA_DIR}/{name}_index.json"
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+def _country_entry(index, country_name):
+    for entry in index['countries'].values():
+        if entry['country_name'] == country_name:
+            return entry
+    return None
+
+def load_statcast(name):
+    """Full table plus its index; falls back to the CSV (index None) on older versions."""
+    index = _load_index(name)
+    if index is None:
+        return pd.read_csv(f"{DATA_DIR}/{name}.csv"), None
+    return pd.read_parquet(f"{DATA_DIR}/{name}.parquet"), index
+
+def country_rows(frame, index, country_name):
+    """One country's rows of a load_statcast frame."""
+    if index is None:
+        return frame[frame['country_name'] == country_name]
+    entry = _country_entry(index, country_name)
+    if entry is None:
+        return frame.iloc[:0]
+    start, stop = entry['rows']
+    return frame.iloc[start:stop]
+
+def read_country(name, country_name):
+    """Read only one country's row groups instead of the whole file."""
+    index = _load_index(name)
+    if index is None:
+        frame = pd.read_csv(f"{DATA_DIR}/{name}.csv")
+        return frame[frame['country_name'] == country_name]
+    entry = _country_entry(index, country_name)
+    pf = pq.ParquetFile(f"{DATA_DIR}/{name}.parquet")
+    if entry is None:
+        return pf.schema_arrow.empty_table().to_pandas()
+    first, stop = entry['row_groups']
+    offset = sum(pf.metadata.row_group(i).num_rows for i in range(first))
+    start, end = entry['rows']
+    part = pf.read_row_groups(range(first, stop)).to_pandas()
+    return part.iloc[start - offset:end - offset].reset_index(drop=True)
+
+df, df_index = load_statcast("statcast_batters")
+# spray_x / spray_y (feet) are precomputed in the dataset; older versions need the transform
+if 'spray_x' not in df.columns:
+    df = transform_coords(df).rename(columns={'x': 'spray_x', 'y': 'spray_y'})
 rosters = pd.read_csv(f"{DATA_DIR}/rosters.csv")
 
 print(f"Statcast records : {len(df):,}")
@@ -52,7 +112,6 @@ print(hits_by_country.to_string())
 hits = df[
     df['hc_x'].notna() & df['events'].isin(hit_events)
 ].copy()
-hits = transform_coords(hits)
 
 country_list = sorted(hits['country_name'].unique())
 colors = cm.tab20(np.linspace(0, 1, len(country_list)))
@@ -64,7 +123,7 @@ draw_field(ax)
 for country in country_list:
     subset = hits[hits['country_name'] == country]
     ax.scatter(
-        subset['x'], subset['y'],
+        subset['spray_x'], subset['spray_y'],
         c=[color_map[country]], alpha=0.35, s=12,
         label=f"{country} ({len(subset)})"
     )
@@ -79,58 +138,127 @@ plt.tight_layout()
 plt.show()
 
 # %% Cell 4
+# Density engine: points are binned onto a fixed 5 ft field grid and smoothed
+# with a Gaussian kernel by FFT convolution, for every group in one batched
+# call. That is O(n + groups * grid log grid) instead of kdeplot's O(n * grid)
+# per panel; the result is plain arrays any plot can draw.
+DENSITY_BIN = 5.0
+DENSITY_X_EDGES = np.arange(-350, 350 + DENSITY_BIN, DENSITY_BIN)
+DENSITY_Y_EDGES = np.arange(0, 400 + DENSITY_BIN, DENSITY_BIN)
+
+def batch_density(frame, by, x='spray_x', y='spray_y', bw=None, bw_adjust=0.7):
+    """Kernel density of (x, y) for every `by` group at once.
+
+    bw is the kernel sd in feet; None uses Scott's rule per group and axis
+    (as kdeplot does, without the x-y correlation) times bw_adjust.
+    Returns {'groups', 'n', 'x', 'y', 'density'}: density has shape
+    (groups, len(y), len(x)) in points per sq ft / n, on bin centers x, y.
+    """
+    pts = frame.loc[frame[x].notna() & frame[y].notna(), [by, x, y]]
+    codes, groups = pd.factorize(pts[by].astype(object), sort=True)
+    n_groups, nx, ny = len(groups), len(DENSITY_X_EDGES) - 1, len(DENSITY_Y_EDGES) - 1
+    xs, ys = pts[x].to_numpy('float64'), pts[y].to_numpy('float64')
+
+    ix = np.floor((xs - DENSITY_X_EDGES[0]) / DENSITY_BIN).astype(int)
+    iy = np.floor((ys - DENSITY_Y_EDGES[0]) / DENSITY_BIN).astype(int)
+    inside = (codes >= 0) & (ix >= 0) & (ix < nx) & (iy >= 0) & (iy < ny)
+    flat = (codes[inside] * ny + iy[inside]) * nx + ix[inside]
+    counts = np.bincount(flat, minlength=n_groups * ny * nx).reshape(n_groups, ny, nx)
+    n = np.bincount(codes[codes >= 0], minlength=n_groups)
+
+    if bw is None:
+        sd = pts[[x, y]].groupby(codes).std().reindex(range(n_groups)).to_numpy()
+        sd = np.where(np.isfinite(sd) & (sd > 0), sd, DENSITY_BIN)
+        sd = sd * (np.maximum(n, 2) ** (-1 / 6) * bw_adjust)[:, None]
+    else:
+        sd = np.full((n_groups, 2), float(bw))
+    sd = sd / DENSITY_BIN  # in bins
+
+    # Zero padding of 4 sd keeps the circular convolution from wrapping around
+    pad = int(np.ceil(4 * sd.max())) if n_groups else 0
+    shape = (ny + pad, nx + pad)
+    fy = np.fft.fftfreq(shape[0])[None, :, None]
+    fx = np.fft.rfftfreq(shape[1])[None, None, :]
+    kernel = np.exp(-2 * np.pi**2 * (sd[:, 1, None, None]**2 * fy**2 + sd[:, 0, None, None]**2 * fx**2))
+    smooth = np.fft.irfft2(np.fft.rfft2(counts, s=shape) * kernel, s=shape)[:, :ny, :nx]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        density = np.clip(smooth, 0, None) / (np.maximum(n, 1)[:, None, None] * DENSITY_BIN**2)
+    return {
+        'groups': list(groups), 'n': n,
+        'x': (DENSITY_X_EDGES[:-1] + DENSITY_X_EDGES[1:]) / 2,
+        'y': (DENSITY_Y_EDGES[:-1] + DENSITY_Y_EDGES[1:]) / 2,
+        'density': density,
+    }
+
+def draw_density(ax, dens, group, cmap, levels=8, thresh=0.1, alpha=0.6):
+    """Filled iso-proportion contours of one group, like kdeplot(fill=True, levels, thresh)."""
+    d = dens['density'][dens['groups'].index(group)]
+    values = np.sort(d.ravel())[::-1]
+    if not values[0] > 0:
+        return
+    mass = np.cumsum(values) / values.sum()
+    iso = np.linspace(thresh, 1, levels)
+    cuts = values[np.clip(np.searchsorted(mass, 1 - iso), 0, len(values) - 1)]
+    cuts = np.unique(np.append(cuts[cuts > 0], values[0]))
+    ax.contourf(dens['x'], dens['y'], d, levels=cuts, cmap=cmap, alpha=alpha)
+
+t0 = time.perf_counter()
+country_density = batch_density(df, 'country_name')
+print(f"Densities for {len(country_density['groups'])} countries: {time.perf_counter() - t0:.3f}s")
+
 top_countries = ['USA', 'Dominican Republic', 'Venezuela', 'Japan']
+top_countries = [c for c in top_countries if c in country_density['groups']]
 
 fig, axs = plt.subplots(2, 2, figsize=(16, 14))
 
 for ax, country in zip(axs.flat, top_countries):
-    df_c = df[df['country_name'] == country]
-    df_ct = transform_coords(df_c[df_c['hc_x'].notna()])
-
+    n = country_density['n'][country_density['groups'].index(country)]
     draw_field(ax)
-    sns.kdeplot(
-        data=df_ct, x='x', y='y', ax=ax,
-        fill=True, alpha=0.6, cmap='Reds', levels=8,
-        clip=((-350, 350), (0, 400)),
-        bw_adjust=0.7,
-        thresh=0.1,
-    )
+    draw_density(ax, country_density, country, 'Reds')
     ax.set_xlim(-350, 350)
     ax.set_ylim(-50, 400)
-    ax.set_title(f"{country}  (n={len(df_ct):,})", fontsize=13)
+    ax.set_title(f"{country}  (n={n:,})", fontsize=13)
 
 plt.suptitle("WBC 2026 — Batted Ball Density by Country", fontsize=16, y=1.01)
 plt.tight_layout()
 plt.show()
 
-# %% Cell 5
-df_jpn = df[df['country_name'] == 'Japan']
-df_jpn_t = transform_coords(df_jpn[df_jpn['hc_x'].notna()])
+# All countries from the same batch
+t0 = time.perf_counter()
+n_panels = len(country_density['groups'])
+ncols = 5
+nrows = (n_panels + ncols - 1) // ncols
+fig, axs = plt.subplots(nrows, ncols, figsize=(ncols * 4, nrows * 3.6), squeeze=False)
+for ax, country in zip(axs.flat, country_density['groups']):
+    draw_density(ax, country_density, country, 'Reds')
+    ax.set_xlim(-350, 350)
+    ax.set_ylim(-50, 400)
+    ax.set_xticks([]); ax.set_yticks([])
+    ax.set_title(country, fontsize=10)
+for ax in list(axs.flat)[n_panels:]:
+    ax.set_visible(False)
+plt.suptitle("WBC 2026 — Batted Ball Density, All Countries", fontsize=14)
+plt.tight_layout()
+print(f"{n_panels} density panels: {time.perf_counter() - t0:.3f}s")
+plt.show()
 
-hits_jpn = df_jpn_t[df_jpn_t['events'].isin(hit_events)]
-outs_jpn = df_jpn_t[~df_jpn_t['events'].isin(hit_events)]
+# %% Cell 5
+df_jpn = country_rows(df, df_index, 'Japan')
+df_jpn_t = df_jpn[df_jpn['hc_x'].notna()].copy()
+df_jpn_t['outcome'] = np.where(df_jpn_t['events'].isin(hit_events), 'hit', 'out')
+jpn_density = batch_density(df_jpn_t, 'outcome')
 
 fig, axs = plt.subplots(1, 2, figsize=(16, 8))
 
-draw_field(axs[0])
-sns.kdeplot(
-    data=hits_jpn, x='x', y='y', ax=axs[0],
-    cmap='Reds', fill=True, alpha=0.6, levels=8,
-    clip=((-350, 350), (0, 400)), bw_adjust=0.7, thresh=0.1,
-)
-axs[0].set_xlim(-350, 350)
-axs[0].set_ylim(-50, 400)
-axs[0].set_title(f"Japan — Hits Heatmap  (n={len(hits_jpn)})", fontsize=13)
-
-draw_field(axs[1])
-sns.kdeplot(
-    data=outs_jpn, x='x', y='y', ax=axs[1],
-    cmap='Blues', fill=True, alpha=0.6, levels=8,
-    clip=((-350, 350), (0, 400)), bw_adjust=0.7, thresh=0.1,
-)
-axs[1].set_xlim(-350, 350)
-axs[1].set_ylim(-50, 400)
-axs[1].set_title(f"Japan — Outs Heatmap  (n={len(outs_jpn)})", fontsize=13)
+for ax, outcome, cmap, label in [(axs[0], 'hit', 'Reds', 'Hits'), (axs[1], 'out', 'Blues', 'Outs')]:
+    draw_field(ax)
+    n = 0
+    if outcome in jpn_density['groups']:
+        n = jpn_density['n'][jpn_density['groups'].index(outcome)]
+        draw_density(ax, jpn_density, outcome, cmap)
+    ax.set_xlim(-350, 350)
+    ax.set_ylim(-50, 400)
+    ax.set_title(f"Japan — {label} Heatmap  (n={n})", fontsize=13)
 
 plt.suptitle("Japan — Batted Ball Distribution", fontsize=15)
 plt.tight_layout()
@@ -149,7 +277,8 @@ top5_hr_countries = hr_counts.index.tolist()
 fig, axs = plt.subplots(1, 5, figsize=(28, 7))
 
 for ax, country in zip(axs, top5_hr_countries):
-    df_c = df[(df['country_name'] == country) & (df['events'] == 'home_run')]
+    df_c = country_rows(df, df_index, country)
+    df_c = df_c[df_c['events'] == 'home_run']
     n = len(df_c[df_c['hc_x'].notna()])
     spraychart(ax, df_c, color_by='events', title=f"{country}\n({n} HR)")
     # remove legend for compact display
@@ -175,8 +304,7 @@ plt.tight_layout()
 plt.show()
 
 # --- pitch_zone_chart: one subplot per pitch type ---
-df_p = pd.read_csv(f"{DATA_DIR}/statcast_pitchers.csv")
-jpn_p = df_p[df_p['country_name'] == 'Japan']
+jpn_p = read_country("statcast_pitchers", 'Japan')
 
 if 'plate_x' in jpn_p.columns and 'plate_z' in jpn_p.columns:
     top_pitcher = jpn_p['player_name'].value_counts().index[0]
@@ -205,3 +333,93 @@ if 'plate_x' in jpn_p.columns and 'plate_z' in jpn_p.columns:
 else:
     print("Note: plate_x/plate_z not in this dataset.")
     print("Use pybaseball.statcast_pitcher() for full pitch location data.")
+
+# %% Cell 8
+# Batch render mode: a job spec of chart panels, each
+#   {'kind': 'density' | 'hr' | 'spray' | 'pitch_zone',
+#    'country': ..., 'player': ..., 'pitch_type': ...}   (player / pitch_type optional)
+# is fanned out to a process pool and written as one PNG or SVG per job.
+# Workers are forked, so they share df / df_p without pickling, and draw on
+# Agg canvases through the Figure API, independent of the notebook backend.
+RENDER_DIR = "scouting_report"
+
+df_p, df_p_index = load_statcast("statcast_pitchers")
+
+def _slug(*parts):
+    return "_".join(re.sub(r"[^A-Za-z0-9]+", "-", str(p)).strip("-") for p in parts if p)
+
+def _job_rows(job):
+    if job['kind'] == 'pitch_zone':
+        rows = country_rows(df_p, df_p_index, job['country'])
+    else:
+        rows = country_rows(df, df_index, job['country'])
+    if job.get('player'):
+        rows = rows[rows['player_name'] == job['player']]
+    if job.get('pitch_type'):
+        rows = rows[rows['pitch_type'] == job['pitch_type']]
+    if job['kind'] == 'hr':
+        rows = rows[rows['events'] == 'home_run']
+    return rows
+
+def render_job(job, out_dir=RENDER_DIR, fmt='png', dpi=100):
+    """Draw one job of the spec to <out_dir>/<kind>/<country>_<player>_<pitch_type>.<fmt>."""
+    kind = job['kind']
+    rows = _job_rows(job)
+    label = " — ".join(p for p in (job['country'], job.get('player'), job.get('pitch_type')) if p)
+
+    fig = Figure(figsize=(6, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    if kind == 'pitch_zone':
+        pitch_zone_chart(ax, rows, title=f"{label}  (n={len(rows):,})")
+    elif rows['hc_x'].notna().any():
+        if kind == 'density':
+            draw_field(ax)
+            dens = batch_density(rows.assign(panel=label), 'panel')
+            draw_density(ax, dens, label, 'Reds')
+            ax.set_xlim(-350, 350)
+            ax.set_ylim(-50, 400)
+            ax.set_title(f"{label}  (n={dens['n'][0]:,})")
+        else:
+            spraychart(ax, rows, color_by='events', title=label)
+    else:
+        draw_field(ax)
+        ax.set_title(f"{label}  (no batted balls)")
+
+    path = os.path.join(out_dir, kind, f"{_slug(job['country'], job.get('player'), job.get('pitch_type'))}.{fmt}")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fig.savefig(path, dpi=dpi, bbox_inches='tight')
+    return path
+
+def scouting_report_jobs(min_batted=30, min_pitches=100):
+    """Country density + HR charts, per-batter spray charts and per-pitcher pitch-type zones."""
+    jobs = []
+    for country in sorted(df['country_name'].dropna().unique()):
+        jobs.append({'kind': 'density', 'country': country})
+        jobs.append({'kind': 'hr', 'country': country})
+        rows = country_rows(df, df_index, country)
+        batted = rows.loc[rows['hc_x'].notna(), 'player_name'].value_counts()
+        jobs += [{'kind': 'spray', 'country': country, 'player': player}
+                 for player, n in batted.items() if n >= min_batted]
+    if 'plate_x' in df_p.columns and 'plate_z' in df_p.columns:
+        mix = df_p.groupby(['country_name', 'player_name', 'pitch_type'], observed=True).size()
+        jobs += [{'kind': 'pitch_zone', 'country': c, 'player': p, 'pitch_type': pt}
+                 for (c, p, pt), n in mix.items() if n >= min_pitches]
+    return jobs
+
+def render_batch(jobs, out_dir=RENDER_DIR, fmt='png', workers=None):
+    """Render every job on a forked process pool; returns the written paths in job order."""
+    render = partial(render_job, out_dir=out_dir, fmt=fmt)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return [render(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context('fork')) as pool:
+        return list(pool.map(render, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+
+report_jobs = scouting_report_jobs()
+print(pd.Series([job['kind'] for job in report_jobs]).value_counts().to_string())
+
+t0 = time.perf_counter()
+paths = render_batch(report_jobs)
+print(f"Rendered {len(paths)} charts in {time.perf_counter() - t0:.1f}s "
+      f"on {os.cpu_count()} cores -> {RENDER_DIR}/")